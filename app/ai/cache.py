@@ -0,0 +1,261 @@
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Optional
+
+from app.ai.providers import Provider
+from app.core.config import (
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_MAX_ENTRIES,
+    LLM_CACHE_TTL,
+    LLM_CACHE_DB_PATH,
+)
+from app.core.metrics import registry, Gauge
+
+
+def prompt_version(*templates: str) -> str:
+    """
+    Fingerprint of the prompt templates a task uses.
+    Editing a template changes the version and so every cache key.
+    """
+    digest = hashlib.sha256()
+    for template in templates:
+        digest.update(template.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()[:12]
+
+
+def _normalize(value):
+    if isinstance(value, str):
+        return re.sub(r"\s+", " ", value).strip()
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items()}
+    return value
+
+
+class LLMCache:
+    """
+    Two-tier cache for parsed model results.
+
+    - In-process LRU bounded by `max_entries`, entries expire after `ttl` seconds
+    - Optional SQLite table at `db_path` that survives restarts
+
+    Values are stored as JSON so callers always get their own copy.
+    """
+
+    def __init__(self, max_entries: int, ttl: float, db_path: str = "", enabled: bool = True):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.enabled = enabled
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._versions = {}
+
+        self.hits = defaultdict(int)
+        self.misses = defaultdict(int)
+
+        self.db_path = db_path if enabled else ""
+        self._db = None
+
+    # ---------------- PERSISTENT TIER ----------------
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        # SQLite tier, opened on first use; callers hold self._lock
+        if self._db is None and self.db_path:
+            self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    task TEXT NOT NULL,
+                    prompt_version TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            self._db.commit()
+
+        return self._db
+
+    def open(self):
+        """
+        Open the persistent tier now rather than on the first lookup.
+        """
+        with self._lock:
+            self._connection()
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # ---------------- KEYS ----------------
+
+    def make_key(self, task: str, version: str, provider: Provider, **fields) -> str:
+        """
+        Content address for a model request: hash of the normalized
+        inputs plus the task, prompt version and the backend and model
+        that answer it, so one backend's output is never served as
+        another's.
+        """
+        self._register_version(task, version)
+
+        for name in ("role", "experience_level", "feedback_mode"):
+            if isinstance(fields.get(name), str):
+                fields[name] = fields[name].lower()
+
+        payload = json.dumps(
+            {
+                "task": task,
+                "backend": provider.name,
+                "model": provider.model,
+                "prompt_version": version,
+                "fields": _normalize(fields),
+            },
+            sort_keys=True,
+        )
+        return f"{task}:{version}:" + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _register_version(self, task: str, version: str):
+        # First time a task is seen with a new version, drop its stale rows
+        if self._versions.get(task) == version:
+            return
+
+        with self._lock:
+            if self._versions.get(task) == version:
+                return
+            self._versions[task] = version
+
+            for key in [k for k in self._entries if k.startswith(f"{task}:") and not k.startswith(f"{task}:{version}:")]:
+                del self._entries[key]
+
+            db = self._connection()
+            if db is not None:
+                db.execute(
+                    "DELETE FROM llm_cache WHERE task = ? AND prompt_version != ?",
+                    (task, version),
+                )
+                db.commit()
+
+    # ---------------- ACCESS ----------------
+
+    def get(self, key: str) -> Optional[dict]:
+        if not self.enabled:
+            return None
+
+        task = key.split(":", 1)[0]
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                created_at, value = entry
+                if now - created_at <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits[task] += 1
+                    return json.loads(value)
+                del self._entries[key]
+
+            db = self._connection()
+            if db is not None:
+                row = db.execute(
+                    "SELECT value, created_at FROM llm_cache WHERE key = ?",
+                    (key,),
+                ).fetchone()
+
+                if row is not None:
+                    value, created_at = row
+                    if now - created_at <= self.ttl:
+                        self._store(key, value, created_at)
+                        self.hits[task] += 1
+                        return json.loads(value)
+
+                    db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    db.commit()
+
+            self.misses[task] += 1
+            return None
+
+    def set(self, key: str, value: dict):
+        if not self.enabled:
+            return
+
+        task, version = key.split(":", 2)[:2]
+        serialized = json.dumps(value)
+        now = time.time()
+
+        with self._lock:
+            self._store(key, serialized, now)
+
+            db = self._connection()
+            if db is not None:
+                db.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, task, prompt_version, value, created_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, task, version, serialized, now),
+                )
+                db.commit()
+
+    def _store(self, key: str, serialized: str, created_at: float):
+        self._entries[key] = (created_at, serialized)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            db = self._connection()
+            if db is not None:
+                db.execute("DELETE FROM llm_cache")
+                db.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            tasks = set(self.hits) | set(self.misses)
+            return {
+                "entries": len(self._entries),
+                "persistent": bool(self.db_path),
+                "tasks": {
+                    task: {"hits": self.hits[task], "misses": self.misses[task]}
+                    for task in sorted(tasks)
+                },
+            }
+
+
+llm_cache = LLMCache(
+    max_entries=LLM_CACHE_MAX_ENTRIES,
+    ttl=LLM_CACHE_TTL,
+    db_path=LLM_CACHE_DB_PATH,
+    enabled=LLM_CACHE_ENABLED,
+)
+
+
+def _lookups() -> dict:
+    values = {}
+    for task, counts in llm_cache.stats()["tasks"].items():
+        values[(task, "hit")] = counts["hits"]
+        values[(task, "miss")] = counts["misses"]
+    return values
+
+
+registry.register(Gauge(
+    "llm_cache_lookups",
+    "LLM result cache lookups since start, by task and result.",
+    ("task", "result"),
+    callback=_lookups,
+))
+registry.register(Gauge(
+    "llm_cache_entries",
+    "Entries in the in-process LLM result cache.",
+    callback=lambda: {(): llm_cache.stats()["entries"]},
+))
@@ -0,0 +1,275 @@
+import threading
+from typing import Callable, List, NamedTuple, Optional
+
+import httpx
+
+from app.ai.parser import IncrementalJSONExtractor
+from app.ai.prompts import count_tokens
+from app.ai.providers import Provider, provider_pool
+from app.ai.resilience import CircuitOpenError, call_with_resilience
+from app.ai.singleflight import model_flights, request_key
+from app.core.logger import get_logger
+from app.core.metrics import llm_failovers, llm_input_tokens, llm_output_tokens, llm_parse_failures
+from app.core.config import (
+    LLM_HTTP2,
+    LLM_MAX_CONNECTIONS,
+    LLM_MAX_KEEPALIVE,
+    LLM_KEEPALIVE_EXPIRY,
+    LLM_CONNECT_TIMEOUT,
+    LLM_POOL_TIMEOUT,
+    LLM_STREAM_JSON,
+    LLM_MAX_CONTINUATIONS,
+    LLM_SINGLEFLIGHT_ENABLED,
+)
+
+logger = get_logger(__name__)
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_client() -> httpx.Client:
+    """
+    Process-wide pooled HTTP client for model calls.
+    Reuses TCP/TLS connections (HTTP/2 when available) across requests.
+    """
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    http2=LLM_HTTP2 and _http2_available(),
+                    limits=httpx.Limits(
+                        max_connections=LLM_MAX_CONNECTIONS,
+                        max_keepalive_connections=LLM_MAX_KEEPALIVE,
+                        keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+                    ),
+                    timeout=httpx.Timeout(
+                        90,
+                        connect=LLM_CONNECT_TIMEOUT,
+                        pool=LLM_POOL_TIMEOUT,
+                    ),
+                )
+
+    return _client
+
+
+def warm_client():
+    """
+    Open a pooled connection to each configured backend (DNS, TCP and
+    TLS) so the first model call of a fresh instance skips the
+    handshakes. Blocking; failures are ignored, the call path retries.
+    """
+    client = get_client()
+    origins = {
+        str(httpx.URL(provider.url).copy_with(path="/", query=None))
+        for provider in provider_pool.providers
+        if provider.weight > 0
+    }
+
+    for origin in sorted(origins):
+        try:
+            client.head(origin, timeout=httpx.Timeout(LLM_CONNECT_TIMEOUT))
+        except httpx.HTTPError as e:
+            logger.debug("Model backend warm-up failed", extra={"origin": origin, "error": str(e)})
+
+
+def close_client():
+    global _client
+
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+def _timeout(call_timeout: float) -> httpx.Timeout:
+    return httpx.Timeout(call_timeout, connect=LLM_CONNECT_TIMEOUT, pool=LLM_POOL_TIMEOUT)
+
+
+def _call(task: str, timeout: float, run: Callable, providers: Optional[List[Provider]] = None):
+    """
+    Run `run(provider, call_timeout)` on `providers` (by default the
+    configured backends in weighted order), moving to the next one when
+    a backend fails or its circuit is open. Returns the result and the
+    provider that produced it. Raises the last real error, or
+    CircuitOpenError if every circuit is open.
+    """
+    errors = []
+
+    for provider in providers or provider_pool.order():
+        try:
+            result = call_with_resilience(
+                task,
+                lambda call_timeout, p=provider: run(p, call_timeout),
+                timeout,
+                # Failed requests raise; whatever comes back is healthy
+                lambda _: True,
+                backend=provider.name,
+            )
+            return result, provider
+        except CircuitOpenError as e:
+            errors.append(e)
+        except httpx.PoolTimeout:
+            # Local saturation: every backend shares the pool, so failing
+            # over would only wait again
+            logger.warning("Model HTTP pool exhausted", extra={"backend": provider.name, "task": task})
+            raise
+        except Exception as e:
+            logger.warning(
+                "Model backend failed",
+                extra={"backend": provider.name, "task": task, "error": str(e)},
+            )
+            llm_failovers.inc(backend=provider.name)
+            errors.append(e)
+
+    failures = [e for e in errors if not isinstance(e, CircuitOpenError)]
+    raise failures[-1] if failures else errors[-1]
+
+
+def _record_tokens(task: str, messages: list, output: str):
+    llm_input_tokens.observe(sum(count_tokens(m.get("content") or "") for m in messages), task=task)
+    llm_output_tokens.observe(count_tokens(output), task=task)
+
+
+def _coalesced(kind: str, task: str, messages: list, max_tokens: int, temperature: float, fn: Callable,
+               providers: Optional[List[Provider]] = None):
+    """
+    Share one upstream request between concurrent identical calls.
+    Calls pinned to different backend orders are not identical: their
+    results are cached under the backend that answered.
+    """
+    if not LLM_SINGLEFLIGHT_ENABLED:
+        return fn()
+
+    key = request_key(
+        kind=kind,
+        task=task,
+        messages=messages,
+        max_tokens=max_tokens,
+        temperature=temperature,
+        providers=[provider.name for provider in providers] if providers else None,
+    )
+    return model_flights.do(key, fn)
+
+
+def chat_completion(
+    messages: list,
+    max_tokens: int,
+    temperature: float,
+    timeout: float,
+    task: str = "default",
+) -> str:
+    """
+    Return the text of a chat completion.
+    `timeout` is the upper bound for the read/write budget; the actual
+    value adapts to observed latency for `task`. Raises
+    CircuitOpenError without calling out when every backend is failing.
+    Concurrent identical requests share a single upstream call.
+    """
+    def run(provider: Provider, call_timeout: float) -> str:
+        content, _ = provider.complete(get_client(), messages, max_tokens, temperature, _timeout(call_timeout))
+        _record_tokens(task, messages, content)
+        return content
+
+    content, _ = _coalesced(
+        "text", task, messages, max_tokens, temperature,
+        lambda: _call(task, timeout, run),
+    )
+    return content
+
+
+CONTINUE_PROMPT = (
+    "Your previous reply was cut off. Continue EXACTLY where it stopped. "
+    "Output only the remaining characters, without repeating anything "
+    "and without markdown."
+)
+
+
+class JSONReply(NamedTuple):
+    text: str
+    provider: Provider
+
+
+def complete_json(
+    messages: list,
+    max_tokens: int,
+    temperature: float,
+    timeout: float,
+    task: str = "default",
+    providers: Optional[List[Provider]] = None,
+) -> JSONReply:
+    """
+    Generate a completion and return the text of its first top-level
+    JSON object, with the backend that produced it.
+
+    `providers` pins the backend order (see _call); callers that cache
+    the result pass the order their cache key was made for.
+
+    Output is streamed and the connection closed as soon as the object
+    is complete, so trailing text is never generated. If the output is
+    cut off by max_tokens, the model is asked to continue from where it
+    stopped instead of starting over. Raises if no complete object is
+    produced. Concurrent identical requests share a single upstream call.
+    """
+    def run(provider: Provider, call_timeout: float) -> Optional[str]:
+        extractor = IncrementalJSONExtractor()
+        content = ""
+
+        for continuation in range(LLM_MAX_CONTINUATIONS + 1):
+            request = messages
+            if continuation:
+                request = messages + [
+                    {"role": "assistant", "content": content},
+                    {"role": "user", "content": CONTINUE_PROMPT},
+                ]
+
+            finish_reason = None
+
+            if LLM_STREAM_JSON:
+                deltas = provider.stream(get_client(), request, max_tokens, temperature, _timeout(call_timeout))
+                try:
+                    for delta, finish_reason in deltas:
+                        content += delta
+                        if extractor.feed(delta):
+                            break
+                finally:
+                    deltas.close()
+            else:
+                text, finish_reason = provider.complete(get_client(), request, max_tokens, temperature, _timeout(call_timeout))
+                content += text
+                extractor.feed(text)
+
+            if extractor.done:
+                _record_tokens(task, request, content)
+                return extractor.text
+
+            if finish_reason != "length" or not extractor.started:
+                break
+
+            logger.info("Model output reached token limit, requesting continuation", extra={"task": task})
+
+        _record_tokens(task, messages, content)
+        return None
+
+    # A reply without JSON is a parse problem, not an unhealthy endpoint
+    json_text, provider = _coalesced(
+        "json", task, messages, max_tokens, temperature,
+        lambda: _call(task, timeout, run, providers),
+        providers,
+    )
+
+    if json_text is None:
+        llm_parse_failures.inc(task=task)
+        raise Exception("No complete JSON object in model output")
+
+    return JSONReply(json_text, provider)
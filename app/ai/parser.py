@@ -0,0 +1,94 @@
+import re
+from typing import Optional
+
+# The only characters that can change the extractor's state
+_SPECIAL = re.compile(r'[{}"\\]')
+
+
+class IncrementalJSONExtractor:
+    """
+    Finds the first top-level JSON object in text that arrives in chunks.
+
+    Tracks string and escape state, so braces inside string values do
+    not confuse it, and reports completion as soon as the object closes
+    so the caller can stop reading the rest of the generation.
+    Anything before the first '{' (markdown fences, preambles) is skipped.
+    """
+
+    def __init__(self):
+        self._parts = []
+        self._depth = 0
+        self._in_string = False
+        # Previous chunk ended on a backslash inside a string
+        self._escape = False
+        self.started = False
+        self.done = False
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Consume the next chunk. Returns True once the object is complete.
+        """
+        if self.done or not chunk:
+            return self.done
+
+        start = 0
+
+        if not self.started:
+            start = chunk.find("{")
+            if start == -1:
+                return False
+            self.started = True
+
+        depth = self._depth
+        in_string = self._in_string
+        # Matches before this index are escaped characters
+        skip = 1 if self._escape else 0
+
+        for match in _SPECIAL.finditer(chunk, start):
+            i = match.start()
+            if i < skip:
+                continue
+
+            char = match.group()
+
+            if in_string:
+                if char == "\\":
+                    skip = i + 2
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    self._parts.append(chunk[start:i + 1])
+                    self.done = True
+                    return True
+
+        self._parts.append(chunk[start:])
+        self._depth = depth
+        self._in_string = in_string
+        self._escape = skip > len(chunk)
+        return False
+
+    @property
+    def text(self) -> str:
+        """
+        Object text captured so far (complete once `done` is True).
+        """
+        return "".join(self._parts)
+
+
+def extract_json(text: str) -> Optional[str]:
+    """
+    Return the first complete top-level JSON object in `text`, or None.
+    """
+    if not text:
+        return None
+
+    extractor = IncrementalJSONExtractor()
+    extractor.feed(text)
+
+    return extractor.text if extractor.done else None
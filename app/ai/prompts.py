@@ -0,0 +1,579 @@
+"""
+Prompt assembly for every model call.
+
+System prompts live here so each task sends the same static prefix,
+byte for byte, on every request; per-request data only ever follows it,
+which lets the provider reuse its prefix cache. User prompts are built
+to a token budget, and every assembled prompt is counted per task.
+"""
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from app.core.config import (
+    PROMPT_TOKENIZER,
+    PROMPT_ADAPTIVE_MAX_TOKENS,
+    PROMPT_ANSWER_TOKEN_LIMIT,
+    QUESTION_PROMPT_TOKEN_BUDGET,
+    QUESTION_HISTORY_TURNS,
+)
+from app.core.logger import get_logger
+from app.core.metrics import llm_prompt_compressions, llm_prompt_tokens, llm_prompts
+
+logger = get_logger(__name__)
+
+# =====================================================
+# System prompts
+# =====================================================
+
+QUESTION_SYSTEM_PROMPT = """
+You are a STRICT professional interviewer.
+
+CRITICAL RULES:
+- Ask ONLY ONE question.
+- NEVER repeat any previous question.
+- NO generic HR questions unless it's the first question.
+- Questions MUST be ROLE-SPECIFIC and TECHNICAL wherever possible.
+- Increase difficulty gradually.
+- Avoid vague questions like:
+  - "Tell me about yourself"
+  - "What are your strengths?"
+  - "Describe a challenge"
+- Focus on REAL interview-style grilling questions.
+
+GOOD EXAMPLES:
+- "Explain how React's reconciliation works."
+- "How would you design a scalable REST API?"
+- "What indexing strategy would you use for a large dataset?"
+
+BAD EXAMPLES:
+- "Tell me about yourself"
+- "What is your biggest achievement?"
+
+OUTPUT:
+Return ONLY the question text.
+"""
+
+
+ANALYSIS_SYSTEM_PROMPT = """
+You are an expert interview evaluator.
+
+Evaluate the candidate based on:
+- Clarity of thought
+- Communication skills
+- Confidence
+- Structure of the answer
+- English language quality
+
+Focus on HOW the answer is delivered rather than technical correctness.
+Be strict but fair.
+Do NOT give identical scores unless truly deserved.
+Do NOT give 7+ unless the answer is structured and confident.
+Ensure newline characters inside strings are escaped using \\n.
+Return raw JSON only.
+Do NOT wrap JSON in markdown.
+
+STRICT RULES:
+- Return ONLY valid JSON
+- DO NOT add any explanation before or after
+- DO NOT use markdown
+- DO NOT write anything except JSON
+- Ensure all quotes are properly escaped
+
+FORMAT:
+{
+  "scores": {
+    "clarity": number,
+    "communication": number,
+    "confidence": number,
+    "structure": number,
+    "english": number
+  },
+  "strengths": "text",
+  "improvements": "text",
+  "suggested_rewrite": "text"
+}
+
+"""
+
+
+FEEDBACK_SYSTEM_PROMPT = """
+You are a senior technical interviewer and career mentor.
+
+You are generating FEEDBACK — NOT evaluation scores.
+
+Do NOT return:
+- scores
+- clarity
+- communication
+- confidence
+- structure
+- english
+
+Return ONLY this JSON structure:
+
+{
+  "verbal_feedback": "Concise but impactful paragraph (5-8 sentences maximum)",
+  "key_issues": ["string"],
+  "actionable_tips": ["string"],
+  "ideal_answer": "string",
+  "verdict": "Strong Hire / Hire / Borderline / No Hire"
+}
+
+Rules:
+- Do NOT wrap JSON in markdown.
+- Do NOT include explanations outside JSON.
+- Ensure newline characters inside strings are escaped using \\n.
+- If you generate invalid JSON, the response will be discarded.
+- Keep responses concise and avoid unnecessary elaboration.
+
+"""
+
+
+FUSED_SYSTEM_PROMPT = """
+You are an expert interview evaluator and career mentor.
+
+For ONE candidate answer you produce BOTH:
+1. An evaluation of HOW the answer is delivered (scores 1-10)
+2. Mentor feedback on the answer
+
+Evaluate the candidate based on:
+- Clarity of thought
+- Communication skills
+- Confidence
+- Structure of the answer
+- English language quality
+
+Be strict but fair.
+Do NOT give identical scores unless truly deserved.
+Do NOT give 7+ unless the answer is structured and confident.
+Keep the feedback consistent with the scores you give.
+
+STRICT RULES:
+- Return ONLY valid JSON
+- DO NOT add any explanation before or after
+- DO NOT use markdown
+- Ensure newline characters inside strings are escaped using \\n.
+- Ensure all quotes are properly escaped
+- Keep responses concise and avoid unnecessary elaboration.
+
+FORMAT:
+{
+  "analysis": {
+    "scores": {
+      "clarity": number,
+      "communication": number,
+      "confidence": number,
+      "structure": number,
+      "english": number
+    },
+    "strengths": "text",
+    "improvements": "text",
+    "suggested_rewrite": "text"
+  },
+  "feedback": {
+    "verbal_feedback": "Concise but impactful paragraph (5-8 sentences maximum)",
+    "key_issues": ["string"],
+    "actionable_tips": ["string"],
+    "ideal_answer": "string",
+    "verdict": "Strong Hire / Hire / Borderline / No Hire"
+  }
+}
+"""
+
+
+BATCH_SYSTEM_PROMPT = """
+You are an expert interview evaluator.
+
+You will receive SEVERAL numbered candidate answers. Evaluate EACH one
+independently based on:
+- Clarity of thought
+- Communication skills
+- Confidence
+- Structure of the answer
+- English language quality
+
+Focus on HOW the answer is delivered rather than technical correctness.
+Be strict but fair.
+Do NOT give identical scores unless truly deserved.
+Do NOT give 7+ unless the answer is structured and confident.
+
+STRICT RULES:
+- Return ONLY valid JSON
+- DO NOT add any explanation before or after
+- DO NOT use markdown
+- Ensure newline characters inside strings are escaped using \\n.
+- Return exactly one result per answer, using the answer's index
+
+FORMAT:
+{
+  "results": [
+    {
+      "index": number,
+      "scores": {
+        "clarity": number,
+        "communication": number,
+        "confidence": number,
+        "structure": number,
+        "english": number
+      },
+      "strengths": "text",
+      "improvements": "text",
+      "suggested_rewrite": "text"
+    }
+  ]
+}
+"""
+
+
+# =====================================================
+# Token counting
+# =====================================================
+
+_tokenizer = None
+_tokenizer_lock = threading.Lock()
+_tokenizer_failed = False
+
+
+def _get_tokenizer():
+    """
+    The model's own tokenizer when PROMPT_TOKENIZER names one and the
+    `tokenizers` package is installed, otherwise None.
+    """
+    global _tokenizer, _tokenizer_failed
+
+    if not PROMPT_TOKENIZER or _tokenizer_failed:
+        return _tokenizer
+
+    with _tokenizer_lock:
+        if _tokenizer is None and not _tokenizer_failed:
+            try:
+                from tokenizers import Tokenizer
+                _tokenizer = Tokenizer.from_pretrained(PROMPT_TOKENIZER)
+            except Exception as e:
+                logger.warning("Tokenizer unavailable, estimating tokens", extra={"error": str(e)})
+                _tokenizer_failed = True
+
+    return _tokenizer
+
+
+def count_tokens(text: str) -> int:
+    if not text:
+        return 0
+
+    tokenizer = _get_tokenizer()
+    if tokenizer is not None:
+        return len(tokenizer.encode(text).ids)
+
+    # ~4 characters per token for English text
+    return len(text) // 4 + 1
+
+
+def truncate_tokens(text: str, limit: int) -> str:
+    """
+    Cut `text` to roughly `limit` tokens, keeping its start and end.
+    """
+    if count_tokens(text) <= limit:
+        return text
+
+    chars = max(limit, 1) * 4
+    head = chars * 2 // 3
+    tail = chars - head
+
+    return text[:head].rstrip() + " [...] " + text[-tail:].lstrip()
+
+
+# =====================================================
+# Output budgets
+# =====================================================
+
+# task -> (base tokens, extra tokens per answer token, ceiling)
+# Rewrites and ideal answers grow with the answer, the rest does not.
+OUTPUT_BUDGETS = {
+    "question": (120, 0.0, 120),
+    "analysis": (350, 1.0, 600),
+    "feedback": (450, 1.0, 800),
+    "fused": (750, 1.5, 1200),
+}
+
+
+def max_output_tokens(task: str, answer: str = "") -> int:
+    base, per_token, ceiling = OUTPUT_BUDGETS[task]
+
+    if not PROMPT_ADAPTIVE_MAX_TOKENS:
+        return ceiling
+
+    return min(ceiling, base + int(per_token * count_tokens(answer)))
+
+
+# =====================================================
+# Accounting
+# =====================================================
+
+class PromptStats:
+    """
+    Per-task counters for assembled prompts: input tokens, the static
+    (cacheable) share of them, requested output tokens, and how often
+    history had to be compressed to fit the budget.
+    """
+
+    def __init__(self):
+        self._tasks = defaultdict(lambda: {
+            "prompts": 0,
+            "input_tokens": 0,
+            "static_tokens": 0,
+            "max_input_tokens": 0,
+            "max_output_tokens": 0,
+            "compressed": 0,
+        })
+        self._lock = threading.Lock()
+
+    def record(self, task: str, input_tokens: int, static_tokens: int, max_tokens: int, compressed: bool):
+        with self._lock:
+            entry = self._tasks[task]
+            entry["prompts"] += 1
+            entry["input_tokens"] += input_tokens
+            entry["static_tokens"] += static_tokens
+            entry["max_input_tokens"] = max(entry["max_input_tokens"], input_tokens)
+            entry["max_output_tokens"] += max_tokens
+            entry["compressed"] += int(compressed)
+
+        llm_prompts.inc(task=task)
+        llm_prompt_tokens.inc(input_tokens, task=task, kind="input")
+        llm_prompt_tokens.inc(static_tokens, task=task, kind="static")
+        llm_prompt_tokens.inc(max_tokens, task=task, kind="requested_output")
+        if compressed:
+            llm_prompt_compressions.inc(task=task)
+
+    def stats(self) -> dict:
+        with self._lock:
+            tasks = {task: dict(entry) for task, entry in self._tasks.items()}
+
+        for entry in tasks.values():
+            prompts = entry["prompts"]
+            entry["avg_input_tokens"] = round(entry["input_tokens"] / prompts, 1)
+            entry["avg_max_output_tokens"] = round(entry.pop("max_output_tokens") / prompts, 1)
+            entry["static_share"] = round(entry["static_tokens"] / max(entry["input_tokens"], 1), 3)
+
+        return tasks
+
+
+prompt_stats = PromptStats()
+
+
+def build_messages(
+    task: str,
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int,
+    static_prefix: str = "",
+    compressed: bool = False,
+) -> List[dict]:
+    """
+    Chat messages for one call, recorded in `prompt_stats`.
+    `static_prefix` is the part of the user prompt shared by every
+    request of this task.
+    """
+    system_tokens = count_tokens(system_prompt)
+
+    prompt_stats.record(
+        task,
+        input_tokens=system_tokens + count_tokens(user_prompt),
+        static_tokens=system_tokens + count_tokens(static_prefix),
+        max_tokens=max_tokens,
+        compressed=compressed,
+    )
+
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt}
+    ]
+
+
+# =====================================================
+# User prompts
+# =====================================================
+
+def analysis_user_prompt(question: str, answer: str, role: str, experience_level: str) -> str:
+    return f"""
+Interview Context:
+Role: {role}
+Experience Level: {experience_level}
+
+Question:
+{question}
+
+Candidate Answer:
+{answer}
+
+Return ONLY valid JSON in this format:
+
+{{
+  "scores": {{
+    "clarity": 1-10,
+    "communication": 1-10,
+    "confidence": 1-10,
+    "structure": 1-10,
+    "english": 1-10
+  }},
+  "strengths": "string",
+  "improvements": "string",
+  "suggested_rewrite": "string"
+}}
+"""
+
+
+def feedback_user_prompt(question, answer, scores, feedback_mode):
+    return f"""
+Mode: {feedback_mode.upper()}
+
+Interview Question:
+{question}
+
+Candidate Answer:
+{answer}
+
+Analysis Summary:
+Clarity: {scores.get("clarity")}
+Communication: {scores.get("communication")}
+Confidence: {scores.get("confidence")}
+Structure: {scores.get("structure")}
+English: {scores.get("english")}
+
+Return ONLY valid JSON.
+"""
+
+
+def fused_user_prompt(question, answer, role, experience_level, feedback_mode):
+    return f"""
+Interview Context:
+Role: {role}
+Experience Level: {experience_level}
+Feedback Mode: {feedback_mode.upper()}
+
+Question:
+{question}
+
+Candidate Answer:
+{answer}
+
+Return ONLY valid JSON.
+"""
+
+
+def batch_answer_block(index: int, role: str, experience_level: str, question: str, answer: str) -> str:
+    return f"""
+[{index}]
+Role: {role}
+Experience Level: {experience_level}
+Question: {question}
+Candidate Answer: {answer}
+"""
+
+
+def fit_answer(answer: str) -> str:
+    """
+    Very long answers are cut to PROMPT_ANSWER_TOKEN_LIMIT before they
+    are sent; cache keys still use the full answer.
+    """
+    return truncate_tokens(answer, PROMPT_ANSWER_TOKEN_LIMIT)
+
+
+# Identical for every question request, so it follows the system prompt
+# in the provider's prefix cache
+QUESTION_PROMPT_PREFIX = """
+You are conducting a REALISTIC TECHNICAL INTERVIEW.
+
+STRICT INSTRUCTIONS:
+- Ask ROLE-SPECIFIC questions for the ROLE below
+- Avoid HR/general questions
+- Ask practical, scenario-based or technical questions
+- Increase difficulty gradually
+- DO NOT repeat questions
+"""
+
+# Per-turn caps before the budget is even considered
+_QUESTION_CHARS = 300
+_ANSWER_TOKENS = 150
+
+
+def _clip(text: str, chars: int) -> str:
+    text = " ".join(str(text).split())
+    return text if len(text) <= chars else text[:chars - 3].rstrip() + "..."
+
+
+def question_user_prompt(
+    role: str,
+    experience_level: str,
+    history: List[Dict],
+    difficulty: Optional[str] = None,
+    budget: int = QUESTION_PROMPT_TOKEN_BUDGET,
+) -> tuple:
+    """
+    Build the next-question prompt within `budget` input tokens
+    (system prompt included). Returns (prompt, compressed).
+
+    The most recent QUESTION_HISTORY_TURNS turns are kept as dialogue
+    with clipped answers; older turns are reduced to the question alone,
+    newest first, and whatever still does not fit is summarized as a
+    count of omitted questions.
+    """
+    questions = [_clip(h["question"], _QUESTION_CHARS) for h in history if "question" in h]
+    recent = history[-QUESTION_HISTORY_TURNS:] if QUESTION_HISTORY_TURNS > 0 else []
+    turns = [h for h in recent if "question" in h and "answer" in h]
+
+    context = f"""
+ROLE: {role}
+EXPERIENCE LEVEL: {experience_level}
+{f"DIFFICULTY: {difficulty.upper()}" if difficulty else ""}
+"""
+    closing = "\nNow ask the NEXT QUESTION.\n"
+
+    remaining = budget - count_tokens(QUESTION_SYSTEM_PROMPT) - count_tokens(
+        QUESTION_PROMPT_PREFIX + context + closing
+    )
+    compressed = False
+
+    # Recent dialogue, newest first so it wins the budget
+    conversation = []
+    for turn in reversed(turns):
+        question = _clip(turn["question"], _QUESTION_CHARS)
+        answer = truncate_tokens(" ".join(str(turn["answer"]).split()), _ANSWER_TOKENS)
+        compressed = compressed or answer != " ".join(str(turn["answer"]).split())
+
+        block = f"\nInterviewer: {question}\nCandidate: {answer}\n"
+        cost = count_tokens(block)
+        if cost > remaining:
+            compressed = True
+            break
+
+        conversation.insert(0, block)
+        remaining -= cost
+
+    # Every question asked, as far back as the budget allows
+    asked = []
+    for question in reversed(questions):
+        line = f"- {question}\n"
+        cost = count_tokens(line)
+        if cost > remaining:
+            break
+
+        asked.insert(0, line)
+        remaining -= cost
+
+    omitted = len(questions) - len(asked)
+    if omitted:
+        compressed = True
+        asked.insert(0, f"- ({omitted} earlier questions omitted)\n")
+
+    prompt = (
+        QUESTION_PROMPT_PREFIX
+        + context
+        + "\nALREADY ASKED QUESTIONS:\n"
+        + "".join(asked)
+        + "\nCONVERSATION:\n"
+        + "".join(conversation)
+        + closing
+    )
+
+    return prompt, compressed
@@ -0,0 +1,285 @@
+import json
+import random
+import threading
+from typing import Iterator, List, Optional, Tuple
+
+import httpx
+
+from app.core.config import (
+    LLM_PROVIDERS,
+    HF_API_TOKEN,
+    HF_MODEL,
+    MODEL_URL,
+    COHERE_API_KEY,
+    COHERE_MODEL,
+    COHERE_URL,
+    LOCAL_LLM_URL,
+    LOCAL_LLM_MODEL,
+)
+
+
+class ProviderError(Exception):
+    """
+    Non-success HTTP status from a model backend.
+    `client_error` marks requests the backend rejected as malformed,
+    which say nothing about the backend's health.
+    """
+
+    def __init__(self, provider: str, status_code: int, text: str):
+        super().__init__(f"{provider} API error {status_code}: {text}")
+        self.status_code = status_code
+        self.client_error = status_code < 500 and status_code != 429
+
+
+class Provider:
+    """
+    One model backend. Subclasses translate between the chat messages
+    used by the services and the backend's wire format.
+    """
+
+    kind = ""
+
+    def __init__(self, name: str, url: str, model: str, api_key: str = "", weight: float = 1.0):
+        self.name = name
+        self.url = url
+        self.model = model
+        self.weight = weight
+        self.headers = {"Content-Type": "application/json"}
+        if api_key:
+            self.headers["Authorization"] = f"Bearer {api_key}"
+
+    def complete(
+        self,
+        client: httpx.Client,
+        messages: list,
+        max_tokens: int,
+        temperature: float,
+        timeout: httpx.Timeout,
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Non-streaming completion, returning (content, finish_reason).
+        finish_reason is normalized to the OpenAI values ("stop", "length").
+        """
+        raise NotImplementedError
+
+    def stream(
+        self,
+        client: httpx.Client,
+        messages: list,
+        max_tokens: int,
+        temperature: float,
+        timeout: httpx.Timeout,
+    ) -> Iterator[Tuple[str, Optional[str]]]:
+        """
+        Yield (content_delta, finish_reason) from a streamed completion.
+        Closing the generator early closes the connection, which stops
+        the generation upstream.
+        """
+        raise NotImplementedError
+
+    def _raise_for_status(self, response: httpx.Response):
+        if response.status_code != 200:
+            raise ProviderError(self.name, response.status_code, response.text)
+
+
+class OpenAICompatibleProvider(Provider):
+    """
+    Any /v1/chat/completions endpoint: the Hugging Face router, and the
+    local stand-in server used for load tests and benchmarks.
+    """
+
+    kind = "openai"
+
+    def _payload(self, messages: list, max_tokens: int, temperature: float, stream: bool) -> dict:
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature
+        }
+        if stream:
+            payload["stream"] = True
+        return payload
+
+    def complete(self, client, messages, max_tokens, temperature, timeout):
+        response = client.post(
+            self.url,
+            headers=self.headers,
+            json=self._payload(messages, max_tokens, temperature, False),
+            timeout=timeout,
+        )
+        self._raise_for_status(response)
+
+        result = response.json()
+
+        if "choices" not in result or not result["choices"]:
+            raise Exception(f"No choices returned: {result}")
+
+        choice = result["choices"][0]
+
+        if "message" not in choice or "content" not in choice["message"]:
+            raise Exception(f"Malformed response structure: {choice}")
+
+        return choice["message"]["content"] or "", choice.get("finish_reason")
+
+    def stream(self, client, messages, max_tokens, temperature, timeout):
+        with client.stream(
+            "POST",
+            self.url,
+            headers=self.headers,
+            json=self._payload(messages, max_tokens, temperature, True),
+            timeout=timeout,
+        ) as response:
+            if response.status_code != 200:
+                response.read()
+                self._raise_for_status(response)
+
+            for line in response.iter_lines():
+                if not line.startswith("data:"):
+                    continue
+
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    return
+
+                chunk = json.loads(data)
+                if not chunk.get("choices"):
+                    continue
+
+                choice = chunk["choices"][0]
+                delta = (choice.get("delta") or {}).get("content") or ""
+                yield delta, choice.get("finish_reason")
+
+
+class CohereProvider(Provider):
+    """
+    Cohere v2 chat API (https://api.cohere.com/v2/chat).
+    """
+
+    kind = "cohere"
+
+    FINISH_REASONS = {"COMPLETE": "stop", "STOP_SEQUENCE": "stop", "MAX_TOKENS": "length"}
+
+    def _payload(self, messages: list, max_tokens: int, temperature: float, stream: bool) -> dict:
+        return {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": stream,
+        }
+
+    def _finish_reason(self, reason: Optional[str]) -> Optional[str]:
+        if reason is None:
+            return None
+        return self.FINISH_REASONS.get(reason, reason.lower())
+
+    def complete(self, client, messages, max_tokens, temperature, timeout):
+        response = client.post(
+            self.url,
+            headers=self.headers,
+            json=self._payload(messages, max_tokens, temperature, False),
+            timeout=timeout,
+        )
+        self._raise_for_status(response)
+
+        result = response.json()
+        content = (result.get("message") or {}).get("content")
+
+        if not isinstance(content, list):
+            raise Exception(f"Malformed response structure: {result}")
+
+        text = "".join(part.get("text", "") for part in content if part.get("type") == "text")
+        return text, self._finish_reason(result.get("finish_reason"))
+
+    def stream(self, client, messages, max_tokens, temperature, timeout):
+        with client.stream(
+            "POST",
+            self.url,
+            headers=self.headers,
+            json=self._payload(messages, max_tokens, temperature, True),
+            timeout=timeout,
+        ) as response:
+            if response.status_code != 200:
+                response.read()
+                self._raise_for_status(response)
+
+            for line in response.iter_lines():
+                if not line.startswith("data:"):
+                    continue
+
+                event = json.loads(line[5:].strip())
+                kind = event.get("type")
+
+                if kind == "content-delta":
+                    text = event["delta"]["message"]["content"].get("text") or ""
+                    yield text, None
+                elif kind == "message-end":
+                    yield "", self._finish_reason(event.get("delta", {}).get("finish_reason"))
+                    return
+
+
+def _build_provider(name: str, weight: float) -> Provider:
+    if name == "hf":
+        return OpenAICompatibleProvider("hf", MODEL_URL, HF_MODEL, HF_API_TOKEN, weight)
+    if name == "cohere":
+        return CohereProvider("cohere", COHERE_URL, COHERE_MODEL, COHERE_API_KEY, weight)
+    if name == "local":
+        return OpenAICompatibleProvider("local", LOCAL_LLM_URL, LOCAL_LLM_MODEL, "", weight)
+
+    raise ValueError(f"Unknown LLM provider: {name}")
+
+
+def parse_providers(spec: str) -> List[Provider]:
+    """
+    Build providers from a spec like "hf:3,cohere:1" (name[:weight]).
+    """
+    providers = []
+
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+
+        name, _, weight = entry.partition(":")
+        providers.append(_build_provider(name.strip().lower(), float(weight) if weight else 1.0))
+
+    if not providers:
+        raise ValueError("LLM_PROVIDERS is empty")
+
+    return providers
+
+
+class ProviderPool:
+    """
+    Weighted choice between the configured backends.
+    Each call gets every backend once, in an order drawn by weight, so
+    the first one takes its share of traffic and the rest are failovers.
+    """
+
+    def __init__(self, providers: List[Provider]):
+        self.providers = providers
+        self._random = random.Random()
+        self._lock = threading.Lock()
+
+    def order(self) -> List[Provider]:
+        remaining = [p for p in self.providers if p.weight > 0]
+        ordered = []
+
+        with self._lock:
+            while remaining:
+                pick = self._random.uniform(0, sum(p.weight for p in remaining))
+                for provider in remaining:
+                    pick -= provider.weight
+                    if pick <= 0:
+                        break
+                ordered.append(provider)
+                remaining.remove(provider)
+
+        return ordered
+
+    def names(self) -> List[str]:
+        return [p.name for p in self.providers]
+
+
+provider_pool = ProviderPool(parse_providers(LLM_PROVIDERS))
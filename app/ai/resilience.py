@@ -0,0 +1,317 @@
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Optional
+
+import httpx
+
+from app.core.logger import get_logger
+from app.core.metrics import registry, Gauge, llm_latency, llm_retries, llm_in_flight
+from app.core.config import (
+    LLM_BREAKER_WINDOW,
+    LLM_BREAKER_FAILURE_RATE,
+    LLM_BREAKER_MIN_CALLS,
+    LLM_BREAKER_COOLDOWN,
+    LLM_TIMEOUT_MULTIPLIER,
+    LLM_TIMEOUT_MIN,
+    LLM_LATENCY_MIN_SAMPLES,
+    LLM_RETRY_BUDGET_RATIO,
+    LLM_RETRY_BUDGET_MIN,
+    LLM_RETRY_BUDGET_WINDOW,
+    LLM_HEDGE_ENABLED,
+    LLM_HEDGE_MIN_DELAY,
+)
+
+logger = get_logger(__name__)
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class CircuitBreaker:
+    """
+    Failure-rate circuit breaker over a sliding time window.
+
+    closed    -> calls pass; opens when failures / calls >= failure_rate
+    open      -> calls fail fast until `cooldown` has passed
+    half_open -> a single probe call decides whether to close again
+    """
+
+    def __init__(self, window: float, failure_rate: float, min_calls: int, cooldown: float):
+        self.window = window
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.cooldown = cooldown
+
+        self.state = "closed"
+        self._opened_at = 0.0
+        self._probing = False
+        self._calls = deque()
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """
+        Raise CircuitOpenError if the call should not be attempted.
+        """
+        with self._lock:
+            if self.state == "closed":
+                return
+
+            if self.state == "open":
+                if time.monotonic() - self._opened_at < self.cooldown:
+                    raise CircuitOpenError("Model endpoint circuit is open")
+                self.state = "half_open"
+
+            if self._probing:
+                raise CircuitOpenError("Model endpoint circuit is half-open")
+            self._probing = True
+
+    def release(self):
+        """
+        End a call that says nothing about the backend's health; a
+        half-open breaker lets the next call probe instead.
+        """
+        with self._lock:
+            if self.state == "half_open":
+                self._probing = False
+
+    def record(self, ok: bool):
+        now = time.monotonic()
+
+        with self._lock:
+            if self.state == "half_open":
+                self._probing = False
+                self._calls.clear()
+                if ok:
+                    self.state = "closed"
+                else:
+                    self.state = "open"
+                    self._opened_at = now
+                return
+
+            self._calls.append((now, ok))
+            while self._calls and now - self._calls[0][0] > self.window:
+                self._calls.popleft()
+
+            failures = sum(1 for _, success in self._calls if not success)
+            if (
+                self.state == "closed"
+                and len(self._calls) >= self.min_calls
+                and failures / len(self._calls) >= self.failure_rate
+            ):
+                logger.warning(
+                    "Circuit opening",
+                    extra={"failures": failures, "calls": len(self._calls)},
+                )
+                self.state = "open"
+                self._opened_at = now
+
+
+class LatencyTracker:
+    """
+    Rolling per-task latency samples used for adaptive timeouts and
+    hedging delays.
+    """
+
+    def __init__(self, size: int = 200):
+        self._samples = defaultdict(lambda: deque(maxlen=size))
+        self._lock = threading.Lock()
+
+    def observe(self, task: str, seconds: float):
+        with self._lock:
+            self._samples[task].append(seconds)
+
+    def percentile(self, task: str, pct: float) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._samples.get(task, ()))
+
+        if len(samples) < LLM_LATENCY_MIN_SAMPLES:
+            return None
+
+        return samples[min(len(samples) - 1, int(pct / 100 * len(samples)))]
+
+    def timeout(self, task: str, ceiling: float) -> float:
+        """
+        Read timeout for the next call: observed p99 times a safety
+        multiplier, never above the caller's own limit.
+        """
+        p99 = self.percentile(task, 99)
+
+        if p99 is None:
+            return ceiling
+
+        return max(LLM_TIMEOUT_MIN, min(ceiling, p99 * LLM_TIMEOUT_MULTIPLIER))
+
+
+class RetryBudget:
+    """
+    Caps retries at a fraction of recent calls instead of retrying
+    every failure, so a degraded endpoint does not see retry storms.
+    """
+
+    def __init__(self, ratio: float, minimum: int, window: float):
+        self.ratio = ratio
+        self.minimum = minimum
+        self.window = window
+
+        self._calls = deque()
+        self._retries = deque()
+        self._lock = threading.Lock()
+
+    def _trim(self, now: float):
+        for events in (self._calls, self._retries):
+            while events and now - events[0] > self.window:
+                events.popleft()
+
+    def record_call(self):
+        now = time.monotonic()
+        with self._lock:
+            self._calls.append(now)
+            self._trim(now)
+
+    def try_retry(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            self._trim(now)
+            allowed = max(self.minimum, int(len(self._calls) * self.ratio))
+
+            if len(self._retries) >= allowed:
+                return False
+
+            self._retries.append(now)
+            return True
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(backend: str) -> CircuitBreaker:
+    """
+    Circuit breaker for one model backend, so a failing backend can be
+    skipped while the others keep serving.
+    """
+    with _breakers_lock:
+        if backend not in _breakers:
+            _breakers[backend] = CircuitBreaker(
+                window=LLM_BREAKER_WINDOW,
+                failure_rate=LLM_BREAKER_FAILURE_RATE,
+                min_calls=LLM_BREAKER_MIN_CALLS,
+                cooldown=LLM_BREAKER_COOLDOWN,
+            )
+        return _breakers[backend]
+
+
+registry.register(Gauge(
+    "llm_circuit_open",
+    "1 while a backend's circuit is open or half-open.",
+    ("backend",),
+    callback=lambda: {(backend,): int(b.state != "closed") for backend, b in list(_breakers.items())},
+))
+
+latency = LatencyTracker()
+retry_budget = RetryBudget(
+    ratio=LLM_RETRY_BUDGET_RATIO,
+    minimum=LLM_RETRY_BUDGET_MIN,
+    window=LLM_RETRY_BUDGET_WINDOW,
+)
+
+_hedge_executor = None
+_hedge_lock = threading.Lock()
+
+
+def _get_hedge_executor() -> ThreadPoolExecutor:
+    global _hedge_executor
+
+    with _hedge_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="llm-hedge")
+        return _hedge_executor
+
+
+def _hedged(fn: Callable, delay: float):
+    """
+    Run `fn`; if it has not finished after `delay` seconds, start a
+    duplicate and return whichever succeeds first.
+    """
+    executor = _get_hedge_executor()
+    first = executor.submit(fn)
+
+    if wait([first], timeout=delay).done:
+        return first.result()
+
+    pending = {first, executor.submit(fn)}
+    error = None
+
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            try:
+                return future.result()
+            except Exception as e:
+                error = e
+
+    raise error
+
+
+def call_with_resilience(task: str, fn: Callable, timeout: float, is_success: Callable, backend: str = "default"):
+    """
+    Run one model call through the backend's breaker, adaptive timeout
+    and optional hedging. `fn(timeout)` performs the request; `is_success`
+    decides whether its result counts as healthy for the breaker.
+    """
+    breaker = get_breaker(backend)
+    breaker.allow()
+    retry_budget.record_call()
+
+    call_timeout = latency.timeout(task, timeout)
+    start = time.perf_counter()
+    llm_in_flight.inc(backend=backend)
+
+    try:
+        hedge_delay = latency.percentile(task, 95) if LLM_HEDGE_ENABLED else None
+
+        if hedge_delay is not None:
+            result = _hedged(lambda: fn(call_timeout), max(LLM_HEDGE_MIN_DELAY, hedge_delay))
+        else:
+            result = fn(call_timeout)
+
+    except httpx.PoolTimeout:
+        # Our own connection pool is saturated; the backend was never reached
+        breaker.release()
+        llm_latency.observe(time.perf_counter() - start, task=task, backend=backend, outcome="pool_timeout")
+        raise
+    except Exception as e:
+        # Requests the backend rejected as malformed say nothing about its health
+        breaker.record(getattr(e, "client_error", False))
+        llm_latency.observe(time.perf_counter() - start, task=task, backend=backend, outcome="error")
+        raise
+    finally:
+        llm_in_flight.dec(backend=backend)
+
+    llm_latency.observe(time.perf_counter() - start, task=task, backend=backend, outcome="ok")
+    ok = is_success(result)
+    breaker.record(ok)
+
+    if ok:
+        latency.observe(task, time.perf_counter() - start)
+
+    return result
+
+
+def should_retry(error: Exception, task: str = "default") -> bool:
+    """
+    Whether a failed model call may be retried: never when the circuit
+    is open, otherwise only while the retry budget lasts.
+    """
+    if isinstance(error, CircuitOpenError):
+        return False
+
+    if not retry_budget.try_retry():
+        logger.warning("Retry budget exhausted, not retrying", extra={"task": task})
+        return False
+
+    llm_retries.inc(task=task)
+    return True
@@ -0,0 +1,115 @@
+import hashlib
+import json
+import threading
+from typing import Callable
+
+from app.core.metrics import registry, Gauge
+
+
+def request_key(**payload) -> str:
+    """
+    Canonical key for a request payload: same fields, same key,
+    regardless of dict ordering.
+    """
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.cancelled = False
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into one execution.
+
+    The first caller (the leader) runs the function; callers arriving
+    while it is in flight wait and receive the same result, or the same
+    exception. Nothing is kept once the flight lands, so a later call
+    runs again. If the leader is interrupted without a result (e.g. its
+    thread is torn down), waiting callers start a new flight instead of
+    failing with an error that was not theirs.
+    """
+
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+
+        self.calls = 0
+        self.executions = 0
+        self.shared = 0
+        self.shared_errors = 0
+
+    def do(self, key: str, fn: Callable):
+        while True:
+            with self._lock:
+                self.calls += 1
+                flight = self._flights.get(key)
+
+                if flight is None:
+                    flight = _Flight()
+                    self._flights[key] = flight
+                    self.executions += 1
+                    leader = True
+                else:
+                    leader = False
+
+            if leader:
+                return self._lead(key, flight, fn)
+
+            flight.done.wait()
+
+            with self._lock:
+                if flight.cancelled:
+                    # Not a saved call after all; the retry counts again
+                    self.calls -= 1
+                    continue
+
+                self.shared += 1
+                if flight.error is not None:
+                    self.shared_errors += 1
+
+            if flight.error is not None:
+                raise flight.error
+
+            return flight.result
+
+    def _lead(self, key: str, flight: _Flight, fn: Callable):
+        completed = False
+
+        try:
+            flight.result = fn()
+            completed = True
+            return flight.result
+        except Exception as e:
+            flight.error = e
+            completed = True
+            raise
+        finally:
+            with self._lock:
+                flight.cancelled = not completed
+                del self._flights[key]
+            flight.done.set()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "upstream_calls": self.executions,
+                "saved_calls": self.shared,
+                "shared_errors": self.shared_errors,
+                "in_flight": len(self._flights),
+            }
+
+
+model_flights = SingleFlight()
+
+registry.register(Gauge(
+    "llm_singleflight_saved_calls",
+    "Model calls answered by joining an identical in-flight request.",
+    callback=lambda: {(): model_flights.shared},
+))
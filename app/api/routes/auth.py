@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
-from app.db.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.database import get_async_db
 from app.schemas.user import UserCreate, UserLogin
 from app.auth.auth_service import register_user, login_user
 
@@ -9,15 +9,15 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 @router.post("/register", status_code=status.HTTP_201_CREATED)
-def register(user: UserCreate, db: Session = Depends(get_db)):
-    created_user = register_user(
+async def register(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    created_user = await register_user(
         db=db,
         name=user.name,
         email=user.email,
         password=user.password
     )
 
-    db_user, token = login_user(
+    db_user, token = await login_user(
         db=db,
         email=user.email,
         password=user.password
@@ -35,7 +35,7 @@ def register(user: UserCreate, db: Session = Depends(get_db)):
 
 
 @router.post("/login")
-async def login(request: Request, db: Session = Depends(get_db)):
+async def login(request: Request, db: AsyncSession = Depends(get_async_db)):
     if request.headers.get("Content-Type") == "application/json":
         data = await request.json()
         email = data.get("email")
@@ -45,7 +45,7 @@ async def login(request: Request, db: Session = Depends(get_db)):
         email = form.get("username")
         password = form.get("password")
 
-    db_user, token = login_user(db=db, email=email, password=password)
+    db_user, token = await login_user(db=db, email=email, password=password)
     return {
         "user": {
             "id": db_user.id,
@@ -1,7 +1,9 @@
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from ..services.feedback_service import generate_feedback
+from ..services.streaming_service import stream_feedback
 
 router = APIRouter()
 
@@ -21,3 +23,17 @@ def generate_feedback_route(data: FeedbackRequest):
         analysis=data.analysis,
         feedback_mode=data.feedback_mode
     )
+
+
+@router.post("/generate/stream")
+def generate_feedback_stream_route(data: FeedbackRequest):
+    return StreamingResponse(
+        stream_feedback(
+            question=data.question,
+            answer=data.answer,
+            analysis=data.analysis,
+            feedback_mode=data.feedback_mode
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
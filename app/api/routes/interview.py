@@ -1,23 +1,32 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status, Request
+from fastapi.responses import StreamingResponse, JSONResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 from slowapi.util import get_remote_address
 from slowapi import Limiter
 from pydantic import BaseModel
-from typing import List, Dict
+from typing import List, Dict, Optional
 
-from app.db.database import get_db
-from app.db.models import Interview, User, QuestionAnswer
-from app.auth.dependencies import get_current_user
+from app.db.database import AsyncSessionLocal
+from app.db.models import Interview, QuestionAnswer, User
+from app.auth.dependencies import get_current_user, get_current_reader, get_read_db, require_ops
 from app.api.schemas import (
     InterviewRequest,
-    InterviewResponse,
-    AnswerResponse,
     InterviewHistoryResponse,
 )
-from app.api.services.analyzer_service import analyze_answer
-from app.api.services.feedback_service import generate_feedback
-from app.api.services.scoring_service import calculate_overall_score
+from app.api.services.evaluation_service import evaluate_answers
+from app.api.services.persistence_service import save_interview
+from app.api.services.history_service import get_history, InvalidCursorError
+from app.api.services.analytics_service import rollup_analytics, history_analytics, sql_analytics
+from app.api.services.streaming_service import stream_interview_evaluation
+from app.api.services.job_service import job_queue, QueueFullError
 from app.api.services.interview_service import generate_question
+from app.api.services.question_pool import question_pool
+from app.api.services.scoring_service import calculate_overall_score
+from app.ai.prompts import prompt_stats
+from app.ai.singleflight import model_flights
+from app.core.config import RATE_LIMIT_ENABLED, ANALYTICS_SOURCE
 
 
 router = APIRouter(prefix="/interview", tags=["interview"])
@@ -25,7 +34,7 @@ router = APIRouter(prefix="/interview", tags=["interview"])
 # ---------------------------------
 # Rate Limiter
 # ---------------------------------
-limiter = Limiter(key_func=get_remote_address)
+limiter = Limiter(key_func=get_remote_address, enabled=RATE_LIMIT_ENABLED)
 
 
 # =====================================================
@@ -40,18 +49,27 @@ class NextQuestionRequest(BaseModel):
 
 @router.post("/next-question")
 @limiter.limit("10/minute")
-def get_next_question(
+async def get_next_question(
     request: Request,
     data: NextQuestionRequest,
     current_user: User = Depends(get_current_user),
 ):
     try:
-        question = generate_question(
+        question = question_pool.get_question(
             role=data.role,
             experience_level=data.experience_level,
             history=data.history,
         )
 
+        if question is None:
+            # Model call on a miss; blocking, so off the event loop
+            question = await run_in_threadpool(
+                generate_question,
+                role=data.role,
+                experience_level=data.experience_level,
+                history=data.history,
+            )
+
         return {"question": question}
 
     except Exception:
@@ -67,10 +85,10 @@ def get_next_question(
 
 @router.post("/evaluate")
 @limiter.limit("5/minute")
-def evaluate_interview(
+async def evaluate_interview(
     request: Request,
     data: InterviewRequest,
-    db: Session = Depends(get_db),
+    job: bool = False,
     current_user: User = Depends(get_current_user),
 ):
     if not data.responses:
@@ -79,239 +97,172 @@ def evaluate_interview(
             detail="No responses provided",
         )
 
-    analysis_results = []
+    # Job mode: queue the evaluation and let the client poll for it
+    if job:
+        try:
+            queued = job_queue.submit(current_user.id, data.responses)
+        except QueueFullError:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Evaluation queue is full, try again later",
+            )
 
-    role = data.responses[0].role
-    level = data.responses[0].experience_level
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content={"job_id": queued.id, "status": queued.status},
+            headers={"Location": f"/interview/jobs/{queued.id}"},
+        )
 
-    interview = Interview(
-        role=role,
-        level=level,
-        score=0,
-        user_id=current_user.id,
-    )
+    # Run every analyze -> feedback pipeline before touching the DB; the
+    # session (and its pooled connection) only exists for the save
+    results = await run_in_threadpool(evaluate_answers, data.responses)
 
-    db.add(interview)
-    db.flush()
+    async with AsyncSessionLocal() as db:
+        return await db.run_sync(save_interview, current_user.id, data.responses, results)
 
-    # Save each Q&A
-    for item in data.responses:
-        analysis = analyze_answer(
-            question=item.question,
-            answer=item.answer,
-            role=item.role,
-            experience_level=item.experience_level,
-        )
 
-        feedback = generate_feedback(
-            question=item.question,
-            answer=item.answer,
-            analysis=analysis,
-            feedback_mode=item.feedback_mode,
+@router.post("/evaluate/stream")
+@limiter.limit("5/minute")
+async def evaluate_interview_stream(
+    request: Request,
+    data: InterviewRequest,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Server-Sent Events variant of /evaluate: emits each answer's
+    analysis and feedback as soon as it is ready, then the overall score.
+    """
+    if not data.responses:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No responses provided",
         )
 
-        analysis_results.append(analysis)
-
-        qa = QuestionAnswer(
-            interview_id=interview.id,
-            question=item.question,
-            answer=item.answer,
-            analysis=analysis,
-            feedback=feedback,
-        )
+    return StreamingResponse(
+        stream_interview_evaluation(data.responses, current_user.id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
-        db.add(qa)
 
-    overall_score = calculate_overall_score(analysis_results)
+def _heuristic_scores(answers: List[str]) -> List[dict]:
+    # numpy-backed; imported on first use to keep it out of cold starts
+    from app.api.services.heuristic_service import score_answers
 
-    interview.score = overall_score
+    return score_answers(answers)
 
-    db.commit()
-    db.refresh(interview)
 
-    responses = [
-        AnswerResponse(
-            question=qa.question,
-            answer=qa.answer,
-            analysis=qa.analysis,
-            feedback=qa.feedback,
+@router.post("/instant-score")
+@limiter.limit("30/minute")
+async def instant_score(
+    request: Request,
+    data: InterviewRequest,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Preliminary scores computed locally from text features, without
+    calling the model. Nothing is saved; use /evaluate for the real thing.
+    """
+    if not data.responses:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No responses provided",
         )
-        for qa in interview.answers
-    ]
+
+    # CPU-bound (and the first call imports numpy), so off the event loop
+    analyses = await run_in_threadpool(_heuristic_scores, [item.answer for item in data.responses])
 
     return {
-        "id": interview.id,
-        "role": interview.role,
-        "level": interview.level,
-        "score": dict(interview.score) if interview.score else None,
-        "created_at": str(interview.created_at),
+        "score": calculate_overall_score(analyses),
         "responses": [
-            {
-                "question": qa.question,
-                "answer": qa.answer,
-                "analysis": qa.analysis,
-                "feedback": qa.feedback,
-            }
-            for qa in interview.answers
-        ]
+            {"question": item.question, "analysis": analysis}
+            for item, analysis in zip(data.responses, analyses)
+        ],
     }
 
 
-# =====================================================
-# 3️⃣  Interview History
-# =====================================================
+@router.get("/jobs/stats", dependencies=[Depends(require_ops)])
+async def get_job_stats():
+    return job_queue.stats()
 
-@router.get("/history", response_model=InterviewHistoryResponse)
-def get_interview_history(
-    skip: int = 0,
-    limit: int = 10,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    interviews = (
-        db.query(Interview)
-        .filter(Interview.user_id == current_user.id)
-        .order_by(Interview.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
 
-    result = []
-
-    for interview in interviews:
-        result.append(
-            InterviewResponse(
-                id=interview.id,
-                role=interview.role,
-                level=interview.level,
-                score=interview.score,
-                created_at=str(interview.created_at),
-                responses=[
-                    AnswerResponse(
-                        question=qa.question,
-                        answer=qa.answer,
-                        analysis=qa.analysis,
-                        feedback=qa.feedback,
-                    )
-                    for qa in interview.answers
-                ],
-            )
-        )
+@router.get("/prompts/stats", dependencies=[Depends(require_ops)])
+async def get_prompt_stats():
+    return prompt_stats.stats()
 
-    return InterviewHistoryResponse(total=len(interviews), interviews=result)
 
+@router.get("/llm/stats", dependencies=[Depends(require_ops)])
+async def get_llm_stats():
+    return {"singleflight": model_flights.stats()}
 
-# =====================================================
-# 4️⃣  Analytics
-# =====================================================
 
-@router.get("/analytics")
-def get_analytics(
-    db: Session = Depends(get_db),
+@router.get("/jobs/{job_id}")
+async def get_job_status(
+    job_id: str,
     current_user: User = Depends(get_current_user),
 ):
-    interviews = (
-        db.query(Interview)
-        .filter(Interview.user_id == current_user.id)
-        .order_by(Interview.created_at.desc())
-        .all()
-    )
+    queued = job_queue.get(job_id)
 
-    if not interviews:
-        return {
-            "total_interviews": 0,
-            "average_score": 0,
-            "highest_score": 0,
-            "lowest_score": 0,
-            "roles_breakdown": {},
-            "questions_breakdown": {},
-        }
+    if queued is None or queued.user_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Job not found")
 
-    scores = [
-        i.score["overall_score"] if isinstance(i.score, dict)
-        else i.score
-        for i in interviews
-        if i.score is not None
-    ]
-
-    average_score = sum(scores) / len(scores) if scores else 0
-    highest_score = max(scores) if scores else 0
-    lowest_score = min(scores) if scores else 0
-
-    # Role breakdown
-    roles_breakdown = {}
-
-    for interview in interviews:
-        if interview.role not in roles_breakdown:
-            roles_breakdown[interview.role] = {
-                "attempts": 0,
-                "total_score": 0,
-                "average_score": 0,
-            }
-
-        if interview.score:
-            roles_breakdown[interview.role]["attempts"] += 1
-            roles_breakdown[interview.role]["total_score"] += interview.score["overall_score"]
-
-    for role, stats in roles_breakdown.items():
-        if stats["attempts"] > 0:
-            stats["average_score"] = round(
-                stats["total_score"] / stats["attempts"], 2
-            )
-        else:
-            stats["average_score"] = 0
+    return queued.to_dict()
 
-        del stats["total_score"]
 
-    # Question breakdown
-    questions_breakdown = {}
+# =====================================================
+# 3️⃣  Interview History
+# =====================================================
 
-    for interview in interviews:
-        for qa in interview.answers:
-            if qa.question not in questions_breakdown:
-                questions_breakdown[qa.question] = {
-                    "attempts": 0,
-                    "feedback_samples": [],
-                }
+@router.get("/history", response_model=InterviewHistoryResponse)
+async def get_interview_history(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_reader),
+):
+    try:
+        return await db.run_sync(get_history, current_user.id, skip=skip, limit=limit, cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-            questions_breakdown[qa.question]["attempts"] += 1
 
-            if qa.feedback:
-                questions_breakdown[qa.question]["feedback_samples"].append(
-                    qa.feedback
-                )
-                questions_breakdown[qa.question]["feedback_samples"] = (
-                    questions_breakdown[qa.question]["feedback_samples"][-3:]
-                )
+# =====================================================
+# 4️⃣  Analytics
+# =====================================================
 
-    return {
-        "total_interviews": len(interviews),
-        "average_score": round(average_score, 2),
-        "highest_score": highest_score,
-        "lowest_score": lowest_score,
-        "roles_breakdown": roles_breakdown,
-        "questions_breakdown": questions_breakdown,
-    }
+@router.get("/analytics")
+async def get_analytics(
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_reader),
+):
+    if ANALYTICS_SOURCE == "history":
+        return await db.run_sync(history_analytics, current_user.id)
+    if ANALYTICS_SOURCE == "sql":
+        return await db.run_sync(sql_analytics, current_user.id)
+
+    return await db.run_sync(rollup_analytics, current_user.id)
 
 # =====================================================
 # 5️⃣ Single Interview Analytics
 # =====================================================
 @router.get("/{interview_id}/analytics")
-def get_single_interview_analytics(
+async def get_single_interview_analytics(
     interview_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_reader),
 ):
-    interview = (
-        db.query(Interview)
-        .filter(Interview.id == interview_id, Interview.user_id == current_user.id)
-        .first()
+    interview = await db.scalar(
+        select(Interview).where(Interview.id == interview_id, Interview.user_id == current_user.id)
     )
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
 
-    responses = interview.answers
+    responses = (await db.execute(
+        select(QuestionAnswer.question, QuestionAnswer.feedback)
+        .where(QuestionAnswer.interview_id == interview.id)
+        .order_by(QuestionAnswer.id)
+    )).all()
     question_breakdown = {
         qa.question: {
             "feedback_samples": [qa.feedback] if qa.feedback else [],
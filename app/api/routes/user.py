@@ -1,12 +1,12 @@
 from fastapi import APIRouter, Depends
-from app.auth.dependencies import get_current_user
+from app.auth.dependencies import get_current_reader
 from app.db.models import User
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
 @router.get("/me")
-def read_current_user(current_user: User = Depends(get_current_user)):
+async def read_current_user(current_user: User = Depends(get_current_reader)):
     return {
         "id": current_user.id,
         "name": current_user.name,
@@ -40,3 +40,5 @@ class InterviewResponse(BaseModel):
 class InterviewHistoryResponse(BaseModel):
     total: int
     interviews: List[InterviewResponse] = Field(default_factory=list)
+    # Pass back as `cursor` for the next page; None on the last page
+    next_cursor: Optional[str] = None
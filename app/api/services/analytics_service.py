@@ -0,0 +1,257 @@
+from sqlalchemy import Text, and_, case, cast, func, select
+from sqlalchemy.orm import Session
+
+from app.api.services.rollup_service import score_value, FEEDBACK_SAMPLES
+from app.db.models import (
+    Interview,
+    QuestionAnswer,
+    UserAnalytics,
+    RoleAnalytics,
+    QuestionAnalytics,
+)
+
+
+def _empty_analytics() -> dict:
+    return {
+        "total_interviews": 0,
+        "average_score": 0,
+        "highest_score": 0,
+        "lowest_score": 0,
+        "roles_breakdown": {},
+        "questions_breakdown": {},
+    }
+
+
+def rollup_analytics(db: Session, user_id: int) -> dict:
+    """
+    A user's analytics read from the rollup tables: three indexed
+    lookups, however long the history is.
+
+    Users without a rollup row (interviews written before the rollups
+    were backfilled, or by something other than the app) are aggregated
+    by the database instead.
+    """
+    stats = db.get(UserAnalytics, user_id)
+    if stats is None:
+        return sql_analytics(db, user_id)
+    if not stats.total_interviews:
+        return _empty_analytics()
+
+    roles = (
+        db.query(RoleAnalytics.role, RoleAnalytics.attempts, RoleAnalytics.score_sum)
+        .filter(RoleAnalytics.user_id == user_id)
+        .order_by(RoleAnalytics.role)
+        .all()
+    )
+
+    questions = (
+        db.query(
+            QuestionAnalytics.question,
+            QuestionAnalytics.attempts,
+            QuestionAnalytics.feedback_samples,
+        )
+        .filter(QuestionAnalytics.user_id == user_id)
+        .order_by(QuestionAnalytics.last_seen_at.desc(), QuestionAnalytics.id.desc())
+        .all()
+    )
+
+    scored = stats.scored_interviews
+
+    return {
+        "total_interviews": stats.total_interviews,
+        "average_score": round(stats.score_sum / scored, 2) if scored else 0,
+        "highest_score": stats.score_max if scored else 0,
+        "lowest_score": stats.score_min if scored else 0,
+        "roles_breakdown": {
+            role.role: {
+                "attempts": role.attempts,
+                "average_score": round(role.score_sum / role.attempts, 2) if role.attempts else 0,
+            }
+            for role in roles
+        },
+        "questions_breakdown": {
+            question.question: {
+                "attempts": question.attempts,
+                "feedback_samples": question.feedback_samples or [],
+            }
+            for question in questions
+        },
+    }
+
+
+def history_analytics(db: Session, user_id: int) -> dict:
+    """
+    The same analytics computed by walking the user's whole history.
+    Kept to check the rollups against and for comparison benchmarks.
+    """
+    interviews = (
+        db.query(Interview)
+        .filter(Interview.user_id == user_id)
+        .order_by(Interview.created_at.desc(), Interview.id.desc())
+        .all()
+    )
+
+    if not interviews:
+        return _empty_analytics()
+
+    scores = [
+        value
+        for value in (score_value(i.score) for i in interviews)
+        if value is not None
+    ]
+
+    average_score = sum(scores) / len(scores) if scores else 0
+    highest_score = max(scores) if scores else 0
+    lowest_score = min(scores) if scores else 0
+
+    # Role breakdown
+    roles_breakdown = {}
+
+    for interview in interviews:
+        if interview.role not in roles_breakdown:
+            roles_breakdown[interview.role] = {
+                "attempts": 0,
+                "total_score": 0,
+                "average_score": 0,
+            }
+
+        value = score_value(interview.score)
+        if value is not None:
+            roles_breakdown[interview.role]["attempts"] += 1
+            roles_breakdown[interview.role]["total_score"] += value
+
+    for role, stats in roles_breakdown.items():
+        if stats["attempts"] > 0:
+            stats["average_score"] = round(
+                stats["total_score"] / stats["attempts"], 2
+            )
+        else:
+            stats["average_score"] = 0
+
+        del stats["total_score"]
+
+    # Question breakdown, newest first; samples keep the latest three
+    questions_breakdown = {}
+
+    for interview in interviews:
+        for qa in sorted(interview.answers, key=lambda qa: qa.id, reverse=True):
+            if qa.question not in questions_breakdown:
+                questions_breakdown[qa.question] = {
+                    "attempts": 0,
+                    "feedback_samples": [],
+                }
+
+            questions_breakdown[qa.question]["attempts"] += 1
+
+            samples = questions_breakdown[qa.question]["feedback_samples"]
+            if qa.feedback and len(samples) < FEEDBACK_SAMPLES:
+                samples.insert(0, qa.feedback)
+
+    return {
+        "total_interviews": len(interviews),
+        "average_score": round(average_score, 2),
+        "highest_score": highest_score,
+        "lowest_score": lowest_score,
+        "roles_breakdown": roles_breakdown,
+        "questions_breakdown": questions_breakdown,
+    }
+
+
+# ---------------- SQL PUSHDOWN ----------------
+
+def _has_feedback_expression(dialect: str):
+    """
+    True when `question_answers.feedback` is a non-empty object (JSON
+    null and {} count as no feedback, as they are falsy in Python).
+    """
+    typeof = func.jsonb_typeof if dialect == "postgresql" else func.json_type
+    return and_(
+        typeof(QuestionAnswer.feedback) == "object",
+        cast(QuestionAnswer.feedback, Text) != "{}",
+    )
+
+
+def sql_analytics(db: Session, user_id: int) -> dict:
+    """
+    The same analytics aggregated by the database: three queries that
+    return only final numbers and at most three feedback samples per
+    question, never whole interview or answer rows.
+
+    Works on PostgreSQL and on SQLite (JSON1 and window functions).
+    """
+    dialect = db.get_bind().dialect.name
+    score = Interview.overall_score
+
+    totals = db.execute(
+        select(
+            func.count(Interview.id),
+            func.count(score),
+            func.avg(score),
+            func.max(score),
+            func.min(score),
+        ).where(Interview.user_id == user_id)
+    ).one()
+
+    total, scored, average, highest, lowest = totals
+    if not total:
+        return _empty_analytics()
+
+    roles = db.execute(
+        select(Interview.role, func.count(score), func.avg(score))
+        .where(Interview.user_id == user_id)
+        .group_by(Interview.role)
+        .order_by(Interview.role)
+    ).all()
+
+    has_feedback = _has_feedback_expression(dialect)
+    by_question = (QuestionAnswer.question,)
+    recency = (Interview.created_at.desc(), Interview.id.desc(), QuestionAnswer.id.desc())
+
+    # Rank each question's answers newest first, separately for answers
+    # with and without feedback, so the top three of the first group are
+    # the samples and every question keeps at least one row
+    ranked = (
+        select(
+            QuestionAnswer.question,
+            case((has_feedback, QuestionAnswer.feedback)).label("feedback"),
+            func.count().over(partition_by=by_question).label("attempts"),
+            func.max(QuestionAnswer.id).over(partition_by=by_question).label("last_seen"),
+            func.row_number().over(
+                partition_by=(QuestionAnswer.question, has_feedback),
+                order_by=recency,
+            ).label("rank"),
+        )
+        .join(Interview, Interview.id == QuestionAnswer.interview_id)
+        .where(Interview.user_id == user_id)
+        .subquery()
+    )
+
+    samples = db.execute(
+        select(ranked.c.question, ranked.c.attempts, ranked.c.feedback)
+        .where(ranked.c.rank <= FEEDBACK_SAMPLES)
+        .order_by(ranked.c.last_seen.desc(), ranked.c.rank.desc())
+    ).all()
+
+    questions_breakdown = {}
+    for row in samples:
+        entry = questions_breakdown.setdefault(row.question, {
+            "attempts": row.attempts,
+            "feedback_samples": [],
+        })
+        if row.feedback is not None:
+            entry["feedback_samples"].append(row.feedback)
+
+    return {
+        "total_interviews": total,
+        "average_score": round(average, 2) if scored else 0,
+        "highest_score": highest if scored else 0,
+        "lowest_score": lowest if scored else 0,
+        "roles_breakdown": {
+            role: {
+                "attempts": attempts,
+                "average_score": round(role_average, 2) if attempts else 0,
+            }
+            for role, attempts, role_average in roles
+        },
+        "questions_breakdown": questions_breakdown,
+    }
@@ -1,61 +1,22 @@
 import json
-import requests
-import time
-import os
-import re
-from dotenv import load_dotenv
-
-load_dotenv()
-
-HF_API_TOKEN = os.getenv("HF_API_TOKEN")
-HF_MODEL = os.getenv("HF_MODEL") or "Qwen/Qwen2.5-7B-Instruct"
-MODEL_URL = "https://router.huggingface.co/v1/chat/completions"
-
-headers = {
-    "Authorization": f"Bearer {HF_API_TOKEN}",
-    "Content-Type": "application/json"
-}
-
-SYSTEM_PROMPT = """
-You are an expert interview evaluator.
-
-Evaluate the candidate based on:
-- Clarity of thought
-- Communication skills
-- Confidence
-- Structure of the answer
-- English language quality
-
-Focus on HOW the answer is delivered rather than technical correctness.
-Be strict but fair.
-Do NOT give identical scores unless truly deserved.
-Do NOT give 7+ unless the answer is structured and confident.
-Ensure newline characters inside strings are escaped using \\n.
-Return raw JSON only.
-Do NOT wrap JSON in markdown.
-
-STRICT RULES:
-- Return ONLY valid JSON
-- DO NOT add any explanation before or after
-- DO NOT use markdown
-- DO NOT write anything except JSON
-- Ensure all quotes are properly escaped
-
-FORMAT:
-{
-  "scores": {
-    "clarity": number,
-    "communication": number,
-    "confidence": number,
-    "structure": number,
-    "english": number
-  },
-  "strengths": "text",
-  "improvements": "text",
-  "suggested_rewrite": "text"
-}
-
-"""
+import logging
+
+from app.ai.client import complete_json
+from app.ai.cache import llm_cache, prompt_version
+from app.ai.providers import Provider, provider_pool
+from app.ai.prompts import (
+    ANALYSIS_SYSTEM_PROMPT,
+    analysis_user_prompt,
+    build_messages,
+    fit_answer,
+    max_output_tokens,
+)
+from app.ai.resilience import should_retry
+from app.core.config import HEURISTIC_FALLBACK
+from app.core.logger import get_logger, log_payload
+from app.core.metrics import llm_fallbacks, llm_parse_failures
+
+logger = get_logger(__name__)
 
 DEFAULT_RESPONSE = {
     "scores": {
@@ -71,117 +32,79 @@ DEFAULT_RESPONSE = {
 }
 
 
-def _clean_json(raw_text: str):
-    raw_text = raw_text.strip()
+def fallback_analysis(answer: str, error: str) -> dict:
+    """
+    Analysis used when the model cannot provide one: local heuristic
+    scores when enabled, otherwise the flat DEFAULT_RESPONSE.
+    """
+    llm_fallbacks.inc(task="analysis")
+
+    if HEURISTIC_FALLBACK:
+        # numpy is only loaded once a fallback is actually needed
+        from app.api.services.heuristic_service import score_answer
+        return {**score_answer(answer), "error": error}
+
+    return {**DEFAULT_RESPONSE, "error": error}
 
-    # Remove markdown fences
-    if raw_text.startswith("```"):
-        parts = raw_text.split("```")
-        if len(parts) >= 2:
-            raw_text = parts[1]
-        if raw_text.startswith("json"):
-            raw_text = raw_text[4:]
-        raw_text = raw_text.strip()
 
-    # Extract JSON block only
-    match = re.search(r"\{[\s\S]*\}", raw_text)
-    if match:
-        raw_text = match.group()
+PROMPT_VERSION = prompt_version(
+    ANALYSIS_SYSTEM_PROMPT,
+    analysis_user_prompt("{question}", "{answer}", "{role}", "{experience_level}"),
+)
 
-    # Remove problematic control characters
-    raw_text = raw_text.replace("\r", "")
-    raw_text = raw_text.replace("\t", " ")
 
-    return raw_text
+def analysis_cache_key(question: str, answer: str, role: str, experience_level: str, provider: Provider) -> str:
+    return llm_cache.make_key(
+        "analysis",
+        PROMPT_VERSION,
+        provider,
+        question=question,
+        answer=answer,
+        role=role,
+        experience_level=experience_level,
+    )
 
 
 def analyze_answer(question: str, answer: str, role: str, experience_level: str) -> dict:
 
-    user_prompt = f"""
-Interview Context:
-Role: {role}
-Experience Level: {experience_level}
-
-Question:
-{question}
-
-Candidate Answer:
-{answer}
-
-Return ONLY valid JSON in this format:
-
-{{
-  "scores": {{
-    "clarity": 1-10,
-    "communication": 1-10,
-    "confidence": 1-10,
-    "structure": 1-10,
-    "english": 1-10
-  }},
-  "strengths": "string",
-  "improvements": "string",
-  "suggested_rewrite": "string"
-}}
-"""
+    # Look up what the first-choice backend said; the call below tries
+    # backends in the same order
+    providers = provider_pool.order()
+    cached = llm_cache.get(analysis_cache_key(question, answer, role, experience_level, providers[0]))
+    if cached is not None:
+        return cached
+
+    user_prompt = analysis_user_prompt(question, fit_answer(answer), role, experience_level)
+    max_tokens = max_output_tokens("analysis", answer)
 
     for attempt in range(2):
         try:
-            response = requests.post(
-                MODEL_URL,
-                headers=headers,
-                json={
-                    "model": HF_MODEL,
-                    "messages": [
-                        {"role": "system", "content": SYSTEM_PROMPT},
-                        {"role": "user", "content": user_prompt}
-                    ],
-                    "max_tokens": 600,
-                    "temperature": 0.3
-                },
-                timeout=90
+            cleaned, provider = complete_json(
+                messages=build_messages("analysis", ANALYSIS_SYSTEM_PROMPT, user_prompt, max_tokens),
+                max_tokens=max_tokens,
+                temperature=0.3,
+                timeout=90,
+                task="analysis",
+                providers=providers,
             )
-
-            print("HF STATUS:", response.status_code)
-            print("HF RAW:", response.text)
-
-            if response.status_code != 200:
-                raise Exception(f"HF API error {response.status_code}: {response.text}")
-
-            result = response.json()
-
-            if "choices" not in result or not result["choices"]:
-                raise Exception(f"No choices returned: {result}")
-
-            choice = result["choices"][0]
-
-            if "message" not in choice or "content" not in choice["message"]:
-                raise Exception(f"Malformed response structure: {choice}")
-
-            raw_text = choice["message"]["content"]
-
-            cleaned = _clean_json(raw_text)
-            print("CLEANED:", cleaned)
+            log_payload(logger, "Model output", cleaned, task="analysis")
 
             # strict=False prevents control character crash
             try:
                 parsed = json.loads(cleaned, strict=False)
             except Exception as e:
-                print("JSON PARSE FAILED:", cleaned)
+                llm_parse_failures.inc(task="analysis")
+                log_payload(logger, "JSON parse failed", cleaned, level=logging.WARNING, sample_rate=1, task="analysis")
                 raise e
             # Ensure required fields exist
             if "scores" not in parsed:
-                return {
-                    **DEFAULT_RESPONSE,
-                    "error": "MODEL_FAILED"
-                }
+                llm_parse_failures.inc(task="analysis")
+                return fallback_analysis(answer, "MODEL_FAILED")
 
+            llm_cache.set(analysis_cache_key(question, answer, role, experience_level, provider), parsed)
             return parsed
 
         except Exception as e:
-            print("REAL ERROR:", e)
-            if attempt == 1:
-                return {
-                    **DEFAULT_RESPONSE,
-                    "error": str(e)
-                }
-            time.sleep(1)
+            logger.warning("Analysis failed", extra={"attempt": attempt, "error": str(e)})
+            if attempt == 1 or not should_retry(e, "analysis"):
+                return fallback_analysis(answer, str(e))
@@ -0,0 +1,194 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from app.ai.client import complete_json
+from app.api.schemas import AnswerInput
+from app.ai.cache import llm_cache
+from app.ai.providers import provider_pool
+from app.ai.prompts import (
+    BATCH_SYSTEM_PROMPT,
+    batch_answer_block,
+    build_messages,
+    count_tokens,
+    fit_answer,
+)
+from app.api.services.analyzer_service import analyze_answer, analysis_cache_key
+from app.core.config import EVAL_BATCH_SIZE, EVAL_BATCH_TOKEN_BUDGET, EVAL_CONCURRENCY
+from app.core.logger import get_logger
+from app.core.metrics import llm_parse_failures
+
+logger = get_logger(__name__)
+
+SCORE_KEYS = ["clarity", "communication", "confidence", "structure", "english"]
+
+# Rough completion size of one analysis object
+OUTPUT_TOKENS_PER_ANSWER = 250
+
+
+def _answer_block(index: int, item: AnswerInput) -> str:
+    return batch_answer_block(index, item.role, item.experience_level, item.question, fit_answer(item.answer))
+
+
+def chunk_answers(
+    items: List[AnswerInput],
+    batch_size: int = EVAL_BATCH_SIZE,
+    token_budget: int = EVAL_BATCH_TOKEN_BUDGET,
+) -> List[List[int]]:
+    """
+    Group answer indexes into batches of at most `batch_size`, closing a
+    batch early when its estimated prompt + completion tokens would
+    exceed `token_budget`. Every batch holds at least one answer.
+    """
+    base = count_tokens(BATCH_SYSTEM_PROMPT)
+    chunks = []
+    current = []
+    used = base
+
+    for index, item in enumerate(items):
+        cost = count_tokens(_answer_block(index, item)) + OUTPUT_TOKENS_PER_ANSWER
+
+        if current and (len(current) >= batch_size or used + cost > token_budget):
+            chunks.append(current)
+            current = []
+            used = base
+
+        current.append(index)
+        used += cost
+
+    if current:
+        chunks.append(current)
+
+    return chunks
+
+
+def _valid_analysis(entry) -> bool:
+    if not isinstance(entry, dict):
+        return False
+
+    scores = entry.get("scores")
+    if not isinstance(scores, dict):
+        return False
+
+    return all(isinstance(scores.get(k), (int, float)) for k in SCORE_KEYS)
+
+
+def _request_batch(items: List[AnswerInput], indexes: List[int]) -> dict:
+    """
+    Ask the model to analyze every answer in `indexes` at once.
+    Returns {index: analysis} for the items that came back well-formed.
+    """
+    user_prompt = "Candidate Answers:\n"
+    user_prompt += "".join(_answer_block(i, items[i]) for i in indexes)
+    user_prompt += "\nReturn ONLY valid JSON."
+
+    max_tokens = OUTPUT_TOKENS_PER_ANSWER * len(indexes) + 100
+
+    json_text, _ = complete_json(
+        messages=build_messages("batch", BATCH_SYSTEM_PROMPT, user_prompt, max_tokens),
+        max_tokens=max_tokens,
+        temperature=0.3,
+        timeout=90,
+        task="batch"
+    )
+
+    try:
+        parsed = json.loads(json_text, strict=False)
+    except Exception:
+        llm_parse_failures.inc(task="batch")
+        raise
+
+    entries = parsed.get("results") if isinstance(parsed, dict) else None
+    if not isinstance(entries, list):
+        llm_parse_failures.inc(task="batch")
+        raise Exception("Batch output has no results array")
+
+    analyses = {}
+    for entry in entries:
+        if not _valid_analysis(entry):
+            continue
+
+        try:
+            index = int(entry.pop("index"))
+        except (KeyError, TypeError, ValueError):
+            continue
+
+        if index in indexes and index not in analyses:
+            analyses[index] = entry
+
+    return analyses
+
+
+def _analyze_chunk(items: List[AnswerInput], indexes: List[int]) -> dict:
+    analyses = {}
+
+    try:
+        analyses = _request_batch(items, indexes)
+    except Exception as e:
+        logger.warning("Batch request failed", extra={"answers": len(indexes), "error": str(e)})
+
+    # Missing or malformed items go through the single-answer path
+    for index in indexes:
+        if index not in analyses:
+            item = items[index]
+            analyses[index] = analyze_answer(
+                question=item.question,
+                answer=item.answer,
+                role=item.role,
+                experience_level=item.experience_level,
+            )
+
+    return analyses
+
+
+def analyze_batch(
+    items: List[AnswerInput],
+    batch_size: Optional[int] = None,
+    token_budget: Optional[int] = None,
+) -> List[dict]:
+    """
+    Analyze all answers using as few model calls as the batch size and
+    token budget allow. Returns analyses in input order.
+    """
+    if not items:
+        return []
+
+    # Answers already analyzed on the single-answer path skip the batch
+    merged = {}
+    provider = provider_pool.order()[0]
+    for index, item in enumerate(items):
+        cached = llm_cache.get(
+            analysis_cache_key(item.question, item.answer, item.role, item.experience_level, provider)
+        )
+        if cached is not None:
+            merged[index] = cached
+
+    pending = [i for i in range(len(items)) if i not in merged]
+    if not pending:
+        return [merged[i] for i in range(len(items))]
+
+    chunks = [
+        [pending[i] for i in chunk]
+        for chunk in chunk_answers(
+            [items[i] for i in pending],
+            batch_size=batch_size or EVAL_BATCH_SIZE,
+            token_budget=token_budget or EVAL_BATCH_TOKEN_BUDGET,
+        )
+    ]
+
+    start = time.perf_counter()
+    workers = max(1, min(EVAL_CONCURRENCY, len(chunks)))
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch") as executor:
+        results = list(executor.map(lambda indexes: _analyze_chunk(items, indexes), chunks))
+
+    logger.info(
+        "Batch analysis finished",
+        extra={"answers": len(pending), "requests": len(chunks), "seconds": round(time.perf_counter() - start, 2)},
+    )
+
+    for analyses in results:
+        merged.update(analyses)
+
+    return [merged[i] for i in range(len(items))]
@@ -0,0 +1,136 @@
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Iterator, List, Optional, Tuple
+
+from app.api.schemas import AnswerInput
+from app.api.services.analyzer_service import analyze_answer, fallback_analysis
+from app.api.services.feedback_service import generate_feedback, fallback_feedback
+from app.api.services.fused_service import analyze_and_feedback
+from app.api.services.batch_service import analyze_batch
+from app.core.config import EVAL_CONCURRENCY, EVAL_MODE
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _analyze(item: AnswerInput) -> dict:
+    try:
+        return analyze_answer(
+            question=item.question,
+            answer=item.answer,
+            role=item.role,
+            experience_level=item.experience_level,
+        )
+    except Exception as e:
+        logger.error("Evaluation failed", extra={"error": str(e)})
+        return fallback_analysis(item.answer, str(e))
+
+
+def _feedback(item: AnswerInput, analysis: dict) -> dict:
+    try:
+        return generate_feedback(
+            question=item.question,
+            answer=item.answer,
+            analysis=analysis,
+            feedback_mode=item.feedback_mode,
+        )
+    except Exception as e:
+        logger.error("Evaluation failed", extra={"error": str(e)})
+        return fallback_feedback(item.answer)
+
+
+def evaluate_answer(item: AnswerInput, mode: str = None) -> Tuple[dict, dict]:
+    """
+    Run the analyze -> feedback pipeline for a single answer.
+    Never raises: failures fall back to the default analysis/feedback
+    so one bad answer does not sink the whole interview.
+    """
+    mode = mode or EVAL_MODE
+
+    if mode == "fused":
+        try:
+            return analyze_and_feedback(
+                question=item.question,
+                answer=item.answer,
+                role=item.role,
+                experience_level=item.experience_level,
+                feedback_mode=item.feedback_mode,
+            )
+        except Exception as e:
+            logger.error("Evaluation failed", extra={"error": str(e)})
+            return (
+                fallback_analysis(item.answer, str(e)),
+                fallback_feedback(item.answer),
+            )
+
+    analysis = _analyze(item)
+    return analysis, _feedback(item, analysis)
+
+
+def iter_evaluations(
+    items: List[AnswerInput],
+    mode: str = None,
+    heartbeat: Optional[float] = None,
+) -> Iterator[Optional[Tuple[int, dict, dict]]]:
+    """
+    Yield (index, analysis, feedback) for each answer as soon as it is
+    ready, in completion order. With `heartbeat` set, yields None every
+    `heartbeat` seconds that pass without a result so callers can keep
+    a connection alive.
+    """
+    if not items:
+        return
+
+    mode = mode or EVAL_MODE
+    workers = max(1, min(EVAL_CONCURRENCY, len(items)))
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="evaluate")
+
+    try:
+        if mode == "batch":
+            batch = executor.submit(analyze_batch, items)
+            while not wait([batch], timeout=heartbeat).done:
+                yield None
+
+            try:
+                analyses = batch.result()
+            except Exception as e:
+                logger.error("Evaluation failed", extra={"error": str(e)})
+                analyses = [_analyze(item) for item in items]
+
+            futures = {
+                executor.submit(lambda i: (analyses[i], _feedback(items[i], analyses[i])), i): i
+                for i in range(len(items))
+            }
+        else:
+            futures = {
+                executor.submit(evaluate_answer, item, mode): i
+                for i, item in enumerate(items)
+            }
+
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=heartbeat, return_when=FIRST_COMPLETED)
+
+            if not done:
+                yield None
+                continue
+
+            for future in done:
+                analysis, feedback = future.result()
+                yield futures[future], analysis, feedback
+
+    finally:
+        # Stop queued work if the consumer goes away early
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def evaluate_answers(items: List[AnswerInput], mode: str = None) -> List[Tuple[dict, dict]]:
+    """
+    Evaluate all answers concurrently, at most EVAL_CONCURRENCY at a time.
+    Results are returned in input order.
+    """
+    results = [None] * len(items)
+
+    for index, analysis, feedback in iter_evaluations(items, mode):
+        results[index] = (analysis, feedback)
+
+    return results
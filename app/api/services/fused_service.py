@@ -0,0 +1,122 @@
+import json
+from typing import Tuple
+
+from app.ai.client import complete_json
+from app.ai.cache import llm_cache, prompt_version
+from app.ai.providers import Provider, provider_pool
+from app.ai.prompts import (
+    FUSED_SYSTEM_PROMPT,
+    fused_user_prompt,
+    build_messages,
+    fit_answer,
+    max_output_tokens,
+)
+from app.ai.resilience import should_retry
+from app.api.services.analyzer_service import fallback_analysis
+from app.api.services.feedback_service import (
+    fallback_feedback,
+    model_feedback,
+    validate_feedback,
+)
+from app.core.logger import get_logger
+from app.core.metrics import llm_parse_failures
+
+logger = get_logger(__name__)
+
+def _split(parsed: dict) -> Tuple[dict, dict]:
+    """
+    Split a fused model response back into the analysis and feedback
+    shapes stored on QuestionAnswer.
+    """
+    if not isinstance(parsed, dict):
+        raise Exception("Fused output must be a JSON object")
+
+    analysis = parsed.get("analysis")
+    feedback = parsed.get("feedback")
+
+    if not isinstance(analysis, dict) or not isinstance(analysis.get("scores"), dict):
+        raise Exception("Missing analysis scores")
+
+    return analysis, feedback
+
+
+PROMPT_VERSION = prompt_version(
+    FUSED_SYSTEM_PROMPT,
+    fused_user_prompt("{question}", "{answer}", "{role}", "{experience_level}", "{feedback_mode}"),
+)
+
+
+def analyze_and_feedback(
+    question: str,
+    answer: str,
+    role: str,
+    experience_level: str,
+    feedback_mode: str = "harsh",
+) -> Tuple[dict, dict]:
+    """
+    Produce analysis and feedback for one answer with a single model call.
+    If only the feedback half is unusable, it is regenerated with the
+    regular feedback call so the scores are not thrown away.
+    """
+
+    def cache_key(provider: Provider) -> str:
+        return llm_cache.make_key(
+            "fused",
+            PROMPT_VERSION,
+            provider,
+            question=question,
+            answer=answer,
+            role=role,
+            experience_level=experience_level,
+            feedback_mode=feedback_mode,
+        )
+
+    providers = provider_pool.order()
+    cached = llm_cache.get(cache_key(providers[0]))
+    if cached is not None:
+        return cached["analysis"], cached["feedback"]
+
+    user_prompt = fused_user_prompt(question, fit_answer(answer), role, experience_level, feedback_mode)
+    max_tokens = max_output_tokens("fused", answer)
+
+    for attempt in range(2):
+        try:
+            json_text, provider = complete_json(
+                messages=build_messages("fused", FUSED_SYSTEM_PROMPT, user_prompt, max_tokens),
+                max_tokens=max_tokens,
+                temperature=0.3,
+                timeout=90,
+                task="fused",
+                providers=providers,
+            )
+
+            try:
+                analysis, feedback = _split(json.loads(json_text, strict=False))
+            except Exception:
+                llm_parse_failures.inc(task="fused")
+                raise
+
+            try:
+                validate_feedback(feedback)
+            except Exception as e:
+                llm_parse_failures.inc(task="fused")
+                logger.warning("Fused feedback invalid, regenerating", extra={"error": str(e)})
+                feedback = model_feedback(
+                    question=question,
+                    answer=answer,
+                    analysis=analysis,
+                    feedback_mode=feedback_mode,
+                )
+
+                if feedback is None:
+                    # Keep the scores but do not cache the pair, so the
+                    # next identical request asks the model again
+                    return analysis, fallback_feedback(answer)
+
+            llm_cache.set(cache_key(provider), {"analysis": analysis, "feedback": feedback})
+            return analysis, feedback
+
+        except Exception as e:
+            logger.warning("Fused evaluation failed", extra={"attempt": attempt, "error": str(e)})
+            if attempt == 1 or not should_retry(e, "fused"):
+                return fallback_analysis(answer, str(e)), fallback_feedback(answer)
@@ -0,0 +1,174 @@
+import re
+from typing import List, Sequence
+
+import numpy as np
+
+# ---------------------------------
+# Lexicons
+# ---------------------------------
+
+FILLERS = [
+    "um", "uh", "erm", "like", "basically", "actually", "literally",
+    "you know", "kind of", "sort of", "i mean", "stuff", "things",
+]
+
+HEDGES = [
+    "maybe", "perhaps", "i think", "i guess", "probably", "might",
+    "not sure", "i believe", "somewhat", "possibly", "i suppose", "hopefully",
+]
+
+CONNECTIVES = [
+    "first", "second", "third", "then", "next", "finally", "because",
+    "therefore", "so that", "for example", "for instance", "however",
+    "as a result", "in summary", "overall",
+]
+
+# Situation / Task / Action / Result markers
+STAR_MARKERS = [
+    ["when i", "at my", "in my previous", "in my last", "situation", "project", "we had", "our team"],
+    ["my task", "my role", "i was responsible", "goal", "needed to", "had to", "challenge"],
+    ["i implemented", "i built", "i designed", "i decided", "i used", "i wrote", "i led", "i created", "i fixed", "i added"],
+    ["as a result", "resulted", "reduced", "improved", "increased", "saved", "%", "faster", "outcome"],
+]
+
+CATEGORIES = ["clarity", "communication", "confidence", "structure", "english"]
+
+
+def _phrase_pattern(phrases: Sequence[str]) -> re.Pattern:
+    escaped = sorted((re.escape(p) for p in phrases), key=len, reverse=True)
+    return re.compile(r"(?<![a-z])(?:" + "|".join(escaped) + r")(?![a-z])")
+
+
+_WORD = re.compile(r"[A-Za-z']+")
+_SENTENCE = re.compile(r"[^.!?]+[.!?]*")
+_VOWEL_GROUPS = re.compile(r"[aeiouy]+")
+_FILLERS = _phrase_pattern(FILLERS)
+_HEDGES = _phrase_pattern(HEDGES)
+_CONNECTIVES = _phrase_pattern(CONNECTIVES)
+_STAR = [re.compile("|".join(re.escape(m) for m in markers)) for markers in STAR_MARKERS]
+
+FEATURES = [
+    "words", "sentences", "avg_sentence_len", "avg_word_len", "syllables_per_word",
+    "type_token", "filler_rate", "hedge_rate", "connectives", "star_coverage",
+    "capitalized_ratio", "first_person_rate",
+]
+
+
+def _features(answer: str) -> List[float]:
+    text = answer.strip()
+    lower = text.lower()
+
+    words = _WORD.findall(lower)
+    n_words = max(len(words), 1)
+
+    sentences = [s.strip() for s in _SENTENCE.findall(text) if s.strip()]
+    n_sentences = max(len(sentences), 1)
+
+    capitalized = sum(1 for s in sentences if s[0].isupper())
+    syllables = sum(max(1, len(_VOWEL_GROUPS.findall(w))) for w in words)
+
+    return [
+        len(words),
+        len(sentences),
+        len(words) / n_sentences,
+        sum(len(w) for w in words) / n_words,
+        syllables / n_words,
+        len(set(words)) / n_words,
+        len(_FILLERS.findall(lower)) / n_words,
+        len(_HEDGES.findall(lower)) / n_words,
+        len(_CONNECTIVES.findall(lower)),
+        sum(1 for pattern in _STAR if pattern.search(lower)),
+        capitalized / n_sentences,
+        sum(1 for w in words if w in ("i", "i'm", "i've", "my", "we")) / n_words,
+    ]
+
+
+def feature_matrix(answers: Sequence[str]) -> np.ndarray:
+    """
+    One row of text features per answer, columns as in FEATURES.
+    """
+    if not answers:
+        return np.zeros((0, len(FEATURES)))
+
+    return np.array([_features(a) for a in answers], dtype=float)
+
+
+def _band(values: np.ndarray, low: float, high: float, spread: float) -> np.ndarray:
+    """
+    1.0 inside [low, high], falling off linearly to 0 over `spread` outside it.
+    """
+    below = np.clip((low - values) / spread, 0, 1)
+    above = np.clip((values - high) / spread, 0, 1)
+    return 1 - np.maximum(below, above)
+
+
+def score_matrix(features: np.ndarray) -> np.ndarray:
+    """
+    Vectorized 1-10 scores (columns as in CATEGORIES) for a feature matrix.
+    """
+    f = {name: features[:, i] for i, name in enumerate(FEATURES)}
+
+    # Flesch reading ease
+    flesch = 206.835 - 1.015 * f["avg_sentence_len"] - 84.6 * f["syllables_per_word"]
+
+    length = _band(f["words"], 40, 90, 35)
+    readability = _band(flesch, 50, 80, 40)
+    sentence_len = _band(f["avg_sentence_len"], 10, 22, 12)
+    fillers = np.clip(1 - f["filler_rate"] * 12, 0, 1)
+    hedges = np.clip(1 - f["hedge_rate"] * 15, 0, 1)
+    star = f["star_coverage"] / len(STAR_MARKERS)
+    connectives = np.clip(f["connectives"] / 3, 0, 1)
+    multi_sentence = np.clip((f["sentences"] - 1) / 3, 0, 1)
+    vocabulary = _band(f["type_token"], 0.55, 0.9, 0.3)
+    word_len = _band(f["avg_word_len"], 4.0, 5.8, 1.5)
+    ownership = np.clip(f["first_person_rate"] * 15, 0, 1)
+
+    clarity = 0.35 * readability + 0.3 * sentence_len + 0.2 * fillers + 0.15 * length
+    structure = 0.45 * star + 0.3 * connectives + 0.25 * multi_sentence
+    confidence = 0.45 * hedges + 0.3 * fillers + 0.25 * ownership
+    english = 0.3 * vocabulary + 0.25 * word_len + 0.25 * f["capitalized_ratio"] + 0.2 * readability
+    communication = 0.4 * length + 0.3 * clarity + 0.3 * english
+
+    raw = np.stack([clarity, communication, confidence, structure, english], axis=1)
+
+    # Very short answers cannot score well on anything
+    raw *= np.clip(f["words"] / 15, 0.3, 1)[:, None]
+
+    # Capped at 9: a text heuristic should not hand out a perfect score
+    return np.clip(np.rint(1 + raw * 8), 1, 9)
+
+
+def _comments(scores: dict) -> tuple:
+    strongest = max(scores, key=scores.get)
+    weakest = min(scores, key=scores.get)
+
+    strengths = f"Preliminary estimate: {strongest} is the strongest aspect of this answer."
+    improvements = f"Preliminary estimate: work on {weakest} first."
+    return strengths, improvements
+
+
+def score_answers(answers: Sequence[str]) -> List[dict]:
+    """
+    Instant, CPU-only analyses for a batch of answers in one pass.
+    Same shape as the model analysis, marked with "source": "heuristic".
+    """
+    scores = score_matrix(feature_matrix(answers))
+    results = []
+
+    for row in scores:
+        row_scores = {cat: int(value) for cat, value in zip(CATEGORIES, row)}
+        strengths, improvements = _comments(row_scores)
+
+        results.append({
+            "scores": row_scores,
+            "strengths": strengths,
+            "improvements": improvements,
+            "suggested_rewrite": "Use a clear structure: situation, what you did, and the result.",
+            "source": "heuristic",
+        })
+
+    return results
+
+
+def score_answer(answer: str) -> dict:
+    return score_answers([answer])[0]
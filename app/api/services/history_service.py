@@ -0,0 +1,123 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session
+
+from app.db.models import Interview, QuestionAnswer
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(created_at: datetime, interview_id: int) -> str:
+    raw = json.dumps([created_at.isoformat(), interview_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, interview_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(interview_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise InvalidCursorError("Invalid history cursor") from e
+
+
+def get_history(
+    db: Session,
+    user_id: int,
+    skip: int = 0,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+) -> dict:
+    """
+    One page of a user's interviews with their answers, newest first,
+    plus the user's total interview count and a `next_cursor`.
+
+    With `cursor` the page starts right after the interview it points
+    at (keyset on created_at, id), so the cost does not grow with depth
+    and rows arriving between pages do not shift it. Without one,
+    `skip` is used as before.
+
+    Always three queries (count, page, answers for the page) however
+    large the page is, and plain dicts instead of ORM objects.
+    """
+    total = (
+        db.query(func.count(Interview.id))
+        .filter(Interview.user_id == user_id)
+        .scalar()
+    )
+
+    query = (
+        db.query(
+            Interview.id,
+            Interview.role,
+            Interview.level,
+            Interview.score,
+            Interview.created_at,
+        )
+        .filter(Interview.user_id == user_id)
+        .order_by(Interview.created_at.desc(), Interview.id.desc())
+    )
+
+    if cursor:
+        after_created, after_id = decode_cursor(cursor)
+        query = query.filter(or_(
+            Interview.created_at < after_created,
+            and_(Interview.created_at == after_created, Interview.id < after_id),
+        ))
+    else:
+        query = query.offset(skip)
+
+    # One extra row tells whether there is a next page
+    rows = query.limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        if rows:
+            next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    interviews = []
+    by_id = {}
+
+    for row in rows:
+        entry = {
+            "id": row.id,
+            "role": row.role,
+            "level": row.level,
+            "score": row.score,
+            "created_at": str(row.created_at),
+            "responses": [],
+        }
+        interviews.append(entry)
+        by_id[row.id] = entry
+
+    if by_id:
+        answers = (
+            db.query(
+                QuestionAnswer.interview_id,
+                QuestionAnswer.question,
+                QuestionAnswer.answer,
+                QuestionAnswer.analysis,
+                QuestionAnswer.feedback,
+            )
+            .filter(QuestionAnswer.interview_id.in_(list(by_id)))
+            .order_by(QuestionAnswer.interview_id, QuestionAnswer.id)
+            .all()
+        )
+
+        for qa in answers:
+            by_id[qa.interview_id]["responses"].append({
+                "question": qa.question,
+                "answer": qa.answer,
+                "analysis": qa.analysis,
+                "feedback": qa.feedback,
+            })
+
+    return {"total": total, "interviews": interviews, "next_cursor": next_cursor}
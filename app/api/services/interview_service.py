@@ -1,47 +1,17 @@
-import os
-import requests
-from dotenv import load_dotenv
-from typing import List, Dict
+from typing import List, Dict, Optional
 import random
 
-load_dotenv()
-
-HF_API_TOKEN = os.getenv("HF_API_TOKEN")
-HF_MODEL = os.getenv("HF_MODEL") or "Qwen/Qwen2.5-7B-Instruct"
-MODEL_URL = "https://router.huggingface.co/v1/chat/completions"
-
-headers = {
-    "Authorization": f"Bearer {HF_API_TOKEN}",
-    "Content-Type": "application/json"
-}
-
-SYSTEM_PROMPT = """
-You are a STRICT professional interviewer.
-
-CRITICAL RULES:
-- Ask ONLY ONE question.
-- NEVER repeat any previous question.
-- NO generic HR questions unless it's the first question.
-- Questions MUST be ROLE-SPECIFIC and TECHNICAL wherever possible.
-- Increase difficulty gradually.
-- Avoid vague questions like:
-  - "Tell me about yourself"
-  - "What are your strengths?"
-  - "Describe a challenge"
-- Focus on REAL interview-style grilling questions.
-
-GOOD EXAMPLES:
-- "Explain how React's reconciliation works."
-- "How would you design a scalable REST API?"
-- "What indexing strategy would you use for a large dataset?"
-
-BAD EXAMPLES:
-- "Tell me about yourself"
-- "What is your biggest achievement?"
-
-OUTPUT:
-Return ONLY the question text.
-"""
+from app.ai.client import chat_completion
+from app.core.logger import get_logger, log_payload
+from app.core.metrics import llm_fallbacks
+from app.ai.prompts import (
+    QUESTION_SYSTEM_PROMPT,
+    QUESTION_PROMPT_PREFIX,
+    question_user_prompt,
+    build_messages,
+    max_output_tokens,
+)
+logger = get_logger(__name__)
 
 FALLBACK_QUESTIONS = {
     "Software Engineer": [
@@ -57,37 +27,6 @@ FALLBACK_QUESTIONS = {
 }
 
 
-def _build_prompt(role: str, experience_level: str, history: List[Dict]) -> str:
-    asked_questions = "\n".join([f"- {h['question']}" for h in history if "question" in h])
-
-    conversation = ""
-    for turn in history[-5:]:
-        if "question" in turn and "answer" in turn:
-            conversation += f"\nInterviewer: {turn['question']}\n"
-            conversation += f"Candidate: {turn['answer']}\n"
-
-    return f"""
-You are conducting a REALISTIC TECHNICAL INTERVIEW.
-
-ROLE: {role}
-EXPERIENCE LEVEL: {experience_level}
-
-STRICT INSTRUCTIONS:
-- Ask ROLE-SPECIFIC questions for {role}
-- Avoid HR/general questions
-- Ask practical, scenario-based or technical questions
-- Increase difficulty gradually
-- DO NOT repeat questions
-
-ALREADY ASKED QUESTIONS:
-{asked_questions}
-
-CONVERSATION:
-{conversation}
-
-Now ask the NEXT QUESTION.
-"""
-
 def _fallback_question(role: str, history: List[Dict]) -> str:
     role = role.lower()
 
@@ -145,42 +84,50 @@ def _fallback_question(role: str, history: List[Dict]) -> str:
     return random.choice(available)
 
 
-def generate_question(role: str, experience_level: str, history: List[Dict]) -> str:
+def request_question(
+    role: str,
+    experience_level: str,
+    history: List[Dict],
+    difficulty: Optional[str] = None,
+) -> str:
+    """
+    Ask the model for the next question. Raises on any failure.
+    """
+    user_prompt, compressed = question_user_prompt(role, experience_level, history, difficulty)
+    max_tokens = max_output_tokens("question")
+
+    question = chat_completion(
+        messages=build_messages(
+            "question",
+            QUESTION_SYSTEM_PROMPT,
+            user_prompt,
+            max_tokens,
+            static_prefix=QUESTION_PROMPT_PREFIX,
+            compressed=compressed,
+        ),
+        max_tokens=max_tokens,
+        temperature=0.6,
+        timeout=30,
+        task="question"
+    ).strip()
+    log_payload(logger, "Generated question", question, task="question")
+
+    if not question or len(question) < 10:
+        raise Exception(f"Question too short: {question!r}")
+
+    # Older questions may have been summarized out of the prompt
+    if any(question == h.get("question") for h in history):
+        raise Exception(f"Question repeated: {question!r}")
+
+    return question
+
 
-    user_prompt = _build_prompt(role, experience_level, history)
+def generate_question(role: str, experience_level: str, history: List[Dict]) -> str:
 
     try:
-        response = requests.post(
-            MODEL_URL,
-            headers=headers,
-            json={
-                "model": HF_MODEL,
-                "messages": [
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt}
-                ],
-                "max_tokens": 200,
-                "temperature": 0.6
-            },
-            timeout=30
-        )
-
-        if response.status_code != 200:
-            raise Exception(f"HF API error {response.status_code}: {response.text}")
-
-        result = response.json()
-        try:
-            question = result["choices"][0]["message"]["content"].strip()
-            print("Generated Question:", question)
-        except Exception as e:
-            print("PARSE ERROR:", e)
-            return _fallback_question(role, history)
-
-        if not question or len(question) < 10:
-            return _fallback_question(role, history)
-
-        return question
+        return request_question(role, experience_level, history)
 
     except Exception as e:
-        print(f"[ERROR] Question generation failed: {e}")
+        logger.warning("Question generation failed", extra={"error": str(e)})
+        llm_fallbacks.inc(task="question")
         return _fallback_question(role, history)
@@ -0,0 +1,230 @@
+import queue
+import threading
+import time
+import uuid
+from collections import deque
+from typing import List, Optional
+
+from app.api.schemas import AnswerInput
+from app.api.services.evaluation_service import iter_evaluations
+from app.api.services.persistence_service import save_interview
+from app.core.config import EVAL_JOB_WORKERS, EVAL_JOB_QUEUE_SIZE, EVAL_JOB_TTL
+from app.core.logger import get_logger
+from app.core.metrics import registry, Gauge, job_duration, job_wait_time
+from app.db.database import SessionLocal
+
+logger = get_logger(__name__)
+
+
+class QueueFullError(Exception):
+    pass
+
+
+class EvaluationJob:
+    def __init__(self, user_id: int, items: List[AnswerInput]):
+        self.id = uuid.uuid4().hex
+        self.user_id = user_id
+        self.items = items
+        self.status = "queued"
+        self.completed = 0
+        self.total = len(items)
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "completed": self.completed,
+            "total": self.total,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobQueue:
+    """
+    Bounded in-process queue of interview evaluations worked off by a
+    fixed pool of daemon threads. Stands in for an external queue: jobs
+    are lost on restart.
+    """
+
+    def __init__(self, workers: int, max_size: int, ttl: float):
+        self.ttl = ttl
+        self._queue = queue.Queue(maxsize=max_size)
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._workers = []
+        self._worker_count = workers
+
+        self.running = 0
+        self.succeeded = 0
+        self.failed = 0
+        self._durations = deque(maxlen=200)
+        self._waits = deque(maxlen=200)
+
+    def submit(self, user_id: int, items: List[AnswerInput]) -> EvaluationJob:
+        self._start_workers()
+        self._expire()
+
+        job = EvaluationJob(user_id, items)
+
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            raise QueueFullError("Evaluation queue is full")
+
+        with self._lock:
+            self._jobs[job.id] = job
+
+        return job
+
+    def get(self, job_id: str) -> Optional[EvaluationJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _start_workers(self):
+        with self._lock:
+            if self._workers:
+                return
+
+            for i in range(self._worker_count):
+                worker = threading.Thread(
+                    target=self._work,
+                    name=f"evaluation-job-{i}",
+                    daemon=True,
+                )
+                worker.start()
+                self._workers.append(worker)
+
+    def _work(self):
+        while True:
+            job = self._queue.get()
+
+            if job is None:
+                self._queue.task_done()
+                return
+
+            try:
+                self._run(job)
+            finally:
+                self._queue.task_done()
+
+    def _run(self, job: EvaluationJob):
+        job.status = "running"
+        job.started_at = time.time()
+
+        with self._lock:
+            self.running += 1
+            self._waits.append(job.started_at - job.created_at)
+
+        job_wait_time.observe(job.started_at - job.created_at)
+
+        db = SessionLocal()
+        try:
+            results = [None] * job.total
+
+            for index, analysis, feedback in iter_evaluations(job.items):
+                results[index] = (analysis, feedback)
+                job.completed += 1
+
+            job.result = save_interview(db, job.user_id, job.items, results)
+            job.status = "succeeded"
+
+        except Exception as e:
+            logger.error("Evaluation job failed", extra={"job_id": job.id, "error": str(e)})
+            db.rollback()
+            job.error = "Evaluation failed"
+            job.status = "failed"
+
+        finally:
+            db.close()
+            job.finished_at = time.time()
+            # Inputs are no longer needed once the job is done
+            job.items = []
+
+            with self._lock:
+                self.running -= 1
+                self._durations.append(job.finished_at - job.started_at)
+                if job.status == "succeeded":
+                    self.succeeded += 1
+                else:
+                    self.failed += 1
+
+            job_duration.observe(job.finished_at - job.started_at, status=job.status)
+
+    def _expire(self):
+        cutoff = time.time() - self.ttl
+
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job.finished_at is not None and job.finished_at < cutoff
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+    def shutdown(self):
+        with self._lock:
+            workers, self._workers = self._workers, []
+
+        for _ in workers:
+            try:
+                self._queue.put_nowait(None)
+            except queue.Full:
+                # Workers are daemon threads; they die with the process
+                break
+
+    def stats(self) -> dict:
+        with self._lock:
+            durations = sorted(self._durations)
+            waits = list(self._waits)
+
+            return {
+                "queue_depth": self._queue.qsize(),
+                "queue_capacity": self._queue.maxsize,
+                "running": self.running,
+                "workers": self._worker_count,
+                "succeeded": self.succeeded,
+                "failed": self.failed,
+                "avg_duration_s": round(sum(durations) / len(durations), 3) if durations else 0,
+                "p95_duration_s": round(durations[int(0.95 * (len(durations) - 1))], 3) if durations else 0,
+                "avg_wait_s": round(sum(waits) / len(waits), 3) if waits else 0,
+            }
+
+
+job_queue = JobQueue(
+    workers=EVAL_JOB_WORKERS,
+    max_size=EVAL_JOB_QUEUE_SIZE,
+    ttl=EVAL_JOB_TTL,
+)
+
+
+registry.register(Gauge(
+    "evaluation_jobs_queued",
+    "Evaluation jobs waiting for a worker.",
+    callback=lambda: {(): job_queue.stats()["queue_depth"]},
+))
+registry.register(Gauge(
+    "evaluation_jobs_running",
+    "Evaluation jobs being worked on.",
+    callback=lambda: {(): job_queue.stats()["running"]},
+))
+registry.register(Gauge(
+    "evaluation_jobs_capacity",
+    "Queue slots and workers available to evaluation jobs.",
+    ("resource",),
+    callback=lambda: {("queue",): job_queue.stats()["queue_capacity"], ("workers",): job_queue.stats()["workers"]},
+))
+registry.register(Gauge(
+    "evaluation_jobs_finished",
+    "Evaluation jobs finished since start, by outcome.",
+    ("status",),
+    callback=lambda: {(status,): job_queue.stats()[status] for status in ("succeeded", "failed")},
+))
@@ -0,0 +1,80 @@
+from typing import List, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.api.schemas import AnswerInput
+from app.api.services.scoring_service import calculate_overall_score, score_columns
+from app.api.services.rollup_service import lock_user, record_interview
+from app.db.models import Interview, QuestionAnswer
+from app.db.replicas import recent_writes
+
+
+def save_interview(
+    db: Session,
+    user_id: int,
+    items: List[AnswerInput],
+    results: List[Tuple[dict, dict]],
+) -> dict:
+    """
+    Persist an evaluated interview and its answers, then return the
+    response payload for it.
+
+    The interview is one INSERT ... RETURNING and all its answers one
+    multi-row INSERT, so the statement count does not grow with the
+    number of answers; the payload is built from the data in hand
+    rather than read back.
+    """
+    overall_score = calculate_overall_score([analysis for analysis, _ in results])
+    role = items[0].role
+    level = items[0].experience_level
+
+    # Before the INSERT below, which locks the user row for its foreign
+    # key; see lock_user
+    lock_user(db, user_id)
+
+    interview_id, created_at = db.execute(
+        insert(Interview)
+        .values(role=role, level=level, score=overall_score, user_id=user_id, **score_columns(overall_score))
+        .returning(Interview.id, Interview.created_at)
+    ).one()
+
+    responses = [
+        {
+            "question": item.question,
+            "answer": item.answer,
+            "analysis": analysis,
+            "feedback": feedback,
+        }
+        for item, (analysis, feedback) in zip(items, results)
+    ]
+
+    db.execute(
+        insert(QuestionAnswer).values([
+            dict(response, interview_id=interview_id) for response in responses
+        ])
+    )
+
+    # Same transaction: the rollups never count an interview that was not saved
+    record_interview(
+        db,
+        user_id,
+        role,
+        overall_score,
+        [(response["question"], response["feedback"]) for response in responses],
+    )
+
+    db.commit()
+
+    # Read this user's history and analytics from the primary until the
+    # replicas have the new interview
+    recent_writes.mark(user_id)
+
+    return {
+        "id": interview_id,
+        "role": role,
+        "level": level,
+        "score": overall_score,
+        "created_at": str(created_at),
+        "responses": responses,
+    }
@@ -0,0 +1,230 @@
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Dict, Optional, Tuple
+
+from app.api.services.interview_service import request_question
+from app.core.config import (
+    QUESTION_POOL_ENABLED,
+    QUESTION_POOL_SIZE,
+    QUESTION_POOL_LOW_WATER,
+    QUESTION_POOL_WORKERS,
+    QUESTION_POOL_PREWARM_ROLES,
+    QUESTION_POOL_PREWARM_LEVELS,
+    QUESTION_POOL_ROLES,
+    QUESTION_POOL_LEVELS,
+    QUESTION_POOL_MAX_POOLS,
+)
+from app.core.logger import get_logger
+from app.core.metrics import registry, Gauge
+
+logger = get_logger(__name__)
+
+TIERS = ["warmup", "core", "advanced"]
+
+
+def difficulty_tier(history: List[Dict]) -> str:
+    """
+    Map how far the session has progressed to a difficulty tier.
+    """
+    asked = sum(1 for h in history if "question" in h)
+
+    if asked < 2:
+        return "warmup"
+    if asked < 5:
+        return "core"
+    return "advanced"
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+class QuestionPool:
+    """
+    Pre-generated questions per (role, experience_level, difficulty tier).
+
+    Pools are refilled on a background executor whenever they drop below
+    the low-water mark, so /next-question can usually be answered
+    without waiting on the model.
+
+    Only the configured roles and levels get a pool: role strings come
+    from clients, and every new pool costs model calls to fill. At most
+    `max_pools` are kept, least recently used dropped first.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        low_water: int,
+        workers: int,
+        roles: Iterable[str] = (),
+        levels: Iterable[str] = (),
+        max_pools: int = 64,
+        enabled: bool = True,
+    ):
+        self.size = size
+        self.low_water = low_water
+        self.max_pools = max_pools
+        self.enabled = enabled
+        self.roles = {_normalize(role) for role in roles}
+        self.levels = {_normalize(level) for level in levels}
+
+        self._pools: "OrderedDict[Tuple[str, str, str], deque]" = OrderedDict()
+        self._refilling = set()
+        self._lock = threading.Lock()
+        self._executor = None
+        self._workers = workers
+
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, role: str, experience_level: str, tier: str) -> Tuple[str, str, str]:
+        return _normalize(role), _normalize(experience_level), tier
+
+    def pooled(self, role: str, experience_level: str) -> bool:
+        return _normalize(role) in self.roles and _normalize(experience_level) in self.levels
+
+    def _pool(self, key) -> deque:
+        # Callers hold self._lock
+        pool = self._pools.get(key)
+
+        if pool is None:
+            pool = self._pools[key] = deque()
+
+            for stale in list(self._pools):
+                if len(self._pools) <= self.max_pools:
+                    break
+                if stale != key and stale not in self._refilling:
+                    del self._pools[stale]
+
+        self._pools.move_to_end(key)
+        return pool
+
+    def get_question(self, role: str, experience_level: str, history: List[Dict]) -> Optional[str]:
+        """
+        Pop a pooled question the session has not been asked yet.
+        Returns None on a miss, or for a role/level without a pool; the
+        pool is topped up in the background.
+        """
+        if not self.enabled or not self.pooled(role, experience_level):
+            return None
+
+        key = self._key(role, experience_level, difficulty_tier(history))
+        asked = {_normalize(h["question"]) for h in history if "question" in h}
+        question = None
+
+        with self._lock:
+            pool = self._pool(key)
+
+            for candidate in pool:
+                if _normalize(candidate) not in asked:
+                    question = candidate
+                    break
+
+            if question is not None:
+                pool.remove(question)
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        self._schedule_refill(key, role, experience_level)
+        return question
+
+    def prewarm(self, roles: List[str], levels: List[str]):
+        if not self.enabled:
+            return
+
+        for role in roles:
+            for level in levels:
+                if not self.pooled(role, level):
+                    continue
+                for tier in TIERS:
+                    self._schedule_refill(self._key(role, level, tier), role, level)
+
+    def _schedule_refill(self, key, role: str, experience_level: str):
+        with self._lock:
+            pool = self._pool(key)
+
+            if len(pool) >= self.low_water or key in self._refilling:
+                return
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._workers,
+                    thread_name_prefix="question-pool",
+                )
+
+            # Under the lock so shutdown() cannot swap the executor out
+            self._executor.submit(self._refill, key, role, experience_level)
+            self._refilling.add(key)
+
+    def _refill(self, key, role: str, experience_level: str):
+        tier = key[2]
+
+        try:
+            # Bounded so a model that keeps repeating itself cannot spin forever
+            for _ in range(self.size * 2):
+                with self._lock:
+                    pool = self._pools.get(key)
+                    if pool is None or len(pool) >= self.size:
+                        return
+                    # Pooled questions count as asked so the model avoids duplicates
+                    history = [{"question": q} for q in pool]
+
+                question = request_question(role, experience_level, history, difficulty=tier)
+
+                with self._lock:
+                    pool = self._pools.get(key)
+                    if pool is None:
+                        return
+                    if _normalize(question) not in {_normalize(q) for q in pool}:
+                        pool.append(question)
+
+        except Exception as e:
+            logger.warning("Question pool refill failed", extra={"pool": "/".join(key), "error": str(e)})
+
+        finally:
+            with self._lock:
+                self._refilling.discard(key)
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+            # Cancelled refills never reach their finally block
+            self._refilling.clear()
+
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "pools": {"|".join(key): len(pool) for key, pool in self._pools.items()},
+            }
+
+
+question_pool = QuestionPool(
+    size=QUESTION_POOL_SIZE,
+    low_water=QUESTION_POOL_LOW_WATER,
+    workers=QUESTION_POOL_WORKERS,
+    roles=QUESTION_POOL_PREWARM_ROLES + QUESTION_POOL_ROLES,
+    levels=QUESTION_POOL_PREWARM_LEVELS + QUESTION_POOL_LEVELS,
+    max_pools=QUESTION_POOL_MAX_POOLS,
+    enabled=QUESTION_POOL_ENABLED,
+)
+
+registry.register(Gauge(
+    "question_pool_lookups",
+    "Pooled /next-question lookups since start, by result.",
+    ("result",),
+    callback=lambda: {("hit",): question_pool.hits, ("miss",): question_pool.misses},
+))
+registry.register(Gauge(
+    "question_pool_questions",
+    "Questions ready in each pool.",
+    ("pool",),
+    callback=lambda: {(pool,): size for pool, size in question_pool.stats()["pools"].items()},
+))
@@ -0,0 +1,208 @@
+from datetime import datetime, timezone
+from typing import Iterable, Optional, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.core.logger import get_logger
+from app.db.models import (
+    Interview,
+    QuestionAnswer,
+    User,
+    UserAnalytics,
+    RoleAnalytics,
+    QuestionAnalytics,
+)
+
+logger = get_logger(__name__)
+
+FEEDBACK_SAMPLES = 3
+
+
+def score_value(score) -> Optional[float]:
+    """
+    Overall score of an `Interview.score`, which is a scoring dict or,
+    on legacy rows, a bare number.
+    """
+    if isinstance(score, dict):
+        score = score.get("overall_score")
+    if isinstance(score, (int, float)) and not isinstance(score, bool):
+        return float(score)
+    return None
+
+
+def _add_score(row, value: float):
+    row.score_sum += value
+    row.score_min = value if row.score_min is None else min(row.score_min, value)
+    row.score_max = value if row.score_max is None else max(row.score_max, value)
+
+
+def _apply(db: Session, user_row: UserAnalytics, roles: dict, questions: dict,
+           role: str, score, answers: Iterable[Tuple[str, dict]], seen_at: datetime):
+    """
+    Fold one interview into the rollup rows, creating missing role and
+    question rows in `roles` / `questions`. New question rows are not
+    added to the session; see `_insert_new_questions`.
+    """
+    value = score_value(score)
+
+    user_row.total_interviews += 1
+    if value is not None:
+        user_row.scored_interviews += 1
+        _add_score(user_row, value)
+
+    role_row = roles.get(role)
+    if role_row is None:
+        role_row = roles[role] = RoleAnalytics(
+            user_id=user_row.user_id, role=role, attempts=0, score_sum=0.0,
+        )
+        db.add(role_row)
+
+    if value is not None:
+        role_row.attempts += 1
+        _add_score(role_row, value)
+
+    for question, feedback in answers:
+        question_row = questions.get(question)
+        if question_row is None:
+            question_row = questions[question] = QuestionAnalytics(
+                user_id=user_row.user_id, question=question, attempts=0, feedback_samples=[],
+            )
+
+        question_row.attempts += 1
+        question_row.last_seen_at = seen_at
+        if feedback:
+            # Reassigned rather than appended so the JSON change is tracked
+            question_row.feedback_samples = (list(question_row.feedback_samples or []) + [feedback])[-FEEDBACK_SAMPLES:]
+
+
+def _insert_new_questions(db: Session, questions: dict):
+    """
+    Insert the question rows `_apply` created, in one statement; adding
+    them to the session would flush one INSERT per row to fetch each id.
+    """
+    rows = [
+        {
+            "user_id": row.user_id,
+            "question": row.question,
+            "attempts": row.attempts,
+            "feedback_samples": row.feedback_samples,
+            "last_seen_at": row.last_seen_at,
+        }
+        for row in questions.values()
+        if row.id is None
+    ]
+
+    if rows:
+        db.execute(insert(QuestionAnalytics), rows)
+
+
+def lock_user(db: Session, user_id: int):
+    """
+    Lock the user's row until the transaction ends, so concurrent saves
+    and rebuilds for one user update the rollups one after the other.
+    Take it before inserting anything that references the user.
+
+    FOR NO KEY UPDATE rather than FOR UPDATE: inserting an interview
+    takes FOR KEY SHARE on the user row for its foreign key, which
+    conflicts with FOR UPDATE, so two saves that had both inserted would
+    deadlock. (SQLite ignores the clause; its write lock serializes.)
+    """
+    db.query(User.id).filter(User.id == user_id).with_for_update(key_share=True).first()
+
+
+def record_interview(db: Session, user_id: int, role: str, score,
+                     answers: Iterable[Tuple[str, dict]]):
+    """
+    Add a just-saved interview to the user's rollups. Call it inside the
+    transaction that saved the interview, after the interview is flushed,
+    so the rollups commit or roll back with it; that transaction must
+    have taken lock_user before inserting the interview.
+    """
+    answers = list(answers)
+
+    user_row = db.get(UserAnalytics, user_id)
+    if user_row is None:
+        user_row = UserAnalytics(
+            user_id=user_id, total_interviews=0, scored_interviews=0, score_sum=0.0,
+        )
+        db.add(user_row)
+
+    roles = {}
+    role_row = db.get(RoleAnalytics, (user_id, role))
+    if role_row is not None:
+        roles[role] = role_row
+
+    questions = {}
+    texts = {question for question, _ in answers}
+    if texts:
+        questions = {
+            row.question: row
+            for row in db.query(QuestionAnalytics).filter(
+                QuestionAnalytics.user_id == user_id,
+                QuestionAnalytics.question.in_(texts),
+            )
+        }
+
+    _apply(db, user_row, roles, questions, role, score, answers, datetime.now(timezone.utc))
+    _insert_new_questions(db, questions)
+
+
+def rebuild_rollups(db: Session, user_id: int) -> int:
+    """
+    Recompute one user's rollups from their stored interviews, replacing
+    whatever is there. Commits; returns the number of interviews read.
+    """
+    lock_user(db, user_id)
+
+    db.query(QuestionAnalytics).filter(QuestionAnalytics.user_id == user_id).delete()
+    db.query(RoleAnalytics).filter(RoleAnalytics.user_id == user_id).delete()
+    db.query(UserAnalytics).filter(UserAnalytics.user_id == user_id).delete()
+
+    interviews = (
+        db.query(Interview.id, Interview.role, Interview.score, Interview.created_at)
+        .filter(Interview.user_id == user_id)
+        .order_by(Interview.created_at, Interview.id)
+        .all()
+    )
+
+    if not interviews:
+        db.commit()
+        return 0
+
+    answers = {}
+    for qa in (
+        db.query(QuestionAnswer.interview_id, QuestionAnswer.question, QuestionAnswer.feedback)
+        .join(Interview, Interview.id == QuestionAnswer.interview_id)
+        .filter(Interview.user_id == user_id)
+        .order_by(QuestionAnswer.interview_id, QuestionAnswer.id)
+    ):
+        answers.setdefault(qa.interview_id, []).append((qa.question, qa.feedback))
+
+    user_row = UserAnalytics(user_id=user_id, total_interviews=0, scored_interviews=0, score_sum=0.0)
+    db.add(user_row)
+    roles, questions = {}, {}
+
+    for interview in interviews:
+        _apply(
+            db, user_row, roles, questions,
+            interview.role, interview.score, answers.get(interview.id, []), interview.created_at,
+        )
+
+    _insert_new_questions(db, questions)
+    db.commit()
+    return len(interviews)
+
+
+def rebuild_all_rollups(db: Session) -> dict:
+    """
+    Rebuild the rollups of every user, one transaction per user.
+    """
+    user_ids = [row.id for row in db.query(User.id).order_by(User.id)]
+    interviews = 0
+
+    for user_id in user_ids:
+        interviews += rebuild_rollups(db, user_id)
+        logger.debug("Rebuilt analytics rollups", extra={"user_id": user_id})
+
+    return {"users": len(user_ids), "interviews": interviews}
@@ -1,5 +1,8 @@
+CATEGORIES = ["clarity", "communication", "confidence", "structure", "english"]
+
+
 def calculate_overall_score(analysis_results: list) -> dict:
-    categories = ["clarity", "communication", "confidence", "structure", "english"]
+    categories = CATEGORIES
 
     default_response = {
         "average_scores": {cat: 0.0 for cat in categories},
@@ -63,3 +66,18 @@ def calculate_overall_score(analysis_results: list) -> dict:
         "performance_level": performance_level,
         "summary": summary
     }
+
+
+def score_columns(score: dict) -> dict:
+    """
+    Typed `Interview` column values mirroring a `calculate_overall_score`
+    result, stored next to the JSON so analytics can filter and aggregate
+    on indexed numbers.
+    """
+    averages = score.get("average_scores") or {}
+
+    return {
+        "overall_score": score.get("overall_score"),
+        **{f"{cat}_score": averages.get(cat) for cat in CATEGORIES},
+        "performance_level": score.get("performance_level"),
+    }
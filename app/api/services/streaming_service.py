@@ -0,0 +1,102 @@
+import json
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Iterator, List
+
+from app.api.schemas import AnswerInput
+from app.api.services.evaluation_service import iter_evaluations
+from app.api.services.feedback_service import generate_feedback
+from app.api.services.persistence_service import save_interview
+from app.core.config import SSE_HEARTBEAT_SECONDS
+from app.core.logger import get_logger
+from app.db.database import SessionLocal
+
+logger = get_logger(__name__)
+
+
+def sse_event(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def sse_keepalive() -> str:
+    # Comment lines are ignored by EventSource but keep proxies from timing out
+    return ": keep-alive\n\n"
+
+
+def stream_interview_evaluation(items: List[AnswerInput], user_id: int) -> Iterator[str]:
+    """
+    SSE stream for a full interview:
+    a `preliminary` event with instant heuristic scores, then one
+    `answer` event per answer as it finishes, then `score` once the
+    interview is saved, then `done`.
+    """
+    from app.api.services.heuristic_service import score_answers
+
+    results = [None] * len(items)
+
+    yield sse_event("preliminary", {
+        "responses": [
+            {"index": index, "scores": analysis["scores"]}
+            for index, analysis in enumerate(score_answers([item.answer for item in items]))
+        ],
+    })
+
+    for event in iter_evaluations(items, heartbeat=SSE_HEARTBEAT_SECONDS):
+        if event is None:
+            yield sse_keepalive()
+            continue
+
+        index, analysis, feedback = event
+        results[index] = (analysis, feedback)
+
+        yield sse_event("answer", {
+            "index": index,
+            "question": items[index].question,
+            "answer": items[index].answer,
+            "analysis": analysis,
+            "feedback": feedback,
+        })
+
+    # The request's own session may already be closed once streaming starts
+    db = SessionLocal()
+    try:
+        payload = save_interview(db, user_id, items, results)
+    except Exception as e:
+        logger.error("Streamed interview save failed", extra={"error": str(e)})
+        db.rollback()
+        yield sse_event("error", {"detail": "Failed to save interview"})
+        return
+    finally:
+        db.close()
+
+    yield sse_event("score", {
+        "id": payload["id"],
+        "score": payload["score"],
+        "created_at": payload["created_at"],
+    })
+    yield sse_event("done", {"id": payload["id"]})
+
+
+def stream_feedback(question: str, answer: str, analysis: dict, feedback_mode: str) -> Iterator[str]:
+    """
+    SSE stream for a single feedback call: keep-alives while the model
+    works, then `feedback` and `done`.
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="feedback-stream")
+
+    try:
+        future = executor.submit(
+            generate_feedback,
+            question=question,
+            answer=answer,
+            analysis=analysis,
+            feedback_mode=feedback_mode,
+        )
+
+        while not wait([future], timeout=SSE_HEARTBEAT_SECONDS).done:
+            yield sse_keepalive()
+
+        yield sse_event("feedback", future.result())
+        yield sse_event("done", {})
+
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
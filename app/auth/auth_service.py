@@ -1,6 +1,8 @@
 from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
 from app.db.models import User
 from app.auth.auth_utils import create_access_token
 
@@ -15,36 +17,37 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
-def register_user(db: Session, name: str, email: str, password: str):
-    existing_user = db.query(User).filter(User.email == email).first()
+async def register_user(db: AsyncSession, name: str, email: str, password: str):
+    existing_user = await db.scalar(select(User.id).where(User.email == email))
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
 
+    # bcrypt is deliberately slow; keep it off the event loop
     user = User(
         name=name,
         email=email,
-        password_hash=hash_password(password)
+        password_hash=await run_in_threadpool(hash_password, password)
     )
 
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
 
     return user
 
 
-def login_user(db: Session, email: str, password: str):
-    user = db.query(User).filter(User.email == email).first()
+async def login_user(db: AsyncSession, email: str, password: str):
+    user = await db.scalar(select(User).where(User.email == email))
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
         )
 
-    if not verify_password(password, user.password_hash):
+    if not await run_in_threadpool(verify_password, password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
@@ -52,4 +55,4 @@ def login_user(db: Session, email: str, password: str):
 
     token = create_access_token({"sub": str(user.id)})
 
-    return user, token
\ No newline at end of file
+    return user, token
@@ -1,8 +1,8 @@
 from datetime import datetime, timedelta, timezone
 from jose import jwt
-import os
 
-SECRET_KEY = os.getenv("SECRET_KEY", "supersecret")
+from app.core.config import SECRET_KEY
+
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
@@ -1,26 +1,28 @@
-from fastapi import Depends, HTTPException, status
+import secrets
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Security, status
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
-from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.security import APIKeyHeader, OAuth2PasswordBearer
 
-from app.db.database import get_db
+from app.db.database import AsyncSessionLocal
 from app.db.models import User
+from app.db.replicas import is_replica, read_sessionmaker
 from app.auth.auth_utils import SECRET_KEY, ALGORITHM
+from app.core.config import OPS_API_KEY
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
+ops_key_header = APIKeyHeader(name="X-Ops-Key", auto_error=False)
 
+credentials_exception = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-):
-
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
 
+def get_current_user_id(token: str = Depends(oauth2_scheme)) -> int:
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         user_id: str = payload.get("sub")
@@ -31,9 +33,65 @@ def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    return int(user_id)
+
+
+async def get_current_user(user_id: int = Depends(get_current_user_id)):
+    """
+    The logged-in user, looked up in a session of its own that is closed
+    before the route runs, so routes that call the model do not hold a
+    pooled connection meanwhile. Routes that write open their own
+    session around the write.
+    """
+    async with AsyncSessionLocal() as db:
+        user = await db.get(User, user_id)
 
     if user is None:
         raise credentials_exception
 
     return user
+
+
+# ---------------- READ-ONLY ROUTES ----------------
+
+async def get_read_db(user_id: int = Depends(get_current_user_id)):
+    """
+    Session for routes that only read: a replica when one is configured,
+    the primary for users who have just saved something.
+    """
+    async with read_sessionmaker(user_id)() as db:
+        yield db
+
+
+async def get_current_reader(
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    get_current_user for read-only routes, looked up through get_read_db.
+    """
+    user = await db.get(User, user_id)
+
+    if user is None and is_replica(db):
+        # A user who registered moments ago may not have replicated yet
+        async with AsyncSessionLocal() as primary:
+            user = await primary.get(User, user_id)
+
+    if user is None:
+        raise credentials_exception
+
+    return user
+
+
+# ---------------- OPERATIONS ----------------
+
+def require_ops(key: Optional[str] = Security(ops_key_header)):
+    """
+    Guard for operational routes (queue, prompt and model stats): they
+    need OPS_API_KEY, not a user login, and do not exist without it.
+    """
+    if not OPS_API_KEY:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    if key is None or not secrets.compare_digest(key, OPS_API_KEY):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Operator key required")
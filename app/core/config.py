@@ -0,0 +1,187 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# ---------------- LLM ----------------
+HF_API_TOKEN = os.getenv("HF_API_TOKEN")
+HF_MODEL = os.getenv("HF_MODEL") or "Qwen/Qwen2.5-7B-Instruct"
+MODEL_URL = os.getenv("MODEL_URL") or "https://router.huggingface.co/v1/chat/completions"
+
+# ---------------- LLM PROVIDERS ----------------
+# Backends to use, with load-balancing weights: "hf:3,cohere:1".
+# Every call falls over to the remaining backends in weighted order.
+LLM_PROVIDERS = os.getenv("LLM_PROVIDERS", "hf")
+
+COHERE_API_KEY = os.getenv("COHERE_API_KEY", "")
+COHERE_MODEL = os.getenv("COHERE_MODEL", "command-a-03-2025")
+COHERE_URL = os.getenv("COHERE_URL", "https://api.cohere.com/v2/chat")
+
+# OpenAI-compatible stand-in (python -m benchmarks.fake_llm_server)
+LOCAL_LLM_URL = os.getenv("LOCAL_LLM_URL", "http://127.0.0.1:8765/v1/chat/completions")
+LOCAL_LLM_MODEL = os.getenv("LOCAL_LLM_MODEL", "local")
+
+# ---------------- RATE LIMITING ----------------
+# Per-client route limits; load tests turn these off
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+
+# ---------------- EVALUATION ----------------
+EVAL_CONCURRENCY = int(os.getenv("EVAL_CONCURRENCY", "5"))
+# "split" = analyze + feedback calls, "fused" = one call per answer,
+# "batch" = one analysis call per batch of answers + feedback calls
+EVAL_MODE = os.getenv("EVAL_MODE", "split").lower()
+EVAL_BATCH_SIZE = int(os.getenv("EVAL_BATCH_SIZE", "5"))
+# Estimated prompt + completion tokens allowed per batch request
+EVAL_BATCH_TOKEN_BUDGET = int(os.getenv("EVAL_BATCH_TOKEN_BUDGET", "4000"))
+
+# ---------------- LLM RESULT CACHE ----------------
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "2048"))
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", "86400"))
+# SQLite file for the persistent tier; empty disables it
+LLM_CACHE_DB_PATH = os.getenv("LLM_CACHE_DB_PATH", "")
+
+# ---------------- QUESTION POOL ----------------
+QUESTION_POOL_ENABLED = os.getenv("QUESTION_POOL_ENABLED", "true").lower() == "true"
+QUESTION_POOL_SIZE = int(os.getenv("QUESTION_POOL_SIZE", "8"))
+QUESTION_POOL_LOW_WATER = int(os.getenv("QUESTION_POOL_LOW_WATER", "3"))
+QUESTION_POOL_WORKERS = int(os.getenv("QUESTION_POOL_WORKERS", "2"))
+# Comma-separated roles/levels filled at startup, e.g. "backend developer,frontend developer"
+QUESTION_POOL_PREWARM_ROLES = [r.strip() for r in os.getenv("QUESTION_POOL_PREWARM_ROLES", "").split(",") if r.strip()]
+QUESTION_POOL_PREWARM_LEVELS = [l.strip() for l in os.getenv("QUESTION_POOL_PREWARM_LEVELS", "junior,mid,senior").split(",") if l.strip()]
+# Roles/levels that get a pool, besides the prewarmed ones; anything else
+# clients send is generated on demand
+QUESTION_POOL_ROLES = [r.strip() for r in os.getenv("QUESTION_POOL_ROLES", "").split(",") if r.strip()]
+QUESTION_POOL_LEVELS = [l.strip() for l in os.getenv("QUESTION_POOL_LEVELS", "").split(",") if l.strip()]
+# Most pools kept at once; the least recently used is dropped beyond it
+QUESTION_POOL_MAX_POOLS = int(os.getenv("QUESTION_POOL_MAX_POOLS", "64"))
+# Seconds between SSE keep-alive comments while waiting on the model
+SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", "10"))
+
+# ---------------- EVALUATION JOBS ----------------
+EVAL_JOB_WORKERS = int(os.getenv("EVAL_JOB_WORKERS", "2"))
+EVAL_JOB_QUEUE_SIZE = int(os.getenv("EVAL_JOB_QUEUE_SIZE", "100"))
+# Seconds a finished job stays available for polling
+EVAL_JOB_TTL = float(os.getenv("EVAL_JOB_TTL", "3600"))
+
+# ---------------- LLM HTTP POOL ----------------
+LLM_HTTP2 = os.getenv("LLM_HTTP2", "true").lower() == "true"
+# Evaluations expected to run at once in this process besides the job
+# workers; without HTTP/2 each in-flight model call holds a connection
+LLM_CONCURRENT_EVALUATIONS = int(os.getenv("LLM_CONCURRENT_EVALUATIONS", "8"))
+# Default: every overlapping evaluation fanned out EVAL_CONCURRENCY
+# wide, plus the question pool refills
+LLM_MAX_CONNECTIONS = int(
+    os.getenv("LLM_MAX_CONNECTIONS")
+    or EVAL_CONCURRENCY * (LLM_CONCURRENT_EVALUATIONS + EVAL_JOB_WORKERS) + QUESTION_POOL_WORKERS
+)
+LLM_MAX_KEEPALIVE = int(os.getenv("LLM_MAX_KEEPALIVE") or LLM_MAX_CONNECTIONS)
+LLM_KEEPALIVE_EXPIRY = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "60"))
+LLM_CONNECT_TIMEOUT = float(os.getenv("LLM_CONNECT_TIMEOUT", "5"))
+# Same budget as a model call (90s), so a call queued behind busy
+# connections is not failed sooner than one that got a connection
+LLM_POOL_TIMEOUT = float(os.getenv("LLM_POOL_TIMEOUT", "90"))
+
+# ---------------- LLM RESILIENCE ----------------
+# Circuit breaker: open when the failure rate over the window crosses the threshold
+LLM_BREAKER_WINDOW = float(os.getenv("LLM_BREAKER_WINDOW", "30"))
+LLM_BREAKER_FAILURE_RATE = float(os.getenv("LLM_BREAKER_FAILURE_RATE", "0.5"))
+LLM_BREAKER_MIN_CALLS = int(os.getenv("LLM_BREAKER_MIN_CALLS", "10"))
+LLM_BREAKER_COOLDOWN = float(os.getenv("LLM_BREAKER_COOLDOWN", "15"))
+# Adaptive timeout = p99 latency * multiplier, clamped to [min, caller's timeout]
+LLM_TIMEOUT_MULTIPLIER = float(os.getenv("LLM_TIMEOUT_MULTIPLIER", "3"))
+LLM_TIMEOUT_MIN = float(os.getenv("LLM_TIMEOUT_MIN", "5"))
+LLM_LATENCY_MIN_SAMPLES = int(os.getenv("LLM_LATENCY_MIN_SAMPLES", "20"))
+# Retries allowed as a fraction of recent calls, with a small floor
+LLM_RETRY_BUDGET_RATIO = float(os.getenv("LLM_RETRY_BUDGET_RATIO", "0.2"))
+LLM_RETRY_BUDGET_MIN = int(os.getenv("LLM_RETRY_BUDGET_MIN", "3"))
+LLM_RETRY_BUDGET_WINDOW = float(os.getenv("LLM_RETRY_BUDGET_WINDOW", "10"))
+# Hedged requests: send a duplicate once a call outlives the task's p95
+LLM_HEDGE_ENABLED = os.getenv("LLM_HEDGE_ENABLED", "false").lower() == "true"
+LLM_HEDGE_MIN_DELAY = float(os.getenv("LLM_HEDGE_MIN_DELAY", "2"))
+
+# ---------------- JSON GENERATION ----------------
+# Stream JSON completions and stop reading once the object closes
+LLM_STREAM_JSON = os.getenv("LLM_STREAM_JSON", "true").lower() == "true"
+# Continuation requests allowed when output is cut off by max_tokens
+LLM_MAX_CONTINUATIONS = int(os.getenv("LLM_MAX_CONTINUATIONS", "1"))
+
+# ---------------- REQUEST COALESCING ----------------
+# Concurrent identical model requests share one upstream call
+LLM_SINGLEFLIGHT_ENABLED = os.getenv("LLM_SINGLEFLIGHT_ENABLED", "true").lower() == "true"
+
+# ---------------- HEURISTIC ANALYZER ----------------
+# Use local text-feature scores instead of flat defaults when the model fails
+HEURISTIC_FALLBACK = os.getenv("HEURISTIC_FALLBACK", "true").lower() == "true"
+
+# ---------------- PROMPT BUDGETS ----------------
+# Hugging Face tokenizer name for exact counts (needs `tokenizers`); estimates otherwise
+PROMPT_TOKENIZER = os.getenv("PROMPT_TOKENIZER", "")
+# Scale max_tokens with the answer length instead of always asking for the ceiling
+PROMPT_ADAPTIVE_MAX_TOKENS = os.getenv("PROMPT_ADAPTIVE_MAX_TOKENS", "true").lower() == "true"
+PROMPT_ANSWER_TOKEN_LIMIT = int(os.getenv("PROMPT_ANSWER_TOKEN_LIMIT", 1500))
+QUESTION_PROMPT_TOKEN_BUDGET = int(os.getenv("QUESTION_PROMPT_TOKEN_BUDGET", 1200))
+# Recent turns sent as full dialogue; older ones keep only the question
+QUESTION_HISTORY_TURNS = int(os.getenv("QUESTION_HISTORY_TURNS", 3))
+
+# ---------------- DATABASE ----------------
+DATABASE_URL = os.getenv("DATABASE_URL")
+# Defaults to DATABASE_URL with the matching async driver (asyncpg, aiosqlite)
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", "")
+
+# ---------------- READ REPLICAS ----------------
+# Comma-separated replica URLs, in the same form as DATABASE_URL, for the
+# read-only routes (history, analytics, /users/me). Empty reads from the primary.
+DATABASE_REPLICA_URLS = [u.strip() for u in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if u.strip()]
+# Seconds a user's reads stay on the primary after they save, to cover
+# replica lag. Tracked per process; with several workers or instances keep
+# users on one instance or the window well above the lag.
+REPLICA_READ_YOUR_WRITES_SECONDS = float(os.getenv("REPLICA_READ_YOUR_WRITES_SECONDS", "10"))
+
+# ---------------- AUTH ----------------
+SECRET_KEY = os.getenv("SECRET_KEY", "supersecret")
+# Sent as X-Ops-Key to reach the /interview/*/stats routes; empty disables them
+OPS_API_KEY = os.getenv("OPS_API_KEY", "")
+
+# ---------------- DATABASE POOL ----------------
+# Applied to both the sync engine (scripts, background jobs) and the
+# async engine (request handlers); each keeps its own pool.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 20))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 10))
+# Seconds before a connection is replaced; keep below the server/proxy idle timeout
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+# ---------------- MIGRATIONS ----------------
+# Run `alembic upgrade head` on startup. Handy for local and single-instance
+# runs; with several instances, migrate once from the deploy step instead.
+DB_AUTO_MIGRATE = os.getenv("DB_AUTO_MIGRATE", "false").lower() == "true"
+
+# ---------------- STARTUP ----------------
+# Open one database connection per engine during startup so the first
+# request does not pay for the connect
+STARTUP_WARM_DATABASE = os.getenv("STARTUP_WARM_DATABASE", "true").lower() == "true"
+# Open connections to the model backends in the background after startup
+LLM_WARMUP = os.getenv("LLM_WARMUP", "true").lower() == "true"
+# Seconds from importing app.main to serving; slower starts are logged as warnings
+STARTUP_BUDGET_SECONDS = float(os.getenv("STARTUP_BUDGET_SECONDS", "2"))
+
+# ---------------- SERVER ----------------
+# Used by run.py; most hosts set PORT
+HOST = os.getenv("HOST", "0.0.0.0")
+PORT = int(os.getenv("PORT", "8000"))
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+# ---------------- ANALYTICS ----------------
+# "rollup" reads the incrementally maintained tables; "sql" aggregates the
+# history in the database; "history" recomputes it in Python (slowest)
+ANALYTICS_SOURCE = os.getenv("ANALYTICS_SOURCE", "rollup").lower()
+
+# ---------------- LOGGING / TELEMETRY ----------------
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+# "json" for one JSON object per line, "text" for local development
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json").lower()
+# Fraction of model calls whose raw output is logged
+LLM_LOG_SAMPLE_RATE = float(os.getenv("LLM_LOG_SAMPLE_RATE", "0.01"))
+LLM_LOG_PAYLOAD_CHARS = int(os.getenv("LLM_LOG_PAYLOAD_CHARS", "2000"))
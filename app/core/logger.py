@@ -0,0 +1,84 @@
+import json
+import logging
+import random
+import sys
+import time
+
+from app.core.config import LOG_LEVEL, LOG_FORMAT, LLM_LOG_SAMPLE_RATE, LLM_LOG_PAYLOAD_CHARS
+
+# Attributes every LogRecord has; anything else came in through `extra`
+_RECORD_FIELDS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    One JSON object per line, with `extra` fields at the top level.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+
+        for key, value in vars(record).items():
+            if key not in _RECORD_FIELDS:
+                entry[key] = value
+
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+def _configure():
+    handler = logging.StreamHandler(sys.stdout)
+
+    if LOG_FORMAT == "json":
+        handler.setFormatter(JSONFormatter())
+    else:
+        formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+        formatter.converter = time.gmtime
+        handler.setFormatter(formatter)
+
+    root = logging.getLogger("app")
+    root.handlers = [handler]
+    root.setLevel(LOG_LEVEL)
+    root.propagate = False
+
+
+_configure()
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Logger under the "app" hierarchy; pass the module's __name__.
+    """
+    return logging.getLogger(name)
+
+
+def log_payload(
+    logger: logging.Logger,
+    message: str,
+    payload: str,
+    level: int = logging.INFO,
+    sample_rate: float = LLM_LOG_SAMPLE_RATE,
+    **fields,
+):
+    """
+    Log a raw model payload for a `sample_rate` fraction of calls,
+    truncated to LLM_LOG_PAYLOAD_CHARS.
+    """
+    if sample_rate < 1 and random.random() >= sample_rate:
+        return
+
+    if not logger.isEnabledFor(level):
+        return
+
+    text = payload or ""
+    fields["payload"] = text[:LLM_LOG_PAYLOAD_CHARS]
+    fields["payload_chars"] = len(text)
+
+    logger.log(level, message, extra=fields)
@@ -0,0 +1,349 @@
+"""
+In-process metrics with Prometheus text exposition (served at /metrics).
+"""
+import bisect
+import contextvars
+import threading
+import time
+from typing import Callable, Dict, Tuple
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 90)
+TOKEN_BUCKETS = (16, 32, 64, 128, 256, 512, 1024, 2048, 4096, 8192)
+JOB_BUCKETS = (0.1, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 90, 120, 180, 300, 600)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1)
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [
+        '%s="%s"' % (name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in zip(names, values)
+    ]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labels)
+
+    def header(self) -> list:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name, documentation, labels=()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[tuple, float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def collect(self) -> list:
+        with self._lock:
+            values = dict(self._values)
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}"
+            for key, value in sorted(values.items())
+        ]
+
+
+class Gauge(_Metric):
+    """
+    Set directly, or computed at scrape time from `callback`, which
+    returns {label_values_tuple: value}.
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name, documentation, labels=(), callback: Callable = None):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[tuple, float] = {}
+        self._callback = callback
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def collect(self) -> list:
+        if self._callback is not None:
+            try:
+                values = self._callback()
+            except Exception:
+                values = {}
+        else:
+            with self._lock:
+                values = dict(self._values)
+
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}"
+            for key, value in sorted(values.items())
+        ]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labels=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [bucket counts..., +Inf count, sum]
+        self._values: Dict[tuple, list] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [0] * (len(self.buckets) + 2)
+            entry[index] += 1
+            entry[-1] += value
+
+    def collect(self) -> list:
+        with self._lock:
+            values = {key: list(entry) for key, entry in self._values.items()}
+
+        lines = self.header()
+        bounds = self.buckets + (float("inf"),)
+
+        for key, entry in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip(bounds, entry[:-1]):
+                cumulative += count
+                le = 'le="%s"' % _format_value(bound)
+                lines.append(f"{self.name}_bucket{_format_labels(self.labels, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, key)} {_format_value(entry[-1])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, key)} {cumulative}")
+
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics)
+
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+# ---------------- LLM ----------------
+llm_latency = registry.register(Histogram(
+    "llm_request_duration_seconds",
+    "Model call latency, including failovers' individual attempts.",
+    ("task", "backend", "outcome"),
+))
+llm_input_tokens = registry.register(Histogram(
+    "llm_input_tokens",
+    "Prompt tokens per upstream model request.",
+    ("task",),
+    TOKEN_BUCKETS,
+))
+llm_output_tokens = registry.register(Histogram(
+    "llm_output_tokens",
+    "Completion tokens read per upstream model request.",
+    ("task",),
+    TOKEN_BUCKETS,
+))
+llm_prompts = registry.register(Counter(
+    "llm_prompts_total",
+    "Prompts assembled, by prompt (task).",
+    ("task",),
+))
+llm_prompt_tokens = registry.register(Counter(
+    "llm_prompt_tokens_total",
+    "Tokens in assembled prompts, by prompt (task): input, its static "
+    "(cacheable) share, and the output tokens requested.",
+    ("task", "kind"),
+))
+llm_prompt_compressions = registry.register(Counter(
+    "llm_prompt_compressions_total",
+    "Prompts whose history was compressed to fit the token budget.",
+    ("task",),
+))
+llm_parse_failures = registry.register(Counter(
+    "llm_parse_failures_total",
+    "Model outputs that could not be parsed or validated.",
+    ("task",),
+))
+llm_fallbacks = registry.register(Counter(
+    "llm_fallbacks_total",
+    "Results served from a fallback instead of the model.",
+    ("task",),
+))
+llm_retries = registry.register(Counter(
+    "llm_retries_total",
+    "Model calls retried after a failure.",
+    ("task",),
+))
+llm_failovers = registry.register(Counter(
+    "llm_failovers_total",
+    "Calls moved to the next backend after this backend failed.",
+    ("backend",),
+))
+llm_in_flight = registry.register(Gauge(
+    "llm_requests_in_flight",
+    "Upstream model requests currently running.",
+    ("backend",),
+))
+
+# ---------------- EVALUATION JOBS ----------------
+job_wait_time = registry.register(Histogram(
+    "evaluation_job_wait_seconds",
+    "Time evaluation jobs spent queued before a worker picked them up.",
+    buckets=JOB_BUCKETS,
+))
+job_duration = registry.register(Histogram(
+    "evaluation_job_duration_seconds",
+    "Time to run an evaluation job, by outcome.",
+    ("status",),
+    JOB_BUCKETS,
+))
+
+# ---------------- HTTP / DB ----------------
+http_in_flight = registry.register(Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served.",
+))
+http_latency = registry.register(Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("route", "method", "status"),
+))
+db_query_time = registry.register(Histogram(
+    "db_query_duration_seconds",
+    "Time per SQL statement, by the route that issued it.",
+    ("route",),
+    DB_BUCKETS,
+))
+db_read_sessions = registry.register(Counter(
+    "db_read_sessions_total",
+    "Sessions opened for read-only routes, by where they were sent.",
+    ("target",),
+))
+
+# ---------------- STARTUP ----------------
+startup_time = registry.register(Gauge(
+    "app_startup_seconds",
+    "Time spent in each startup phase of this process.",
+    ("phase",),
+))
+
+
+# ---------------- REQUEST CONTEXT ----------------
+_request_scope = contextvars.ContextVar("request_scope", default=None)
+
+
+def current_route() -> str:
+    """
+    Route template of the request being served, "background" outside one.
+    """
+    scope = _request_scope.get()
+    if scope is None:
+        return "background"
+
+    route = scope.get("route")
+    return getattr(route, "path", "unmatched")
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording in-flight requests and latency per route,
+    and making the route available to DB query timing.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        token = _request_scope.set(scope)
+        status = {"code": 500}
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        http_in_flight.inc()
+        start = time.perf_counter()
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_in_flight.dec()
+            http_latency.observe(
+                time.perf_counter() - start,
+                route=current_route(),
+                method=scope["method"],
+                status=status["code"],
+            )
+            _request_scope.reset(token)
+
+
+def instrument_engine(engine):
+    """
+    Time every statement executed through `engine`.
+    """
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_start"].pop()
+        db_query_time.observe(time.perf_counter() - started, route=current_route())
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        conn = context.connection
+        if conn is not None and conn.info.get("query_start"):
+            conn.info["query_start"].pop()
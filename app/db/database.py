@@ -1,12 +1,63 @@
+import asyncio
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker, declarative_base
-import os
-from dotenv import load_dotenv
 
-load_dotenv()
-DATABASE_URL = os.getenv("DATABASE_URL")
+from app.core.config import (
+    DATABASE_URL,
+    ASYNC_DATABASE_URL,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING,
+)
+from app.core.metrics import instrument_engine
+
+# Async drivers for the URL schemes the sync engine accepts
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def async_database_url(url: str) -> str:
+    """
+    `url` with its driver swapped for the async one of the same backend.
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend!r} databases")
+
+    return parsed.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
 
-engine = create_engine(DATABASE_URL)
+
+def engine_options(url: str) -> dict:
+    """
+    Pool settings for `url`. In-memory SQLite uses a single shared
+    connection, so only pre-ping applies there.
+    """
+    options = {"pool_pre_ping": DB_POOL_PRE_PING}
+    parsed = make_url(url)
+
+    if parsed.get_backend_name() != "sqlite" or parsed.database not in (None, "", ":memory:"):
+        options.update(
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE,
+        )
+
+    return options
+
+
+# Sync engine: scripts, background jobs, streaming responses
+engine = create_engine(DATABASE_URL, **engine_options(DATABASE_URL))
+instrument_engine(engine)
 
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -14,6 +65,18 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# Async engine: request handlers
+ASYNC_DATABASE_URL = ASYNC_DATABASE_URL or async_database_url(DATABASE_URL)
+
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **engine_options(ASYNC_DATABASE_URL))
+instrument_engine(async_engine.sync_engine)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 Base = declarative_base()
 
 
@@ -25,3 +88,30 @@ def get_db():
     finally:
         db.close()
 
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# ---------------- LIFECYCLE ----------------
+
+def _connect_sync_engine():
+    with engine.connect():
+        pass
+
+
+async def warm_engines():
+    """
+    Open one connection on each engine so the first requests find a
+    live connection in the pool instead of paying for the connect.
+    """
+    async with async_engine.connect():
+        pass
+
+    await asyncio.to_thread(_connect_sync_engine)
+
+
+async def dispose_engines():
+    await async_engine.dispose()
+    engine.dispose()
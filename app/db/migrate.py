@@ -0,0 +1,38 @@
+"""
+Apply the database migrations in migrations/versions.
+
+    python -m app.db.migrate              # upgrade to the latest revision
+    python -m app.db.migrate 0002         # or to a given one
+    alembic upgrade head                  # the same through the alembic CLI
+"""
+import argparse
+import os
+
+from alembic import command
+from alembic.config import Config
+
+ALEMBIC_INI = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "alembic.ini"))
+
+
+def alembic_config() -> Config:
+    config = Config(ALEMBIC_INI)
+    # Keep the application's logging configuration
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def upgrade_database(revision: str = "head"):
+    command.upgrade(alembic_config(), revision)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("revision", nargs="?", default="head")
+    args = parser.parse_args()
+
+    upgrade_database(args.revision)
+    print(f"Database upgraded to {args.revision}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,16 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Float, Index, UniqueConstraint, JSON
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import JSON
-from datetime import datetime
+from sqlalchemy.dialects.postgresql import JSONB
+from datetime import datetime, timezone
 from app.db.database import Base
 
+# Binary JSON on PostgreSQL, plain JSON elsewhere (SQLite in development)
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+# Schema changes go through migrations (alembic revision --autogenerate);
+# keep these models and migrations/versions in step.
+
 class User(Base):
     __tablename__ = "users"
 
@@ -20,13 +26,38 @@ class Interview(Base):
     id = Column(Integer, primary_key=True, index=True)
     role = Column(String, nullable=False)
     level = Column(String, nullable=False)
-    score = Column(JSON)
+    score = Column(JSONType)
+    # Typed copies of the score JSON (scoring_service.score_columns)
+    overall_score = Column(Float)
+    clarity_score = Column(Float)
+    communication_score = Column(Float)
+    confidence_score = Column(Float)
+    structure_score = Column(Float)
+    english_score = Column(Float)
+    performance_level = Column(String)
     user_id = Column(Integer, ForeignKey("users.id"))
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Set in Python as well so every row has microsecond precision,
+    # which keeps (created_at, id) cursors exact on every backend
+    created_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        default=lambda: datetime.now(timezone.utc),
+    )
 
     user = relationship("User", backref="interviews")
     answers = relationship("QuestionAnswer", back_populates="interview", cascade="all, delete-orphan")
 
+# History pages: WHERE user_id = ? ORDER BY created_at DESC, id DESC
+Index(
+    "ix_interviews_user_created_id",
+    Interview.user_id,
+    Interview.created_at.desc(),
+    Interview.id.desc(),
+)
+
+# Analytics: per-user totals and role breakdown straight from the index
+Index("ix_interviews_user_role_score", Interview.user_id, Interview.role, Interview.overall_score)
+
 class QuestionAnswer(Base):
     __tablename__ = "question_answers"
 
@@ -34,8 +65,55 @@ class QuestionAnswer(Base):
     interview_id = Column(Integer, ForeignKey("interviews.id"))
     question = Column(Text, nullable=False)
     answer = Column(Text, nullable=False)
-    analysis = Column(JSON)     
-    feedback = Column(JSON)      
+    analysis = Column(JSONType)
+    feedback = Column(JSONType)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
-    interview = relationship("Interview", back_populates="answers")    
\ No newline at end of file
+    interview = relationship("Interview", back_populates="answers")
+
+# Answers of a page of interviews, in order
+Index("ix_question_answers_interview_id", QuestionAnswer.interview_id, QuestionAnswer.id)
+
+
+# ---------------- ANALYTICS ROLLUPS ----------------
+# Maintained by rollup_service in the same transaction as each saved
+# interview, so analytics never has to scan the history.
+
+class UserAnalytics(Base):
+    __tablename__ = "user_analytics"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    total_interviews = Column(Integer, nullable=False, default=0)
+    scored_interviews = Column(Integer, nullable=False, default=0)
+    score_sum = Column(Float, nullable=False, default=0)
+    score_min = Column(Float)
+    score_max = Column(Float)
+
+class RoleAnalytics(Base):
+    __tablename__ = "user_role_analytics"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    role = Column(String, primary_key=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    score_sum = Column(Float, nullable=False, default=0)
+    score_min = Column(Float)
+    score_max = Column(Float)
+
+class QuestionAnalytics(Base):
+    __tablename__ = "user_question_analytics"
+    __table_args__ = (UniqueConstraint("user_id", "question", name="uq_user_question_analytics"),)
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    question = Column(Text, nullable=False)
+    attempts = Column(Integer, nullable=False, default=0)
+    # Last three feedback payloads, oldest first
+    feedback_samples = Column(JSONType, nullable=False, default=list)
+    last_seen_at = Column(DateTime(timezone=True))
+
+Index(
+    "ix_user_question_analytics_user_seen",
+    QuestionAnalytics.user_id,
+    QuestionAnalytics.last_seen_at.desc(),
+    QuestionAnalytics.id.desc(),
+)
@@ -0,0 +1,36 @@
+"""
+Rebuild the analytics rollup tables from the stored interviews.
+
+Run once after deploying the rollups, or any time they are suspected
+to have drifted:
+
+    python -m app.db.rebuild_rollups
+    python -m app.db.rebuild_rollups --user-id 42
+"""
+import argparse
+import json
+
+from app.api.services.rollup_service import rebuild_rollups, rebuild_all_rollups
+from app.db.database import SessionLocal
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--user-id", type=int, help="rebuild a single user")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+
+    try:
+        if args.user_id is not None:
+            result = {"users": 1, "interviews": rebuild_rollups(db, args.user_id)}
+        else:
+            result = rebuild_all_rollups(db)
+    finally:
+        db.close()
+
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
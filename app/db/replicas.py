@@ -0,0 +1,97 @@
+import asyncio
+import itertools
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+
+from app.core.config import DATABASE_REPLICA_URLS, REPLICA_READ_YOUR_WRITES_SECONDS
+from app.core.metrics import db_read_sessions, instrument_engine
+from app.db.database import AsyncSessionLocal, async_database_url, async_engine, engine_options
+
+
+class RecentWrites:
+    """
+    Users who saved to the primary within the last `window` seconds.
+    Their reads stay on the primary until the replicas have caught up.
+    In-process only, like the job queue.
+    """
+
+    def __init__(self, window: float):
+        self.window = window
+        self._until = {}
+        self._lock = threading.Lock()
+
+    def mark(self, user_id: int):
+        if self.window <= 0:
+            return
+
+        now = time.monotonic()
+
+        with self._lock:
+            self._until[user_id] = now + self.window
+
+            for stale in [uid for uid, until in self._until.items() if until <= now]:
+                del self._until[stale]
+
+    def is_recent(self, user_id: int) -> bool:
+        with self._lock:
+            until = self._until.get(user_id)
+
+        return until is not None and until > time.monotonic()
+
+
+recent_writes = RecentWrites(REPLICA_READ_YOUR_WRITES_SECONDS)
+
+
+# ---------------- ROUTING ----------------
+
+def _replica_engine(url: str):
+    async_url = async_database_url(url)
+    replica = create_async_engine(async_url, **engine_options(async_url))
+    instrument_engine(replica.sync_engine)
+    return replica
+
+
+replica_engines = [_replica_engine(url) for url in DATABASE_REPLICA_URLS]
+
+_replica_sessions = [
+    async_sessionmaker(bind=replica, autoflush=False, expire_on_commit=False)
+    for replica in replica_engines
+]
+_next_replica = itertools.count()
+
+
+def read_sessionmaker(user_id: Optional[int] = None) -> async_sessionmaker:
+    """
+    Session factory for a read on behalf of `user_id`: the replicas in
+    turn, or the primary when none are configured or the user has
+    written recently.
+    """
+    if not _replica_sessions or (user_id is not None and recent_writes.is_recent(user_id)):
+        db_read_sessions.inc(target="primary")
+        return AsyncSessionLocal
+
+    db_read_sessions.inc(target="replica")
+    return _replica_sessions[next(_next_replica) % len(_replica_sessions)]
+
+
+def is_replica(db: AsyncSession) -> bool:
+    return db.bind is not async_engine
+
+
+# ---------------- LIFECYCLE ----------------
+
+async def _connect(replica):
+    async with replica.connect():
+        pass
+
+
+async def warm_replicas():
+    await asyncio.gather(*(_connect(replica) for replica in replica_engines))
+
+
+async def dispose_replicas():
+    for replica in replica_engines:
+        await replica.dispose()
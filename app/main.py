@@ -1,14 +1,39 @@
+import time
+
+_import_started = time.perf_counter()
+
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
 from app.api.routes import interview, feedback, auth, user
-from app.db.database import engine
-from app.db.models import Base
-
-app = FastAPI(
-    title="Mock Interview AI",
-    version="1.0.0"
+from app.ai.cache import llm_cache
+from app.ai.client import close_client, warm_client
+from app.api.services.question_pool import question_pool
+from app.api.services.job_service import job_queue
+from app.core.config import (
+    QUESTION_POOL_PREWARM_ROLES,
+    QUESTION_POOL_PREWARM_LEVELS,
+    DB_AUTO_MIGRATE,
+    STARTUP_WARM_DATABASE,
+    LLM_WARMUP,
+    LLM_CONNECT_TIMEOUT,
+    STARTUP_BUDGET_SECONDS,
 )
+from app.core.logger import get_logger
+from app.core.metrics import MetricsMiddleware, registry, startup_time
+from app.db.database import warm_engines, dispose_engines
+from app.db.replicas import warm_replicas, dispose_replicas
+
+logger = get_logger(__name__)
+
+# Time to import the app and everything it pulls in, counted against
+# the startup budget along with the lifespan phases below
+IMPORT_SECONDS = time.perf_counter() - _import_started
 
 # ---------------- CORS CONFIG ----------------
 origins = [
@@ -16,29 +41,104 @@ origins = [
     "https://careersathi-rm5f.onrender.com",  # production frontend (if hosted)
 ]
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
 
-# ---------------- ROUTES ----------------
-app.include_router(interview.router)
-app.include_router(feedback.router, prefix="/feedback", tags=["Feedback"])
-app.include_router(auth.router)
-app.include_router(user.router)
+# ---------------- STARTUP / SHUTDOWN ----------------
+@contextmanager
+def _phase(phases: dict, name: str):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        phases[name] = time.perf_counter() - started
+        startup_time.set(phases[name], phase=name)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    phases = {"import": IMPORT_SECONDS}
+    startup_time.set(IMPORT_SECONDS, phase="import")
+
+    if DB_AUTO_MIGRATE:
+        # Alembic is only loaded when this instance migrates
+        from app.db.migrate import upgrade_database
+
+        with _phase(phases, "migrate"):
+            await asyncio.to_thread(upgrade_database)
+
+    if STARTUP_WARM_DATABASE:
+        with _phase(phases, "database"):
+            await warm_engines()
+            await warm_replicas()
+
+    with _phase(phases, "cache"):
+        await asyncio.to_thread(llm_cache.open)
+
+    with _phase(phases, "question_pool"):
+        question_pool.prewarm(QUESTION_POOL_PREWARM_ROLES, QUESTION_POOL_PREWARM_LEVELS)
+
+    # Handshakes with the model backends can take longer than the rest
+    # of startup, so they run after it instead of delaying readiness
+    warmup = None
+    if LLM_WARMUP:
+        warmup = threading.Thread(target=warm_client, name="llm-warmup", daemon=True)
+        warmup.start()
+
+    total = sum(phases.values())
+    startup_time.set(total, phase="total")
+    timings = {name: round(seconds, 3) for name, seconds in phases.items()}
+
+    if total > STARTUP_BUDGET_SECONDS:
+        logger.warning("Startup over budget", extra={"seconds": round(total, 3), "budget": STARTUP_BUDGET_SECONDS, "phases": timings})
+    else:
+        logger.info("Startup complete", extra={"seconds": round(total, 3), "budget": STARTUP_BUDGET_SECONDS, "phases": timings})
+
+    yield
+
+    job_queue.shutdown()
+    question_pool.shutdown()
+    if warmup is not None:
+        warmup.join(timeout=LLM_CONNECT_TIMEOUT)
+    close_client()
+    llm_cache.close()
+    await dispose_engines()
+    await dispose_replicas()
+
+
+# ---------------- APP FACTORY ----------------
+def create_app() -> FastAPI:
+    app = FastAPI(
+        title="Mock Interview AI",
+        version="1.0.0",
+        lifespan=lifespan,
+    )
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # ---------------- METRICS ----------------
+    app.add_middleware(MetricsMiddleware)
+
+    # ---------------- ROUTES ----------------
+    app.include_router(interview.router)
+    app.include_router(feedback.router, prefix="/feedback", tags=["Feedback"])
+    app.include_router(auth.router)
+    app.include_router(user.router)
+
+    # ---------------- ROOT ----------------
+    @app.get("/")
+    def root():
+        return {"message": "Mock Interview API is running"}
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
 
-# ---------------- ROOT ----------------
-@app.get("/")
-def root():
-    return {"message": "Mock Interview API is running"}
+    return app
 
-# ---------------- DB INIT ----------------
-Base.metadata.create_all(bind=engine)
 
-# ---------------- LOCAL RUN ----------------
-if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+app = create_app()
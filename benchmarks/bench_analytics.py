@@ -0,0 +1,149 @@
+"""
+Compare the three ways of computing /interview/analytics for users with
+growing histories: the Python loops over every interview and answer,
+the SQL pushdown, and the rollup tables.
+
+Seeds one user per size (a throwaway SQLite database unless DATABASE_URL
+is set), checks the three results agree, and reports the median time of
+each. The Python path lazy-loads answers per interview, so the 10k
+size takes minutes on its own; use --repeat 1 for a quick look.
+
+    python -m benchmarks.bench_analytics --sizes 100,1000,10000
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_analytics
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault(
+    "DATABASE_URL",
+    f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='analytics-bench-'), 'analytics.db')}",
+)
+
+from sqlalchemy import insert  # noqa: E402
+
+from app.api.services.analytics_service import (  # noqa: E402
+    history_analytics,
+    rollup_analytics,
+    sql_analytics,
+)
+from app.api.services.rollup_service import rebuild_rollups  # noqa: E402
+from app.api.services.scoring_service import score_columns  # noqa: E402
+from app.db.database import SessionLocal, engine  # noqa: E402
+from app.db.migrate import upgrade_database  # noqa: E402
+from app.db.models import Interview, QuestionAnswer, User  # noqa: E402
+
+ROLES = ["Backend Developer", "Data Engineer", "Frontend Developer"]
+QUESTIONS = [f"Question {i}" for i in range(40)]
+METHODS = {
+    "python": history_analytics,
+    "sql": sql_analytics,
+    "rollup": rollup_analytics,
+}
+
+
+def seed(session, interviews: int, answers: int, rng: random.Random) -> int:
+    user = User(name="Analytics", email=f"analytics-{os.getpid()}-{time.time_ns()}@example.com", password_hash="x")
+    session.add(user)
+    session.flush()
+
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    rows = []
+    for i in range(interviews):
+        score = {"overall_score": round(rng.uniform(2, 9.5), 2), "performance_level": "Average"}
+        rows.append({
+            "role": rng.choice(ROLES),
+            "level": "Mid",
+            "score": score,
+            **score_columns(score),
+            "user_id": user.id,
+            "created_at": start + timedelta(minutes=i),
+        })
+    session.execute(insert(Interview), rows)
+
+    ids = [
+        row.id for row in
+        session.query(Interview.id).filter(Interview.user_id == user.id).order_by(Interview.id)
+    ]
+    session.execute(insert(QuestionAnswer), [
+        {
+            "interview_id": interview_id,
+            "question": rng.choice(QUESTIONS),
+            "answer": "An answer long enough to look like a real one. " * 6,
+            "analysis": {"scores": {"clarity": 6, "communication": 7}, "strengths": "Clear."},
+            "feedback": {"verbal_feedback": f"Feedback {interview_id}-{j}", "verdict": "Hire"} if rng.random() > 0.1 else None,
+        }
+        for interview_id in ids
+        for j in range(answers)
+    ])
+
+    session.commit()
+    rebuild_rollups(session, user.id)
+    return user.id
+
+
+def timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return round(statistics.median(samples) * 1000, 2)
+
+
+def canonical(result: dict) -> str:
+    return json.dumps(result, sort_keys=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="100,1000,10000", help="interviews per user")
+    parser.add_argument("--answers", type=int, default=5, help="answers per interview")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    upgrade_database()
+    rng = random.Random(args.seed)
+    session = SessionLocal()
+    results = []
+    consistent = True
+
+    try:
+        for size in (int(x) for x in args.sizes.split(",")):
+            user_id = seed(session, size, args.answers, rng)
+
+            outputs = {}
+            for name, method in METHODS.items():
+                session.expunge_all()
+                outputs[name] = canonical(method(session, user_id))
+
+            agree = len(set(outputs.values())) == 1
+            consistent = consistent and agree
+
+            row = {"interviews": size, "answers": size * args.answers, "results_agree": agree}
+            for name, method in METHODS.items():
+                # Fresh identity map each run so the Python path really reloads
+                def run():
+                    session.expunge_all()
+                    method(session, user_id)
+
+                row[f"{name}_ms"] = timed(run, args.repeat)
+            results.append(row)
+    finally:
+        session.close()
+
+    print(json.dumps({"database": engine.url.get_backend_name(), "runs": results}, indent=2))
+
+    if not consistent:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Requests per second of the read routes at high concurrency, with the
+previous sync handlers (threadpool + sync Session) against the current
+async handlers (event loop + AsyncSession).
+
+Seeds users with interview history (a throwaway SQLite database unless
+DATABASE_URL is set; PostgreSQL is where the difference shows), boots
+each app with uvicorn, and hammers /users/me, /interview/history and
+/interview/analytics with `--concurrency` simultaneous clients.
+
+    python -m benchmarks.bench_async_db --concurrency 200 --duration 15
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_async_db
+
+`sync_app` below reproduces the handlers as they were before the async
+conversion, over the same services and database.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+
+os.environ.setdefault(
+    "DATABASE_URL",
+    f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='async-bench-'), 'async.db')}",
+)
+
+import httpx  # noqa: E402
+from fastapi import Depends, FastAPI, HTTPException  # noqa: E402
+from fastapi.security import OAuth2PasswordBearer  # noqa: E402
+from jose import JWTError, jwt  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.api.services.analytics_service import rollup_analytics  # noqa: E402
+from app.api.services.history_service import get_history  # noqa: E402
+from app.api.services.rollup_service import rebuild_rollups  # noqa: E402
+from app.api.services.scoring_service import score_columns  # noqa: E402
+from app.auth.auth_utils import ALGORITHM, SECRET_KEY, create_access_token  # noqa: E402
+from app.core.metrics import MetricsMiddleware  # noqa: E402
+from app.db.database import SessionLocal, engine, get_db  # noqa: E402
+from app.db.migrate import upgrade_database  # noqa: E402
+from app.db.models import Interview, QuestionAnswer, User  # noqa: E402
+from benchmarks.loadtest import _free_port, _percentile, boot_app  # noqa: E402
+
+ROUTES = ["/users/me", "/interview/history", "/interview/analytics"]
+
+
+# ---------------- SYNC BASELINE ----------------
+
+sync_app = FastAPI()
+sync_app.add_middleware(MetricsMiddleware)
+_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
+
+
+def _sync_current_user(token: str = Depends(_oauth2_scheme), db: Session = Depends(get_db)):
+    try:
+        user_id = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM]).get("sub")
+    except JWTError:
+        user_id = None
+
+    user = db.query(User).filter(User.id == int(user_id)).first() if user_id else None
+    if user is None:
+        raise HTTPException(status_code=401)
+    return user
+
+
+@sync_app.get("/")
+def _root():
+    return {"ok": True}
+
+
+@sync_app.get("/users/me")
+def _me(current_user: User = Depends(_sync_current_user)):
+    return {"id": current_user.id, "name": current_user.name, "email": current_user.email}
+
+
+@sync_app.get("/interview/history")
+def _history(skip: int = 0, limit: int = 10, db: Session = Depends(get_db),
+             current_user: User = Depends(_sync_current_user)):
+    return get_history(db, current_user.id, skip=skip, limit=limit)
+
+
+@sync_app.get("/interview/analytics")
+def _analytics(db: Session = Depends(get_db), current_user: User = Depends(_sync_current_user)):
+    return rollup_analytics(db, current_user.id)
+
+
+# ---------------- WORKLOAD ----------------
+
+def seed(users: int, interviews: int) -> list:
+    upgrade_database()
+    db = SessionLocal()
+    tokens = []
+
+    try:
+        for i in range(users):
+            user = User(name=f"Bench {i}", email=f"bench-{i}-{time.time_ns()}@example.com", password_hash="x")
+            db.add(user)
+            db.flush()
+
+            for j in range(interviews):
+                score = {"overall_score": 6.0 + j % 3}
+                interview = Interview(role="Backend Developer", level="Mid", score=score, user_id=user.id, **score_columns(score))
+                db.add(interview)
+                db.flush()
+                db.add(QuestionAnswer(
+                    interview_id=interview.id,
+                    question=f"Question {j % 5}",
+                    answer="An answer.",
+                    analysis={"scores": {"clarity": 6}},
+                    feedback={"verdict": "Hire"},
+                ))
+
+            db.commit()
+            rebuild_rollups(db, user.id)
+            tokens.append(create_access_token({"sub": str(user.id)}))
+    finally:
+        db.close()
+
+    return tokens
+
+
+async def hammer(base_url: str, tokens: list, concurrency: int, duration: float, timeout: float, seed: int) -> dict:
+    rng = random.Random(seed)
+    latencies = []
+    errors = 0
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        deadline = time.monotonic() + duration
+
+        async def worker():
+            nonlocal errors
+            while time.monotonic() < deadline:
+                headers = {"Authorization": f"Bearer {rng.choice(tokens)}"}
+                start = time.perf_counter()
+                try:
+                    response = await client.get(rng.choice(ROUTES), headers=headers)
+                    ok = response.status_code == 200
+                except httpx.HTTPError:
+                    ok = False
+                if ok:
+                    latencies.append(time.perf_counter() - start)
+                else:
+                    errors += 1
+
+        start = time.monotonic()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.monotonic() - start
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(_percentile(latencies, 50) * 1000, 1) if latencies else None,
+        "p95_ms": round(_percentile(latencies, 95) * 1000, 1) if latencies else None,
+    }
+
+
+def run(target: str, tokens: list, args) -> dict:
+    port = _free_port()
+    env = {"QUESTION_POOL_PREWARM_ROLES": "", "RATE_LIMIT_ENABLED": "false", "LOG_LEVEL": "WARNING"}
+    process = boot_app(port, env, args.workers, target=target)
+
+    try:
+        return asyncio.run(hammer(f"http://127.0.0.1:{port}", tokens, args.concurrency, args.duration, args.timeout, args.seed))
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=15)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--interviews", type=int, default=20, help="seeded interviews per user")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=15, help="per-request client timeout")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    tokens = seed(args.users, args.interviews)
+
+    before = run("benchmarks.bench_async_db:sync_app", tokens, args)
+    after = run("app.main:app", tokens, args)
+
+    print(json.dumps({
+        "database": engine.url.get_backend_name(),
+        "concurrency": args.concurrency,
+        "routes": ROUTES,
+        "sync": before,
+        "async": after,
+        "rps_change": f"{(after['rps'] - before['rps']) / before['rps'] * 100:+.1f}%" if before["rps"] else None,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
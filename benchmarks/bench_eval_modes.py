@@ -0,0 +1,116 @@
+"""
+Compare the two-call (split) and single-call (fused) evaluation paths.
+
+Runs the same sample answers through both modes against the configured
+model backends (LLM_PROVIDERS) and reports latency percentiles, model
+calls made and the parse-failure rate of each mode.
+
+    python -m benchmarks.bench_eval_modes --answers 10 --rounds 3
+
+Offline, against the stand-in server:
+
+    python -m benchmarks.fake_llm_server --latency 0.5 &
+    LLM_PROVIDERS=local python -m benchmarks.bench_eval_modes
+"""
+import argparse
+import json
+import statistics
+import time
+
+import app.ai.client as client
+from app.api.schemas import AnswerInput
+from app.api.services import analyzer_service, feedback_service, fused_service
+from app.api.services.evaluation_service import evaluate_answer
+
+SAMPLES = [
+    ("Explain database normalization with an example.",
+     "Normalization removes redundancy. For example splitting customers and orders into two tables linked by a key."),
+    ("How do you handle concurrency in backend systems?",
+     "I use locks and sometimes queues, it depends on the case, mostly I try to avoid shared state."),
+    ("What are rate limiting strategies in APIs?",
+     "Token bucket, leaky bucket and fixed window counters. Token bucket allows bursts while keeping an average rate."),
+    ("Explain how caching improves backend performance.",
+     "Caching keeps hot data in memory so we skip the database. You need invalidation, which is the hard part."),
+    ("How would you debug a production issue?",
+     "First I check logs and metrics, then reproduce it locally, then fix it and add a test so it does not come back."),
+]
+
+
+def _count_calls():
+    """
+    Wrap complete_json in every service module to count model calls.
+    """
+    counter = {"calls": 0}
+    original = client.complete_json
+
+    def counted(*args, **kwargs):
+        counter["calls"] += 1
+        return original(*args, **kwargs)
+
+    for module in (analyzer_service, feedback_service, fused_service):
+        module.complete_json = counted
+
+    return counter
+
+
+def _failed(analysis: dict, feedback: dict) -> bool:
+    return "error" in analysis or feedback.get("verdict") == "Undetermined"
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run(mode: str, items, rounds: int, counter: dict) -> dict:
+    latencies = []
+    failures = 0
+    counter["calls"] = 0
+
+    for _ in range(rounds):
+        for item in items:
+            start = time.perf_counter()
+            analysis, feedback = evaluate_answer(item, mode)
+            latencies.append(time.perf_counter() - start)
+            failures += _failed(analysis, feedback)
+
+    total = len(latencies)
+
+    return {
+        "mode": mode,
+        "answers": total,
+        "model_calls": counter["calls"],
+        "p50_s": round(statistics.median(latencies), 3),
+        "p95_s": round(_percentile(latencies, 95), 3),
+        "mean_s": round(statistics.mean(latencies), 3),
+        "parse_failure_rate": round(failures / total, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--answers", type=int, default=5)
+    parser.add_argument("--rounds", type=int, default=2)
+    parser.add_argument("--role", default="Backend Developer")
+    parser.add_argument("--level", default="Mid")
+    args = parser.parse_args()
+
+    items = [
+        AnswerInput(
+            question=SAMPLES[i % len(SAMPLES)][0],
+            answer=SAMPLES[i % len(SAMPLES)][1],
+            role=args.role,
+            experience_level=args.level,
+        )
+        for i in range(args.answers)
+    ]
+
+    counter = _count_calls()
+    results = [run(mode, items, args.rounds, counter) for mode in ("split", "fused")]
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
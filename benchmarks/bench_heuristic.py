@@ -0,0 +1,86 @@
+"""
+Throughput benchmark for the local heuristic analyzer.
+
+Scores synthetic answers one at a time and in a single vectorized
+batch, and reports answers per second for each, next to how long the
+same number of model calls would take at the observed latency.
+
+    python -m benchmarks.bench_heuristic --answers 5000
+"""
+import argparse
+import json
+import random
+import time
+
+from app.api.services.heuristic_service import score_answer, score_answers
+
+OPENERS = [
+    "In my previous project we had a slow checkout service.",
+    "Um, I think it was basically about, like, caching stuff.",
+    "My task was to reduce the build time for our team.",
+    "I guess maybe I would probably try something.",
+    "When I joined the team the deployment process was manual.",
+]
+
+MIDDLES = [
+    "First I measured where the time went, then I implemented a cache in front of the database.",
+    "I designed a queue so that slow jobs did not block requests.",
+    "We kind of just tried things until it sort of worked.",
+    "I led the migration and wrote the runbook for the on-call engineers.",
+    "",
+]
+
+ENDINGS = [
+    "As a result latency dropped by 40% and errors went down.",
+    "Overall the outcome was good.",
+    "I'm not sure what happened after that.",
+    "Finally we reduced costs and improved reliability for customers.",
+    "",
+]
+
+
+def synthetic_answers(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    return [
+        " ".join(part for part in (rng.choice(OPENERS), rng.choice(MIDDLES), rng.choice(ENDINGS)) if part)
+        for _ in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--answers", type=int, default=5000)
+    parser.add_argument("--model-latency", type=float, default=2.0, help="seconds per model analysis, for comparison")
+    args = parser.parse_args()
+
+    answers = synthetic_answers(args.answers)
+
+    start = time.perf_counter()
+    single = [score_answer(a) for a in answers]
+    single_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = score_answers(answers)
+    batch_elapsed = time.perf_counter() - start
+
+    assert [r["scores"] for r in single] == [r["scores"] for r in batch]
+
+    report = {
+        "answers": len(answers),
+        "per_answer": {
+            "seconds": round(single_elapsed, 3),
+            "answers_per_sec": round(len(answers) / single_elapsed),
+        },
+        "batch": {
+            "seconds": round(batch_elapsed, 3),
+            "answers_per_sec": round(len(answers) / batch_elapsed),
+            "us_per_answer": round(batch_elapsed / len(answers) * 1e6, 1),
+        },
+        "model_seconds_same_volume": round(len(answers) * args.model_latency, 1),
+    }
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Compare offset and cursor pagination of the interview history as a
+heavy user pages deeper.
+
+Seeds one user with `--interviews` interviews (a throwaway SQLite
+database unless DATABASE_URL is set), then times a page at several
+depths with `skip` and with the equivalent `cursor`. Also walks every
+page by cursor and checks each interview comes back exactly once.
+
+    python -m benchmarks.bench_history_pagination --interviews 10000
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_history_pagination
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault(
+    "DATABASE_URL",
+    f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='history-bench-'), 'history.db')}",
+)
+
+from sqlalchemy import insert  # noqa: E402
+
+from app.api.services.history_service import get_history  # noqa: E402
+from app.db.database import SessionLocal, engine  # noqa: E402
+from app.db.migrate import upgrade_database  # noqa: E402
+from app.db.models import Interview, QuestionAnswer, User  # noqa: E402
+
+
+def seed(session, interviews: int, answers: int) -> int:
+    user = User(name="Heavy", email=f"heavy-{os.getpid()}-{time.time_ns()}@example.com", password_hash="x")
+    session.add(user)
+    session.flush()
+
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    # Pairs share a timestamp so the id tie-break is exercised
+    rows = [
+        {
+            "role": "Backend Developer",
+            "level": "Mid",
+            "score": {"overall_score": 6.5},
+            "user_id": user.id,
+            "created_at": start + timedelta(minutes=i // 2),
+        }
+        for i in range(interviews)
+    ]
+    session.execute(insert(Interview), rows)
+
+    ids = [row.id for row in session.query(Interview.id).filter(Interview.user_id == user.id)]
+    session.execute(insert(QuestionAnswer), [
+        {
+            "interview_id": interview_id,
+            "question": f"Question {j}",
+            "answer": f"Answer {interview_id}-{j}",
+            "analysis": {"scores": {"clarity": 6}},
+            "feedback": {"verdict": "Hire"},
+        }
+        for interview_id in ids
+        for j in range(answers)
+    ])
+
+    session.commit()
+    return user.id
+
+
+def timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return round(statistics.median(samples) * 1000, 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interviews", type=int, default=10000)
+    parser.add_argument("--answers", type=int, default=2)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--depths", default="0,0.1,0.5,0.9,0.99", help="fractions of the history to skip")
+    parser.add_argument("--repeat", type=int, default=15)
+    args = parser.parse_args()
+
+    upgrade_database()
+    session = SessionLocal()
+
+    try:
+        user_id = seed(session, args.interviews, args.answers)
+
+        # Walk the whole history by cursor, remembering where each page starts
+        cursors = {0: None}
+        seen = []
+        cursor = None
+        while True:
+            page = get_history(session, user_id, limit=args.limit, cursor=cursor)
+            seen.extend(item["id"] for item in page["interviews"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+            cursors[len(seen)] = cursor
+
+        complete = len(seen) == len(set(seen)) == args.interviews
+
+        results = []
+        for fraction in (float(x) for x in args.depths.split(",")):
+            skip = int(args.interviews * fraction) // args.limit * args.limit
+            results.append({
+                "skip": skip,
+                "offset_ms": timed(lambda: get_history(session, user_id, skip=skip, limit=args.limit), args.repeat),
+                "cursor_ms": timed(lambda: get_history(session, user_id, limit=args.limit, cursor=cursors[skip]), args.repeat),
+            })
+    finally:
+        session.close()
+
+    print(json.dumps({
+        "database": engine.url.get_backend_name(),
+        "interviews": args.interviews,
+        "limit": args.limit,
+        "cursor_walk_complete": complete,
+        "pages": results,
+    }, indent=2))
+
+    if not complete:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Micro-benchmark for JSON extraction over recorded model outputs.
+
+Compares the extractors the services used before (regex over the whole
+text, brace stack that ignores strings) with the incremental extractor,
+both on the full text and fed in small streaming chunks. Reports time
+per output, how many outputs parse correctly, and how much of each
+output the streaming extractor had to read before it could stop.
+
+    python -m benchmarks.bench_json_extract --repeat 2000
+"""
+import argparse
+import json
+import os
+import re
+import time
+
+from app.ai.parser import IncrementalJSONExtractor, extract_json
+
+DATA = os.path.join(os.path.dirname(__file__), "data", "model_outputs.jsonl")
+
+
+# ---------------- LEGACY EXTRACTORS ----------------
+
+def legacy_regex(raw_text: str):
+    raw_text = raw_text.strip()
+
+    if raw_text.startswith("```"):
+        parts = raw_text.split("```")
+        if len(parts) >= 2:
+            raw_text = parts[1]
+        if raw_text.startswith("json"):
+            raw_text = raw_text[4:]
+        raw_text = raw_text.strip()
+
+    match = re.search(r"\{[\s\S]*\}", raw_text)
+    if match:
+        raw_text = match.group()
+
+    return raw_text.replace("\r", "").replace("\t", " ")
+
+
+def legacy_brace_stack(text: str):
+    if not text:
+        return None
+
+    text = re.sub(r"```json|```", "", text).strip()
+
+    stack = []
+    start_index = None
+
+    for i, char in enumerate(text):
+        if char == "{":
+            if not stack:
+                start_index = i
+            stack.append("{")
+        elif char == "}":
+            if stack:
+                stack.pop()
+                if not stack and start_index is not None:
+                    return text[start_index:i + 1]
+
+    return None
+
+
+def streamed(text: str, chunk_size: int = 16):
+    extractor = IncrementalJSONExtractor()
+
+    for i in range(0, len(text), chunk_size):
+        if extractor.feed(text[i:i + chunk_size]):
+            return extractor.text, i + chunk_size
+
+    return None, len(text)
+
+
+def _parses(candidate) -> bool:
+    if not candidate:
+        return False
+    try:
+        return isinstance(json.loads(candidate, strict=False), dict)
+    except ValueError:
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=1000)
+    parser.add_argument("--chunk-size", type=int, default=16)
+    args = parser.parse_args()
+
+    with open(DATA) as f:
+        records = [json.loads(line) for line in f if line.strip()]
+
+    outputs = [r["output"] for r in records]
+
+    extractors = {
+        "legacy_regex": legacy_regex,
+        "legacy_brace_stack": legacy_brace_stack,
+        "incremental": extract_json,
+        "incremental_streamed": lambda text: streamed(text, args.chunk_size)[0],
+    }
+
+    report = {"outputs": len(outputs), "repeat": args.repeat, "extractors": {}}
+
+    for name, fn in extractors.items():
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for text in outputs:
+                fn(text)
+        elapsed = time.perf_counter() - start
+
+        report["extractors"][name] = {
+            "us_per_output": round(elapsed / (args.repeat * len(outputs)) * 1e6, 2),
+            "parsed": sum(_parses(fn(text)) for text in outputs),
+            "failed_kinds": [r["kind"] for r, text in zip(records, outputs) if not _parses(fn(text))],
+        }
+
+    read = sum(streamed(text, args.chunk_size)[1] for text in outputs if streamed(text, args.chunk_size)[0])
+    total = sum(len(text) for text in outputs if streamed(text, args.chunk_size)[0])
+    report["streamed_fraction_read"] = round(read / total, 3) if total else None
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Cold start of a fresh instance: seconds from launching `python run.py`
+until it answers, and the latency of its first authenticated request.
+
+Each run starts a new process against a throwaway SQLite database
+(DATABASE_URL to use another), polls / until it responds, sends one
+GET /users/me, and reads the startup phases the app reports on
+/metrics. Runs with and without the database warm-up.
+
+    python -m benchmarks.bench_startup --runs 5
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault(
+    "DATABASE_URL",
+    f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='startup-bench-'), 'startup.db')}",
+)
+
+import httpx  # noqa: E402
+
+from app.auth.auth_utils import create_access_token  # noqa: E402
+from app.db.database import SessionLocal  # noqa: E402
+from app.db.migrate import upgrade_database  # noqa: E402
+from app.db.models import User  # noqa: E402
+from benchmarks.loadtest import _free_port  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PHASE = re.compile(r'^app_startup_seconds\{phase="([^"]+)"\} (\S+)$', re.MULTILINE)
+
+
+def seed() -> str:
+    upgrade_database()
+    db = SessionLocal()
+    try:
+        user = User(name="Startup", email=f"startup-{time.time_ns()}@example.com", password_hash="x")
+        db.add(user)
+        db.commit()
+        return create_access_token({"sub": str(user.id)})
+    finally:
+        db.close()
+
+
+def cold_start(env: dict, token: str) -> dict:
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "run.py", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=ROOT,
+        env={**os.environ, **env},
+    )
+
+    try:
+        deadline = time.monotonic() + 60
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"App exited during startup with code {process.returncode}")
+            if time.monotonic() > deadline:
+                raise RuntimeError("App did not become ready within 60s")
+            try:
+                if httpx.get(f"{base_url}/", timeout=1).status_code == 200:
+                    break
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.01)
+
+        ready = time.perf_counter() - started
+
+        request_started = time.perf_counter()
+        response = httpx.get(f"{base_url}/users/me", headers={"Authorization": f"Bearer {token}"}, timeout=10)
+        first_request = time.perf_counter() - request_started
+        response.raise_for_status()
+
+        phases = {
+            name: float(value)
+            for name, value in PHASE.findall(httpx.get(f"{base_url}/metrics", timeout=5).text)
+        }
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+    return {"ready_s": ready, "first_request_ms": first_request * 1000, "phases": phases}
+
+
+def summarize(runs: list) -> dict:
+    phases = sorted({name for run in runs for name in run["phases"]})
+    return {
+        "ready_s": round(statistics.median(run["ready_s"] for run in runs), 3),
+        "first_request_ms": round(statistics.median(run["first_request_ms"] for run in runs), 1),
+        "phases_s": {
+            name: round(statistics.median(run["phases"].get(name, 0) for run in runs), 3)
+            for name in phases
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    token = seed()
+    env = {
+        "LOG_LEVEL": "WARNING",
+        "QUESTION_POOL_PREWARM_ROLES": "",
+        "LLM_WARMUP": "false",
+    }
+
+    results = {}
+    for label, warm in (("warm_database", "true"), ("cold_database", "false")):
+        runs = [cold_start({**env, "STARTUP_WARM_DATABASE": warm}, token) for _ in range(args.runs)]
+        results[label] = summarize(runs)
+
+    print(json.dumps({"runs": args.runs, **results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Check that GET /interview/history issues a constant number of SQL
+statements however large the page is (no N+1 over answers).
+
+Seeds a throwaway SQLite database with one user and `--interviews`
+interviews, requests the history at growing `limit` values, and counts
+the statements each request executes. Exits non-zero if the count
+changes with the page size.
+
+    python -m benchmarks.check_history_queries --interviews 60
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+os.environ.setdefault(
+    "DATABASE_URL",
+    f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='history-check-'), 'history.db')}",
+)
+os.environ.setdefault("QUESTION_POOL_PREWARM_ROLES", "")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.auth.auth_utils import create_access_token  # noqa: E402
+from app.db.database import SessionLocal, async_engine, engine  # noqa: E402
+from app.db.migrate import upgrade_database  # noqa: E402
+from app.db.models import Interview, QuestionAnswer, User  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+def seed(interviews: int, answers: int) -> int:
+    upgrade_database()
+    db = SessionLocal()
+    try:
+        user = User(name="History", email=f"history-{os.getpid()}@example.com", password_hash="x")
+        db.add(user)
+        db.flush()
+
+        for i in range(interviews):
+            interview = Interview(role="Backend Developer", level="Mid", score={"overall_score": 6.5}, user_id=user.id)
+            db.add(interview)
+            db.flush()
+            for j in range(answers):
+                db.add(QuestionAnswer(
+                    interview_id=interview.id,
+                    question=f"Question {j}",
+                    answer=f"Answer {i}-{j}",
+                    analysis={"scores": {"clarity": 6}},
+                    feedback={"verdict": "Hire"},
+                ))
+
+        db.commit()
+        return user.id
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interviews", type=int, default=60)
+    parser.add_argument("--answers", type=int, default=5)
+    parser.add_argument("--limits", default="1,5,20,50")
+    args = parser.parse_args()
+
+    user_id = seed(args.interviews, args.answers)
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(user_id)})}"}
+
+    statements = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    # Routes use the async engine; scripts and jobs the sync one
+    for bind in (engine, async_engine.sync_engine):
+        event.listen(bind, "before_cursor_execute", _count)
+
+    results = []
+
+    with TestClient(app) as client:
+        for limit in [int(x) for x in args.limits.split(",")]:
+            statements.clear()
+            response = client.get("/interview/history", params={"limit": limit}, headers=headers)
+            response.raise_for_status()
+            body = response.json()
+
+            results.append({
+                "limit": limit,
+                "returned": len(body["interviews"]),
+                "total": body["total"],
+                "queries": len(statements),
+            })
+
+    constant = len({r["queries"] for r in results}) == 1
+    correct_total = all(r["total"] == args.interviews for r in results)
+
+    print(json.dumps({"constant_query_count": constant, "correct_total": correct_total, "runs": results}, indent=2))
+
+    if not (constant and correct_total):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Check read-replica routing with two local SQLite databases: a primary
+and a replica that only changes when this script "replicates" (copies
+the primary over it with SQLite's backup API), so it lags on purpose.
+
+Registers a user, saves an interview on the primary, and checks that
+history and analytics:
+
+- come from the primary while the user is inside the read-your-writes
+  window (the new interview is visible),
+- come from the stale replica once the window has passed,
+- show the interview again after the replica catches up.
+
+/users/me must work for a user the replica has not seen yet. Exits
+non-zero if any step reads the wrong database.
+
+    python -m benchmarks.check_replica_routing --window 1
+"""
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+import time
+
+_directory = tempfile.mkdtemp(prefix="replica-check-")
+PRIMARY = os.path.join(_directory, "primary.db")
+REPLICA = os.path.join(_directory, "replica.db")
+
+os.environ.update({
+    "DATABASE_URL": f"sqlite:///{PRIMARY}",
+    "ASYNC_DATABASE_URL": "",
+    "DATABASE_REPLICA_URLS": f"sqlite:///{REPLICA}",
+    "QUESTION_POOL_PREWARM_ROLES": "",
+    "RATE_LIMIT_ENABLED": "false",
+    "LLM_WARMUP": "false",
+})
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.api.schemas import AnswerInput  # noqa: E402
+from app.api.services.persistence_service import save_interview  # noqa: E402
+from app.db.database import SessionLocal  # noqa: E402
+from app.db.migrate import upgrade_database  # noqa: E402
+from app.db.replicas import recent_writes  # noqa: E402
+from app.main import app  # noqa: E402
+
+ANALYSIS = {"scores": {"clarity": 7, "communication": 6, "confidence": 7, "structure": 5, "english": 8}}
+FEEDBACK = {"verbal_feedback": "Solid answer.", "verdict": "Hire"}
+REPLICA_READS = re.compile(r'^db_read_sessions_total\{target="replica"\} (\S+)$', re.MULTILINE)
+
+
+def replicate():
+    source = sqlite3.connect(PRIMARY)
+    target = sqlite3.connect(REPLICA)
+    try:
+        source.backup(target)
+    finally:
+        source.close()
+        target.close()
+
+
+def save(user_id: int) -> int:
+    db = SessionLocal()
+    try:
+        items = [AnswerInput(question="Question 1", answer="An answer.", role="Backend Developer", experience_level="Mid")]
+        return save_interview(db, user_id, items, [(ANALYSIS, FEEDBACK)])["id"]
+    finally:
+        db.close()
+
+
+def replica_reads(client) -> float:
+    match = REPLICA_READS.search(client.get("/metrics").text)
+    return float(match.group(1)) if match else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--window", type=float, default=1, help="read-your-writes window in seconds")
+    args = parser.parse_args()
+
+    recent_writes.window = args.window
+    upgrade_database()
+    replicate()
+
+    steps = []
+
+    def check(name: str, expected, actual):
+        steps.append({"step": name, "expected": expected, "actual": actual, "ok": expected == actual})
+
+    with TestClient(app) as client:
+        response = client.post("/auth/register", json={"name": "Replica", "email": "replica@example.com", "password": "pw"})
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        check("me before the user is replicated", 200, client.get("/users/me", headers=headers).status_code)
+
+        user_id = client.get("/users/me", headers=headers).json()["id"]
+        interview_id = save(user_id)
+
+        before = replica_reads(client)
+        check("history right after saving (primary)", 1, client.get("/interview/history", headers=headers).json()["total"])
+        check("analytics right after saving (primary)", 1, client.get("/interview/analytics", headers=headers).json()["total_interviews"])
+        check("single interview right after saving (primary)", 200, client.get(f"/interview/{interview_id}/analytics", headers=headers).status_code)
+        check("no reads sent to the replica inside the window", before, replica_reads(client))
+
+        time.sleep(args.window + 0.2)
+
+        before = replica_reads(client)
+        check("history after the window (stale replica)", 0, client.get("/interview/history", headers=headers).json()["total"])
+        check("analytics after the window (stale replica)", 0, client.get("/interview/analytics", headers=headers).json()["total_interviews"])
+        check("single interview after the window (stale replica)", 404, client.get(f"/interview/{interview_id}/analytics", headers=headers).status_code)
+        check("reads sent to the replica after the window", True, replica_reads(client) > before)
+
+        replicate()
+
+        check("history once replicated", 1, client.get("/interview/history", headers=headers).json()["total"])
+        check("analytics once replicated", 1, client.get("/interview/analytics", headers=headers).json()["total_interviews"])
+        check("single interview once replicated", 200, client.get(f"/interview/{interview_id}/analytics", headers=headers).status_code)
+
+    ok = all(step["ok"] for step in steps)
+    print(json.dumps({"routing_ok": ok, "primary": PRIMARY, "replica": REPLICA, "steps": steps}, indent=2))
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Check that saving an evaluated interview issues a constant number of
+SQL statements however many answers it has.
+
+Saves interviews of growing size into a throwaway SQLite database
+(DATABASE_URL to use another), once for a new user and once more for
+the same user and questions (so the rollups are updated rather than
+created), and counts the statements each save executes. Exits non-zero
+if the count changes with the number of answers.
+
+    python -m benchmarks.check_save_queries --sizes 1,5,20
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault(
+    "DATABASE_URL",
+    f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='save-check-'), 'save.db')}",
+)
+
+from sqlalchemy import event  # noqa: E402
+
+from app.api.schemas import AnswerInput  # noqa: E402
+from app.api.services.persistence_service import save_interview  # noqa: E402
+from app.db.database import SessionLocal, engine  # noqa: E402
+from app.db.migrate import upgrade_database  # noqa: E402
+from app.db.models import QuestionAnswer, User  # noqa: E402
+
+ANALYSIS = {"scores": {"clarity": 7, "communication": 6, "confidence": 7, "structure": 5, "english": 8}}
+FEEDBACK = {"verbal_feedback": "Solid answer.", "verdict": "Hire"}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1,5,20")
+    args = parser.parse_args()
+
+    upgrade_database()
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    results = []
+    db = SessionLocal()
+
+    try:
+        for size in (int(x) for x in args.sizes.split(",")):
+            user = User(name="Save", email=f"save-{size}-{time.time_ns()}@example.com", password_hash="x")
+            db.add(user)
+            db.commit()
+
+            items = [
+                AnswerInput(question=f"Question {i}", answer="An answer.", role="Backend Developer", experience_level="Mid")
+                for i in range(size)
+            ]
+            pairs = [(ANALYSIS, FEEDBACK)] * size
+
+            row = {"answers": size}
+            for run in ("first", "repeat"):
+                statements.clear()
+                payload = save_interview(db, user.id, items, pairs)
+                row[f"{run}_queries"] = len(statements)
+
+            row["saved_answers"] = db.query(QuestionAnswer).filter(QuestionAnswer.interview_id == payload["id"]).count()
+            row["returned_answers"] = len(payload["responses"])
+            results.append(row)
+    finally:
+        db.close()
+
+    constant = all(
+        len({r[key] for r in results}) == 1
+        for key in ("first_queries", "repeat_queries")
+    )
+    complete = all(r["saved_answers"] == r["returned_answers"] == r["answers"] for r in results)
+
+    print(json.dumps({"constant_query_count": constant, "answers_saved": complete, "runs": results}, indent=2))
+
+    if not (constant and complete):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+"""
+Local OpenAI-compatible stand-in for the model backend.
+
+Serves /v1/chat/completions (plain and streamed) with canned outputs
+picked by recognizing the system prompt of each task, plus simulated
+latency, generation speed and error rate, so the whole evaluation
+pipeline can be benchmarked and load-tested offline.
+
+    python -m benchmarks.fake_llm_server --port 8765 --latency 0.3 --error-rate 0.02
+    LLM_PROVIDERS=local uvicorn app.main:app
+
+GET /stats returns request counts per task; POST /stats/reset clears them.
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app.ai.prompts import (
+    ANALYSIS_SYSTEM_PROMPT,
+    FEEDBACK_SYSTEM_PROMPT,
+    FUSED_SYSTEM_PROMPT,
+    BATCH_SYSTEM_PROMPT,
+    QUESTION_SYSTEM_PROMPT,
+)
+
+TASKS = {
+    ANALYSIS_SYSTEM_PROMPT: "analysis",
+    FEEDBACK_SYSTEM_PROMPT: "feedback",
+    FUSED_SYSTEM_PROMPT: "fused",
+    BATCH_SYSTEM_PROMPT: "batch",
+    QUESTION_SYSTEM_PROMPT: "question",
+}
+
+ANALYSIS = {
+    "scores": {"clarity": 7, "communication": 6, "confidence": 7, "structure": 5, "english": 8},
+    "strengths": "Clear opening and relevant example.",
+    "improvements": "State the result explicitly and keep the structure tighter.",
+    "suggested_rewrite": "In my last project I reduced p95 latency by 40% by adding a read-through cache.",
+}
+
+FEEDBACK = {
+    "verbal_feedback": "Solid answer with a relevant example. The outcome is implied rather than stated.",
+    "key_issues": ["No measurable result", "Loose structure"],
+    "actionable_tips": ["Use situation, action, result", "Quantify the impact"],
+    "ideal_answer": "I noticed slow reads, added a cache with explicit invalidation, and cut latency by 40%.",
+    "verdict": "Hire",
+}
+
+QUESTIONS = [
+    "How would you design a rate limiter for a multi-region API?",
+    "Explain how a database index can make writes slower.",
+    "How do you find the cause of a memory leak in production?",
+    "What trade-offs do you weigh when choosing between a queue and direct calls?",
+    "How would you roll out a schema change with zero downtime?",
+]
+
+DEFAULT_OUTPUTS = {
+    "analysis": [ANALYSIS],
+    "feedback": [FEEDBACK],
+    "fused": [{"analysis": ANALYSIS, "feedback": FEEDBACK}],
+    "question": QUESTIONS,
+}
+
+_BATCH_INDEX = re.compile(r"^\[(\d+)\]", re.M)
+
+
+class StandInState:
+    def __init__(self, latency=0.0, jitter=0.0, tokens_per_sec=0.0, error_rate=0.0,
+                 error_status=503, trailing_text=False, outputs=None, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.tokens_per_sec = tokens_per_sec
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.trailing_text = trailing_text
+        self.outputs = {**DEFAULT_OUTPUTS, **(outputs or {})}
+
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counts = {}
+        self.errors = 0
+        self.questions = 0
+
+    def count(self, task: str):
+        with self.lock:
+            self.counts[task] = self.counts.get(task, 0) + 1
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                "requests": dict(self.counts),
+                "total": sum(self.counts.values()),
+                "errors": self.errors,
+            }
+
+    def reset(self):
+        with self.lock:
+            self.counts = {}
+            self.errors = 0
+
+    def content(self, task: str, messages: list) -> str:
+        with self.lock:
+            if task == "batch":
+                indexes = [int(i) for i in _BATCH_INDEX.findall(messages[1]["content"])]
+                results = [dict(self.random.choice(self.outputs["analysis"]), index=i) for i in indexes]
+                return json.dumps({"results": results})
+
+            if task == "question":
+                # Numbered so callers never see a repeat
+                self.questions += 1
+                return f"{self.random.choice(self.outputs['question'])} (#{self.questions})"
+
+            return json.dumps(self.random.choice(self.outputs.get(task) or self.outputs["analysis"]))
+
+
+def _task(messages: list) -> str:
+    if not messages or messages[0].get("role") != "system":
+        return "unknown"
+    return TASKS.get(messages[0]["content"], "unknown")
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    state: StandInState = None
+
+    def log_message(self, *args):
+        pass
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _chunk(self, text: str):
+        data = text.encode()
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def do_GET(self):
+        if self.path == "/stats":
+            return self._send_json(200, self.state.stats())
+        self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        state = self.state
+
+        if self.path == "/stats/reset":
+            state.reset()
+            return self._send_json(200, {"ok": True})
+
+        messages = body.get("messages") or []
+        task = _task(messages)
+        state.count(task)
+
+        time.sleep(max(0.0, state.latency + state.random.uniform(-state.jitter, state.jitter)))
+
+        if state.random.random() < state.error_rate:
+            with state.lock:
+                state.errors += 1
+            return self._send_json(state.error_status, {"error": "simulated failure"})
+
+        content = state.content(task, messages)
+        if state.trailing_text and content.startswith("{"):
+            content += "\n\nLet me know if you need anything else!" * 5
+
+        # Honour max_tokens so truncation and continuation can be exercised
+        max_tokens = int(body.get("max_tokens") or 10 ** 6)
+        finish_reason = "stop"
+        if len(content) // 4 > max_tokens:
+            content = content[:max_tokens * 4]
+            finish_reason = "length"
+
+        if not body.get("stream"):
+            return self._send_json(200, {
+                "choices": [{"message": {"role": "assistant", "content": content}, "finish_reason": finish_reason}],
+                "usage": {
+                    "prompt_tokens": sum(len(m.get("content") or "") for m in messages) // 4,
+                    "completion_tokens": len(content) // 4,
+                },
+            })
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        # ~4 characters per token
+        pause = 4 / state.tokens_per_sec if state.tokens_per_sec else 0
+
+        try:
+            for i in range(0, len(content), 4):
+                last = i + 4 >= len(content)
+                event = {"choices": [{"delta": {"content": content[i:i + 4]}, "finish_reason": finish_reason if last else None}]}
+                self._chunk(f"data: {json.dumps(event)}\n\n")
+                if pause:
+                    time.sleep(pause)
+
+            self._chunk("data: [DONE]\n\n")
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # Client stopped reading, as the JSON extractor does once the object closes
+            pass
+
+
+def start_server(host: str = "127.0.0.1", port: int = 8765, **options) -> ThreadingHTTPServer:
+    """
+    Start the stand-in on a daemon thread and return the server.
+    Call `.shutdown()` to stop it; `.state` holds the counters.
+    """
+    state = StandInState(**options)
+    handler = type("StandInHandler", (Handler,), {"state": state})
+
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.state = state
+
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds before the first byte")
+    parser.add_argument("--jitter", type=float, default=0.0, help="+/- seconds added to the latency")
+    parser.add_argument("--tokens-per-sec", type=float, default=0.0, help="streaming speed, 0 for no pacing")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--trailing-text", action="store_true", help="append chatter after JSON outputs")
+    parser.add_argument("--outputs", help="JSON file of canned outputs per task: {\"analysis\": [...], ...}")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    outputs = None
+    if args.outputs:
+        with open(args.outputs) as f:
+            outputs = json.load(f)
+
+    server = start_server(
+        args.host,
+        args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        tokens_per_sec=args.tokens_per_sec,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        trailing_text=args.trailing_text,
+        outputs=outputs,
+        seed=args.seed,
+    )
+
+    print(f"Stand-in model server on http://{args.host}:{args.port}/v1/chat/completions")
+
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,416 @@
+"""
+End-to-end load test.
+
+Boots the API with uvicorn against a fresh local database and the
+stand-in model server, registers a set of users, then drives a weighted
+mix of routes from concurrent virtual users. Reports p50/p95/p99
+latency, throughput and error rate per route as JSON, so runs can be
+compared across commits.
+
+    python -m benchmarks.loadtest --users 20 --duration 60 --output run.json
+    python -m benchmarks.loadtest --mix "evaluate=1" --answers 1-20 --model-latency 1.5
+
+Compare two runs:
+
+    python -m benchmarks.loadtest --compare before.json after.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from benchmarks.fake_llm_server import start_server
+
+DEFAULT_MIX = "login=5,next-question=30,evaluate=15,history=30,analytics=20"
+
+ROLES = ["Backend Developer", "Frontend Developer", "Software Developer"]
+LEVELS = ["Junior", "Mid", "Senior"]
+
+ANSWERS = [
+    "In my last project the checkout API was slow, so I profiled it, added an index on orders and "
+    "cached the product lookups. As a result p95 latency dropped from 800ms to 200ms.",
+    "I think normalization is basically about, like, splitting tables so data is not duplicated.",
+    "First I would reproduce the issue, then check the logs and metrics, and finally add a test.",
+    "We used a token bucket per API key in Redis, which allowed short bursts but kept the average rate.",
+    "Not sure, maybe caching? It depends on the case.",
+]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _percentile(sorted_values: list, pct: float):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return round(sorted_values[index], 4)
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except Exception:
+        return None
+
+
+def parse_mix(spec: str) -> dict:
+    mix = {}
+    for entry in spec.split(","):
+        name, _, weight = entry.strip().partition("=")
+        if name:
+            mix[name] = float(weight or 1)
+    return mix
+
+
+def parse_range(spec: str) -> tuple:
+    low, _, high = spec.partition("-")
+    return int(low), int(high or low)
+
+
+# ---------------- SERVER ----------------
+
+def boot_app(port: int, env: dict, workers: int, target: str = "app.main:app") -> subprocess.Popen:
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", target,
+            "--host", "127.0.0.1",
+            "--port", str(port),
+            "--workers", str(workers),
+            "--log-level", "warning",
+            "--no-access-log",
+        ],
+        env={**os.environ, **env},
+    )
+
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"App exited during startup with code {process.returncode}")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/", timeout=1).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+
+    process.terminate()
+    raise RuntimeError("App did not become ready within 60s")
+
+
+# ---------------- WORKLOAD ----------------
+
+class Recorder:
+    def __init__(self):
+        self.latencies = {}
+        self.errors = {}
+        self.statuses = {}
+
+    def record(self, route: str, seconds: float, status):
+        self.latencies.setdefault(route, []).append(seconds)
+        key = str(status)
+        self.statuses.setdefault(route, {}).setdefault(key, 0)
+        self.statuses[route][key] += 1
+        if not isinstance(status, int) or status >= 400:
+            self.errors[route] = self.errors.get(route, 0) + 1
+
+    def report(self, elapsed: float) -> dict:
+        routes = {}
+        for route, values in sorted(self.latencies.items()):
+            values = sorted(values)
+            errors = self.errors.get(route, 0)
+            routes[route] = {
+                "requests": len(values),
+                "errors": errors,
+                "error_rate": round(errors / len(values), 4),
+                "throughput_rps": round(len(values) / elapsed, 2),
+                "p50_s": _percentile(values, 50),
+                "p95_s": _percentile(values, 95),
+                "p99_s": _percentile(values, 99),
+                "mean_s": round(sum(values) / len(values), 4),
+                "max_s": round(values[-1], 4),
+                "statuses": self.statuses[route],
+            }
+
+        total = sum(r["requests"] for r in routes.values())
+        errors = sum(r["errors"] for r in routes.values())
+        return {
+            "routes": routes,
+            "total": {
+                "requests": total,
+                "errors": errors,
+                "error_rate": round(errors / total, 4) if total else 0,
+                "throughput_rps": round(total / elapsed, 2),
+            },
+        }
+
+
+class VirtualUser:
+    def __init__(self, client: httpx.AsyncClient, account: dict, args, recorder: Recorder, rng: random.Random):
+        self.client = client
+        self.account = account
+        self.args = args
+        self.recorder = recorder
+        self.rng = rng
+        self.history = []
+        self.role = rng.choice(ROLES)
+        self.level = rng.choice(LEVELS)
+
+    @property
+    def headers(self) -> dict:
+        return {"Authorization": f"Bearer {self.account['token']}"}
+
+    async def _request(self, route: str, method: str, path: str, **kwargs):
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, path, **kwargs)
+            status = response.status_code
+        except httpx.HTTPError as e:
+            response = None
+            status = type(e).__name__
+        self.recorder.record(route, time.perf_counter() - start, status)
+        return response
+
+    async def login(self):
+        response = await self._request(
+            "login", "POST", "/auth/login",
+            json={"email": self.account["email"], "password": self.account["password"]},
+        )
+        if response is not None and response.status_code == 200:
+            self.account["token"] = response.json()["access_token"]
+
+    async def next_question(self):
+        response = await self._request(
+            "next-question", "POST", "/interview/next-question",
+            headers=self.headers,
+            json={"role": self.role, "experience_level": self.level, "history": self.history[-10:]},
+        )
+        if response is not None and response.status_code == 200:
+            self.history.append({"question": response.json()["question"], "answer": self.rng.choice(ANSWERS)})
+
+    async def evaluate(self):
+        low, high = self.args.answers
+        count = self.rng.randint(low, high)
+        responses = [
+            {
+                "question": f"Question {i}: explain a trade-off you made in {self.role.lower()} work.",
+                "answer": self.rng.choice(ANSWERS) + f" ({self.rng.random():.6f})",
+                "role": self.role,
+                "experience_level": self.level,
+            }
+            for i in range(count)
+        ]
+        await self._request(
+            "evaluate", "POST", "/interview/evaluate",
+            headers=self.headers,
+            json={"responses": responses},
+        )
+
+    async def history_page(self):
+        await self._request("history", "GET", "/interview/history", headers=self.headers)
+
+    async def analytics(self):
+        await self._request("analytics", "GET", "/interview/analytics", headers=self.headers)
+
+    async def run(self, deadline: float, mix: dict):
+        actions = {
+            "login": self.login,
+            "next-question": self.next_question,
+            "evaluate": self.evaluate,
+            "history": self.history_page,
+            "analytics": self.analytics,
+        }
+        names = list(mix)
+        weights = [mix[name] for name in names]
+
+        while time.monotonic() < deadline:
+            await actions[self.rng.choices(names, weights)[0]]()
+            if self.args.think_time:
+                await asyncio.sleep(self.rng.uniform(0, self.args.think_time))
+
+
+async def seed_accounts(client: httpx.AsyncClient, count: int, interviews: int, rng: random.Random) -> list:
+    accounts = []
+
+    for i in range(count):
+        account = {"email": f"load{i}-{rng.randrange(10 ** 9)}@example.com", "password": "load-test-password"}
+        response = await client.post(
+            "/auth/register",
+            json={"name": f"Load {i}", "email": account["email"], "password": account["password"]},
+        )
+        response.raise_for_status()
+        account["token"] = response.json()["access_token"]
+        accounts.append(account)
+
+    # A few saved interviews per user so history and analytics have data
+    for account in accounts:
+        for _ in range(interviews):
+            await client.post(
+                "/interview/evaluate",
+                headers={"Authorization": f"Bearer {account['token']}"},
+                json={"responses": [
+                    {"question": f"Seed question {j}", "answer": rng.choice(ANSWERS),
+                     "role": rng.choice(ROLES), "experience_level": rng.choice(LEVELS)}
+                    for j in range(3)
+                ]},
+            )
+
+    return accounts
+
+
+async def drive(base_url: str, args) -> dict:
+    rng = random.Random(args.seed)
+    mix = parse_mix(args.mix)
+    recorder = Recorder()
+
+    limits = httpx.Limits(max_connections=args.users * 2, max_keepalive_connections=args.users * 2)
+    async with httpx.AsyncClient(base_url=base_url, timeout=args.timeout, limits=limits) as client:
+        accounts = await seed_accounts(client, args.users, args.seed_interviews, rng)
+
+        users = [
+            VirtualUser(client, account, args, recorder, random.Random(rng.random()))
+            for account in accounts
+        ]
+
+        start = time.monotonic()
+        deadline = start + args.duration
+        await asyncio.gather(*(user.run(deadline, mix) for user in users))
+        elapsed = time.monotonic() - start
+
+    report = recorder.report(elapsed)
+    report["elapsed_s"] = round(elapsed, 2)
+    return report
+
+
+# ---------------- COMPARE ----------------
+
+def compare(before_path: str, after_path: str) -> dict:
+    with open(before_path) as f:
+        before = json.load(f)
+    with open(after_path) as f:
+        after = json.load(f)
+
+    routes = {}
+    for route in sorted(set(before["routes"]) | set(after["routes"])):
+        old, new = before["routes"].get(route), after["routes"].get(route)
+        if not old or not new:
+            continue
+        routes[route] = {
+            key: {"before": old[key], "after": new[key], "change_pct": _change(old[key], new[key])}
+            for key in ("p50_s", "p95_s", "p99_s", "throughput_rps", "error_rate")
+        }
+
+    return {
+        "before": before.get("config", {}).get("commit"),
+        "after": after.get("config", {}).get("commit"),
+        "routes": routes,
+    }
+
+
+def _change(old, new):
+    if not old or new is None:
+        return None
+    return round((new - old) / old * 100, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=10, help="concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=30, help="seconds of load after seeding")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="route weights, e.g. " + DEFAULT_MIX)
+    parser.add_argument("--answers", type=parse_range, default=(1, 20), help="answers per evaluate, e.g. 1-20")
+    parser.add_argument("--think-time", type=float, default=0.0, help="max random pause between requests")
+    parser.add_argument("--seed-interviews", type=int, default=3, help="interviews saved per user before the run")
+    parser.add_argument("--timeout", type=float, default=120)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--database-url", help="defaults to a fresh SQLite file")
+    parser.add_argument("--model-latency", type=float, default=0.5)
+    parser.add_argument("--model-jitter", type=float, default=0.2)
+    parser.add_argument("--model-tokens-per-sec", type=float, default=0.0)
+    parser.add_argument("--model-error-rate", type=float, default=0.0)
+    parser.add_argument("--cache", action="store_true", help="keep the LLM response cache enabled")
+    parser.add_argument("--app-env", action="append", default=[], help="extra KEY=VALUE for the app")
+    parser.add_argument("--output", help="also write the JSON report here")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="diff two reports and exit")
+    args = parser.parse_args()
+
+    if args.compare:
+        print(json.dumps(compare(*args.compare), indent=2))
+        return
+
+    workdir = tempfile.mkdtemp(prefix="loadtest-")
+    database_url = args.database_url or f"sqlite:///{os.path.join(workdir, 'loadtest.db')}"
+
+    model_port = _free_port()
+    model_server = start_server(
+        port=model_port,
+        latency=args.model_latency,
+        jitter=args.model_jitter,
+        tokens_per_sec=args.model_tokens_per_sec,
+        error_rate=args.model_error_rate,
+        seed=args.seed,
+    )
+
+    env = {
+        "DATABASE_URL": database_url,
+        "DB_AUTO_MIGRATE": "true",
+        "LLM_PROVIDERS": "local",
+        "LOCAL_LLM_URL": f"http://127.0.0.1:{model_port}/v1/chat/completions",
+        "RATE_LIMIT_ENABLED": "false",
+        "LLM_CACHE_ENABLED": "true" if args.cache else "false",
+        "LLM_CACHE_DB_PATH": "",
+        "QUESTION_POOL_PREWARM_ROLES": "",
+        "LOG_LEVEL": "WARNING",
+    }
+    for entry in args.app_env:
+        key, _, value = entry.partition("=")
+        env[key] = value
+
+    port = _free_port()
+    app_process = boot_app(port, env, args.workers)
+
+    try:
+        report = asyncio.run(drive(f"http://127.0.0.1:{port}", args))
+    finally:
+        app_process.terminate()
+        app_process.wait(timeout=30)
+        model_server.shutdown()
+
+    report["model_requests"] = model_server.state.stats()
+    report["config"] = {
+        "commit": _git_commit(),
+        "users": args.users,
+        "duration_s": args.duration,
+        "mix": parse_mix(args.mix),
+        "answers": list(args.answers),
+        "workers": args.workers,
+        "database": database_url.split(":", 1)[0],
+        "model_latency_s": args.model_latency,
+        "model_error_rate": args.model_error_rate,
+        "cache": args.cache,
+        "app_env": args.app_env,
+    }
+
+    output = json.dumps(report, indent=2)
+    print(output)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Baseline: the schema previously created by Base.metadata.create_all
+
+Databases created by create_all before migrations existed already have
+some or all of these tables, so only the missing tables and indexes are
+created; on an empty database this builds the full baseline.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _tables():
+    metadata = sa.MetaData()
+
+    users = sa.Table(
+        "users", metadata,
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("name", sa.String, nullable=False),
+        sa.Column("email", sa.String, nullable=False),
+        sa.Column("password_hash", sa.String, nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    sa.Index("ix_users_id", users.c.id)
+    sa.Index("ix_users_email", users.c.email, unique=True)
+
+    interviews = sa.Table(
+        "interviews", metadata,
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("role", sa.String, nullable=False),
+        sa.Column("level", sa.String, nullable=False),
+        sa.Column("score", sa.JSON),
+        sa.Column("user_id", sa.Integer, sa.ForeignKey("users.id")),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    sa.Index("ix_interviews_id", interviews.c.id)
+    sa.Index(
+        "ix_interviews_user_created_id",
+        interviews.c.user_id, interviews.c.created_at.desc(), interviews.c.id.desc(),
+    )
+
+    question_answers = sa.Table(
+        "question_answers", metadata,
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("interview_id", sa.Integer, sa.ForeignKey("interviews.id")),
+        sa.Column("question", sa.Text, nullable=False),
+        sa.Column("answer", sa.Text, nullable=False),
+        sa.Column("analysis", sa.JSON),
+        sa.Column("feedback", sa.JSON),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    sa.Index("ix_question_answers_id", question_answers.c.id)
+
+    sa.Table(
+        "user_analytics", metadata,
+        sa.Column("user_id", sa.Integer, sa.ForeignKey("users.id"), primary_key=True),
+        sa.Column("total_interviews", sa.Integer, nullable=False),
+        sa.Column("scored_interviews", sa.Integer, nullable=False),
+        sa.Column("score_sum", sa.Float, nullable=False),
+        sa.Column("score_min", sa.Float),
+        sa.Column("score_max", sa.Float),
+    )
+
+    sa.Table(
+        "user_role_analytics", metadata,
+        sa.Column("user_id", sa.Integer, sa.ForeignKey("users.id"), primary_key=True),
+        sa.Column("role", sa.String, primary_key=True),
+        sa.Column("attempts", sa.Integer, nullable=False),
+        sa.Column("score_sum", sa.Float, nullable=False),
+        sa.Column("score_min", sa.Float),
+        sa.Column("score_max", sa.Float),
+    )
+
+    sa.Table(
+        "user_question_analytics", metadata,
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("user_id", sa.Integer, sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("question", sa.Text, nullable=False),
+        sa.Column("attempts", sa.Integer, nullable=False),
+        sa.Column("feedback_samples", sa.JSON, nullable=False),
+        sa.Column("last_seen_at", sa.DateTime(timezone=True)),
+        sa.UniqueConstraint("user_id", "question", name="uq_user_question_analytics"),
+    )
+
+    return metadata
+
+
+def upgrade():
+    bind = op.get_bind()
+    metadata = _tables()
+
+    # checkfirst: leave tables and indexes that create_all already made
+    metadata.create_all(bind=bind, checkfirst=True)
+
+    existing = sa.inspect(bind)
+    for table in metadata.sorted_tables:
+        names = {index["name"] for index in existing.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in names:
+                index.create(bind=bind)
+
+
+def downgrade():
+    _tables().drop_all(bind=op.get_bind())
@@ -0,0 +1,81 @@
+"""Typed score columns, JSONB on PostgreSQL, indexes for history and analytics
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+SCORE_COLUMNS = [
+    "overall_score",
+    "clarity_score",
+    "communication_score",
+    "confidence_score",
+    "structure_score",
+    "english_score",
+]
+
+JSON_COLUMNS = [
+    ("interviews", "score", True),
+    ("question_answers", "analysis", True),
+    ("question_answers", "feedback", True),
+    ("user_question_analytics", "feedback_samples", False),
+]
+
+
+def upgrade():
+    with op.batch_alter_table("interviews") as batch:
+        for name in SCORE_COLUMNS:
+            batch.add_column(sa.Column(name, sa.Float))
+        batch.add_column(sa.Column("performance_level", sa.String))
+
+    if op.get_bind().dialect.name == "postgresql":
+        for table, column, nullable in JSON_COLUMNS:
+            op.alter_column(
+                table, column,
+                type_=JSONB(),
+                existing_type=sa.JSON(),
+                existing_nullable=nullable,
+                postgresql_using=f"{column}::jsonb",
+            )
+
+    op.create_index(
+        "ix_interviews_user_role_score", "interviews",
+        ["user_id", "role", "overall_score"],
+    )
+    op.create_index(
+        "ix_question_answers_interview_id", "question_answers",
+        ["interview_id", "id"],
+    )
+    op.create_index(
+        "ix_user_question_analytics_user_seen", "user_question_analytics",
+        ["user_id", sa.text("last_seen_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_user_question_analytics_user_seen", table_name="user_question_analytics")
+    op.drop_index("ix_question_answers_interview_id", table_name="question_answers")
+    op.drop_index("ix_interviews_user_role_score", table_name="interviews")
+
+    if op.get_bind().dialect.name == "postgresql":
+        for table, column, nullable in JSON_COLUMNS:
+            op.alter_column(
+                table, column,
+                type_=sa.JSON(),
+                existing_type=JSONB(),
+                existing_nullable=nullable,
+                postgresql_using=f"{column}::json",
+            )
+
+    with op.batch_alter_table("interviews") as batch:
+        batch.drop_column("performance_level")
+        for name in reversed(SCORE_COLUMNS):
+            batch.drop_column(name)
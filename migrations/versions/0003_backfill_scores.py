@@ -0,0 +1,131 @@
+"""Normalize legacy score shapes and fill the typed score columns
+
+Early interviews stored `score` as a bare number (usually 0) instead of
+the scoring dict. Those become a dict with the same overall score, and
+every row gets its typed columns filled from the JSON. Runs in batches
+keyed on id so large tables are not read in one go.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+# Frozen copies of scoring_service at the time of this migration
+CATEGORIES = ["clarity", "communication", "confidence", "structure", "english"]
+
+
+def _normalize(score):
+    if isinstance(score, bool) or not isinstance(score, (int, float, dict)):
+        return None
+
+    if isinstance(score, dict):
+        return score
+
+    overall = float(score)
+
+    if overall <= 0:
+        # What scoring returns when nothing could be scored
+        return {
+            "average_scores": {cat: 0.0 for cat in CATEGORIES},
+            "overall_score": 0.0,
+            "performance_level": "Insufficient Data",
+            "summary": "Not enough valid responses were available to generate a reliable score.",
+        }
+
+    if overall >= 8.5:
+        level = "Excellent"
+    elif overall >= 7:
+        level = "Good"
+    elif overall >= 5:
+        level = "Average"
+    else:
+        level = "Needs Improvement"
+
+    # Only the overall score was kept; category averages are unknown
+    return {
+        "average_scores": {},
+        "overall_score": overall,
+        "performance_level": level,
+        "summary": f"Overall performance was {level.lower()}.",
+    }
+
+
+interviews = sa.table(
+    "interviews",
+    sa.column("id", sa.Integer),
+    sa.column("score", sa.JSON().with_variant(JSONB(), "postgresql")),
+    sa.column("overall_score", sa.Float),
+    *(sa.column(f"{cat}_score", sa.Float) for cat in CATEGORIES),
+    sa.column("performance_level", sa.String),
+)
+
+
+def upgrade():
+    bind = op.get_bind()
+    last_id = 0
+
+    fill = (
+        interviews.update()
+        .where(interviews.c.id == sa.bindparam("_id"))
+        .values({
+            name: sa.bindparam(name)
+            for name in ["overall_score", "performance_level", *(f"{cat}_score" for cat in CATEGORIES)]
+        })
+    )
+    reshape = (
+        interviews.update()
+        .where(interviews.c.id == sa.bindparam("_id"))
+        .values(score=sa.bindparam("_score"))
+    )
+
+    while True:
+        rows = bind.execute(
+            sa.select(interviews.c.id, interviews.c.score)
+            .where(interviews.c.id > last_id)
+            .order_by(interviews.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+
+        if not rows:
+            break
+
+        filled, reshaped = [], []
+
+        for row in rows:
+            score = _normalize(row.score)
+            if score is None:
+                continue
+
+            if score is not row.score:
+                reshaped.append({"_id": row.id, "_score": score})
+
+            averages = score.get("average_scores") or {}
+            filled.append({
+                "_id": row.id,
+                "overall_score": score.get("overall_score"),
+                "performance_level": score.get("performance_level"),
+                **{f"{cat}_score": averages.get(cat) for cat in CATEGORIES},
+            })
+
+        if reshaped:
+            bind.execute(reshape, reshaped)
+        if filled:
+            bind.execute(fill, filled)
+
+        last_id = rows[-1].id
+
+
+def downgrade():
+    # Typed columns are dropped by 0002's downgrade; the dict shape is
+    # what the application writes anyway, so it is left in place
+    pass
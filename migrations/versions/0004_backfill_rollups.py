@@ -0,0 +1,183 @@
+"""Rebuild the analytics rollups from the stored interviews
+
+The rollup tables were only filled as new interviews were saved, so
+users with older history had no rollups, or rollups that counted only
+their recent interviews, and /interview/analytics under-reported them.
+Every user's rollups are recomputed here, a batch of users at a time,
+the same way rollup_service.rebuild_rollups does.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 100
+
+# Frozen copy of rollup_service at the time of this migration
+FEEDBACK_SAMPLES = 3
+
+JSONType = sa.JSON().with_variant(JSONB(), "postgresql")
+
+interviews = sa.table(
+    "interviews",
+    sa.column("id", sa.Integer),
+    sa.column("user_id", sa.Integer),
+    sa.column("role", sa.String),
+    sa.column("overall_score", sa.Float),
+    sa.column("created_at", sa.DateTime(timezone=True)),
+)
+
+question_answers = sa.table(
+    "question_answers",
+    sa.column("id", sa.Integer),
+    sa.column("interview_id", sa.Integer),
+    sa.column("question", sa.Text),
+    sa.column("feedback", JSONType),
+)
+
+user_analytics = sa.table(
+    "user_analytics",
+    sa.column("user_id", sa.Integer),
+    sa.column("total_interviews", sa.Integer),
+    sa.column("scored_interviews", sa.Integer),
+    sa.column("score_sum", sa.Float),
+    sa.column("score_min", sa.Float),
+    sa.column("score_max", sa.Float),
+)
+
+role_analytics = sa.table(
+    "user_role_analytics",
+    sa.column("user_id", sa.Integer),
+    sa.column("role", sa.String),
+    sa.column("attempts", sa.Integer),
+    sa.column("score_sum", sa.Float),
+    sa.column("score_min", sa.Float),
+    sa.column("score_max", sa.Float),
+)
+
+question_analytics = sa.table(
+    "user_question_analytics",
+    sa.column("user_id", sa.Integer),
+    sa.column("question", sa.Text),
+    sa.column("attempts", sa.Integer),
+    sa.column("feedback_samples", JSONType),
+    sa.column("last_seen_at", sa.DateTime(timezone=True)),
+)
+
+
+def _add_score(row: dict, value: float):
+    row["score_sum"] += value
+    row["score_min"] = value if row["score_min"] is None else min(row["score_min"], value)
+    row["score_max"] = value if row["score_max"] is None else max(row["score_max"], value)
+
+
+def _rollups(user_id: int, history: list, answers: dict):
+    """
+    Fold one user's interviews, oldest first, into rollup rows.
+    """
+    user_row = {
+        "user_id": user_id, "total_interviews": 0, "scored_interviews": 0,
+        "score_sum": 0.0, "score_min": None, "score_max": None,
+    }
+    roles, questions = {}, {}
+
+    for interview in history:
+        value = interview.overall_score
+
+        user_row["total_interviews"] += 1
+        if value is not None:
+            user_row["scored_interviews"] += 1
+            _add_score(user_row, value)
+
+        role_row = roles.setdefault(interview.role, {
+            "user_id": user_id, "role": interview.role, "attempts": 0,
+            "score_sum": 0.0, "score_min": None, "score_max": None,
+        })
+        if value is not None:
+            role_row["attempts"] += 1
+            _add_score(role_row, value)
+
+        for question, feedback in answers.get(interview.id, []):
+            question_row = questions.setdefault(question, {
+                "user_id": user_id, "question": question, "attempts": 0, "feedback_samples": [],
+            })
+            question_row["attempts"] += 1
+            question_row["last_seen_at"] = interview.created_at
+            if feedback:
+                question_row["feedback_samples"] = (question_row["feedback_samples"] + [feedback])[-FEEDBACK_SAMPLES:]
+
+    return user_row, list(roles.values()), list(questions.values())
+
+
+def upgrade():
+    bind = op.get_bind()
+
+    # Rows written since the rollups were introduced cover only part of
+    # each user's history, so everything is rebuilt
+    for table in (question_analytics, role_analytics, user_analytics):
+        bind.execute(table.delete())
+
+    last_user = 0
+
+    while True:
+        user_ids = bind.execute(
+            sa.select(interviews.c.user_id)
+            .where(interviews.c.user_id > last_user)
+            .group_by(interviews.c.user_id)
+            .order_by(interviews.c.user_id)
+            .limit(BATCH_SIZE)
+        ).scalars().all()
+
+        if not user_ids:
+            break
+
+        histories = {}
+        for row in bind.execute(
+            sa.select(
+                interviews.c.id,
+                interviews.c.user_id,
+                interviews.c.role,
+                interviews.c.overall_score,
+                interviews.c.created_at,
+            )
+            .where(interviews.c.user_id.in_(user_ids))
+            .order_by(interviews.c.user_id, interviews.c.created_at, interviews.c.id)
+        ):
+            histories.setdefault(row.user_id, []).append(row)
+
+        answers = {}
+        for row in bind.execute(
+            sa.select(question_answers.c.interview_id, question_answers.c.question, question_answers.c.feedback)
+            .join(interviews, interviews.c.id == question_answers.c.interview_id)
+            .where(interviews.c.user_id.in_(user_ids))
+            .order_by(question_answers.c.interview_id, question_answers.c.id)
+        ):
+            answers.setdefault(row.interview_id, []).append((row.question, row.feedback))
+
+        users, roles, questions = [], [], []
+        for user_id in user_ids:
+            user_row, role_rows, question_rows = _rollups(user_id, histories[user_id], answers)
+            users.append(user_row)
+            roles.extend(role_rows)
+            questions.extend(question_rows)
+
+        bind.execute(user_analytics.insert(), users)
+        bind.execute(role_analytics.insert(), roles)
+        if questions:
+            bind.execute(question_analytics.insert(), questions)
+
+        last_user = user_ids[-1]
+
+
+def downgrade():
+    # The rebuilt rows are what the application maintains from here on,
+    # so they are left in place
+    pass
@@ -0,0 +1,39 @@
+"""
+Start the API with uvicorn.
+
+    python run.py
+    python run.py --port 9000 --workers 2
+    python run.py --reload
+
+HOST, PORT and WEB_CONCURRENCY set the defaults, so the same command
+works locally and on hosts that assign the port.
+"""
+import argparse
+
+import uvicorn
+
+from app.core.config import HOST, PORT, WEB_CONCURRENCY, LOG_LEVEL
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--workers", type=int, default=WEB_CONCURRENCY)
+    parser.add_argument("--reload", action="store_true", help="restart on code changes (development)")
+    args = parser.parse_args()
+
+    # Passed as an import string so workers and the reloader import the
+    # app themselves; this process never loads it
+    uvicorn.run(
+        "app.main:app",
+        host=args.host,
+        port=args.port,
+        workers=None if args.reload else args.workers,
+        reload=args.reload,
+        log_level=LOG_LEVEL.lower(),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Shared fixtures. Settings are read when app.core.config is imported,
+so the environment is pointed at a throwaway SQLite database (and away
+from model backends and the network) before any app module loads.
+
+TEST_DATABASE_URL runs the suite against another database instead,
+e.g. an empty PostgreSQL one:
+
+    TEST_DATABASE_URL=postgresql://localhost/app_test python -m pytest -q
+"""
+import os
+import tempfile
+import time
+
+_directory = tempfile.mkdtemp(prefix="app-tests-")
+
+os.environ.update({
+    "DATABASE_URL": os.getenv("TEST_DATABASE_URL") or f"sqlite:///{os.path.join(_directory, 'app.db')}",
+    "ASYNC_DATABASE_URL": "",
+    "DATABASE_REPLICA_URLS": "",
+    "LLM_CACHE_DB_PATH": "",
+    "QUESTION_POOL_PREWARM_ROLES": "",
+    "RATE_LIMIT_ENABLED": "false",
+    "LLM_WARMUP": "false",
+})
+
+import pytest  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.db.database import SessionLocal, async_engine, engine  # noqa: E402
+from app.db.migrate import upgrade_database  # noqa: E402
+from app.db.models import User  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    upgrade_database()
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def user_id(db) -> int:
+    user = User(name="Test", email=f"test-{time.time_ns()}@example.com", password_hash="x")
+    db.add(user)
+    db.commit()
+    return user.id
+
+
+@pytest.fixture
+def statements():
+    """
+    SQL statements executed on either engine while the test runs.
+    """
+    executed = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    binds = (engine, async_engine.sync_engine)
+    for bind in binds:
+        event.listen(bind, "before_cursor_execute", _record)
+
+    yield executed
+
+    for bind in binds:
+        event.remove(bind, "before_cursor_execute", _record)
@@ -0,0 +1,53 @@
+"""
+Two evaluations of the same user saved at the same time (a job next to
+a synchronous /evaluate, or a double submit) must both be stored and
+both counted in the rollups. Run against PostgreSQL (TEST_DATABASE_URL)
+this exercises its row locks, where a bad lock order deadlocks.
+"""
+import threading
+
+from app.api.schemas import AnswerInput
+from app.api.services import persistence_service
+from app.db.database import SessionLocal
+from app.db.models import UserAnalytics
+
+ANALYSIS = {"scores": {"clarity": 7, "communication": 6, "confidence": 7, "structure": 5, "english": 8}}
+FEEDBACK = {"verbal_feedback": "Solid answer.", "verdict": "Hire"}
+
+
+def test_concurrent_saves_for_one_user(db, user_id, monkeypatch):
+    # Hold each save between its interview INSERT and the rollup update
+    # until the other one gets there too (or cannot, because it waits
+    # for a lock), so the two transactions overlap
+    arrived = threading.Barrier(2)
+    record_interview = persistence_service.record_interview
+
+    def overlapping(*args, **kwargs):
+        try:
+            arrived.wait(timeout=2)
+        except threading.BrokenBarrierError:
+            pass
+        return record_interview(*args, **kwargs)
+
+    monkeypatch.setattr(persistence_service, "record_interview", overlapping)
+
+    items = [AnswerInput(question="Question 1", answer="An answer.", role="Backend Developer", experience_level="Mid")]
+    errors = []
+
+    def save():
+        session = SessionLocal()
+        try:
+            persistence_service.save_interview(session, user_id, items, [(ANALYSIS, FEEDBACK)])
+        except Exception as e:
+            errors.append(e)
+        finally:
+            session.close()
+
+    threads = [threading.Thread(target=save) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+
+    assert not errors, errors
+    assert db.get(UserAnalytics, user_id).total_interviews == 2
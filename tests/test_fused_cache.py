@@ -0,0 +1,89 @@
+"""
+The fused path caches an answer's analysis and feedback together, so it
+must only do so when both came from the model: a fallback cached here
+would be served for every identical answer until it expired.
+"""
+import json
+
+import pytest
+
+from app.ai.cache import llm_cache
+from app.ai.client import JSONReply
+from app.ai.providers import provider_pool
+from app.api.services import feedback_service, fused_service
+from app.api.services.feedback_service import DEFAULT_FEEDBACK
+
+ANALYSIS = {"scores": {"clarity": 7, "communication": 6, "confidence": 7, "structure": 5, "english": 8}}
+FEEDBACK = {
+    "verbal_feedback": "Clear and specific.",
+    "key_issues": [],
+    "actionable_tips": ["Quantify the outcome."],
+    "ideal_answer": "",
+    "verdict": "Hire",
+}
+ARGS = ("Tell me about a hard bug.", "I traced a leak to a cache.", "Backend Developer", "Mid")
+
+
+class FakeModel:
+    """
+    Stands in for complete_json: replies with `replies` in order (an
+    exception is raised instead of returned) and counts the calls.
+    """
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.calls = 0
+
+    def __call__(self, messages, max_tokens, temperature, timeout, task="default", providers=None):
+        self.calls += 1
+        reply = self.replies.pop(0) if len(self.replies) > 1 else self.replies[0]
+        if isinstance(reply, Exception):
+            raise reply
+        return JSONReply(json.dumps(reply), (providers or provider_pool.order())[0])
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    llm_cache.clear()
+    yield
+    llm_cache.clear()
+
+
+def test_fallback_feedback_is_not_cached(monkeypatch):
+    fused = FakeModel({"analysis": ANALYSIS, "feedback": {"verdict": "Hire"}})
+    feedback = FakeModel(ValueError("model returned no feedback"))
+    monkeypatch.setattr(fused_service, "complete_json", fused)
+    monkeypatch.setattr(feedback_service, "complete_json", feedback)
+
+    analysis, first = fused_service.analyze_and_feedback(*ARGS)
+    assert analysis == ANALYSIS
+    assert first["verbal_feedback"] == DEFAULT_FEEDBACK["verbal_feedback"]
+
+    # The second identical request goes back to the model
+    fused.replies = [{"analysis": ANALYSIS, "feedback": FEEDBACK}]
+    _, second = fused_service.analyze_and_feedback(*ARGS)
+
+    assert fused.calls == 2
+    assert second == FEEDBACK
+
+
+def test_model_results_are_cached(monkeypatch):
+    fused = FakeModel({"analysis": ANALYSIS, "feedback": FEEDBACK})
+    monkeypatch.setattr(fused_service, "complete_json", fused)
+
+    first = fused_service.analyze_and_feedback(*ARGS)
+    second = fused_service.analyze_and_feedback(*ARGS)
+
+    assert fused.calls == 1
+    assert first == second == (ANALYSIS, FEEDBACK)
+
+
+def test_regenerated_feedback_is_cached(monkeypatch):
+    fused = FakeModel({"analysis": ANALYSIS, "feedback": {"verdict": "Hire"}})
+    feedback = FakeModel(FEEDBACK)
+    monkeypatch.setattr(fused_service, "complete_json", fused)
+    monkeypatch.setattr(feedback_service, "complete_json", feedback)
+
+    fused_service.analyze_and_feedback(*ARGS)
+    assert fused_service.analyze_and_feedback(*ARGS) == (ANALYSIS, FEEDBACK)
+    assert (fused.calls, feedback.calls) == (1, 1)
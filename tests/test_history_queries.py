@@ -0,0 +1,84 @@
+"""
+GET /interview/history must issue the same number of statements
+whatever the page size (no N+1 over answers).
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.auth.auth_utils import create_access_token
+from app.db.models import Interview, QuestionAnswer
+from app.main import app
+
+INTERVIEWS = 30
+ANSWERS = 4
+
+
+@pytest.fixture
+def history(db, user_id) -> int:
+    for i in range(INTERVIEWS):
+        interview = Interview(role="Backend Developer", level="Mid", score={"overall_score": 6.5}, user_id=user_id)
+        db.add(interview)
+        db.flush()
+        db.add_all(
+            QuestionAnswer(
+                interview_id=interview.id,
+                question=f"Question {j}",
+                answer=f"Answer {i}-{j}",
+                analysis={"scores": {"clarity": 6}},
+                feedback={"verdict": "Hire"},
+            )
+            for j in range(ANSWERS)
+        )
+    db.commit()
+    return user_id
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+def _headers(user_id: int) -> dict:
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(user_id)})}"}
+
+
+def test_query_count_does_not_grow_with_page_size(client, history, statements):
+    counts = {}
+
+    for limit in (1, 5, 20, 50):
+        statements.clear()
+        response = client.get("/interview/history", params={"limit": limit}, headers=_headers(history))
+        assert response.status_code == 200
+
+        body = response.json()
+        assert body["total"] == INTERVIEWS
+        assert len(body["interviews"]) == min(limit, INTERVIEWS)
+        assert all(len(interview["responses"]) == ANSWERS for interview in body["interviews"])
+        counts[limit] = len(statements)
+
+    assert len(set(counts.values())) == 1, counts
+
+
+def test_cursor_pages_use_the_same_query_count(client, history, statements):
+    first = client.get("/interview/history", params={"limit": 10}, headers=_headers(history)).json()
+
+    statements.clear()
+    response = client.get(
+        "/interview/history",
+        params={"limit": 10, "cursor": first["next_cursor"]},
+        headers=_headers(history),
+    )
+    deep = len(statements)
+
+    statements.clear()
+    client.get("/interview/history", params={"limit": 10}, headers=_headers(history))
+
+    assert response.status_code == 200
+    assert deep == len(statements)
+
+
+@pytest.mark.parametrize("params", [{"limit": 0}, {"limit": -1}, {"limit": 101}, {"skip": -1}])
+def test_out_of_range_paging_is_rejected(client, history, params):
+    response = client.get("/interview/history", params=params, headers=_headers(history))
+    assert response.status_code == 422
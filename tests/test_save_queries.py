@@ -0,0 +1,42 @@
+"""
+Saving an evaluated interview must issue the same number of statements
+however many answers it has, both when the user's rollups are created
+and when they are updated.
+"""
+import time
+
+from app.api.schemas import AnswerInput
+from app.api.services.persistence_service import save_interview
+from app.db.models import QuestionAnswer, User
+
+ANALYSIS = {"scores": {"clarity": 7, "communication": 6, "confidence": 7, "structure": 5, "english": 8}}
+FEEDBACK = {"verbal_feedback": "Solid answer.", "verdict": "Hire"}
+
+
+def _answers(size: int):
+    items = [
+        AnswerInput(question=f"Question {i}", answer="An answer.", role="Backend Developer", experience_level="Mid")
+        for i in range(size)
+    ]
+    return items, [(ANALYSIS, FEEDBACK)] * size
+
+
+def test_query_count_does_not_grow_with_answers(db, statements):
+    counts = {"first": set(), "repeat": set()}
+
+    for size in (1, 5, 20):
+        user = User(name="Save", email=f"save-{size}-{time.time_ns()}@example.com", password_hash="x")
+        db.add(user)
+        db.commit()
+        items, pairs = _answers(size)
+
+        for run in ("first", "repeat"):
+            statements.clear()
+            payload = save_interview(db, user.id, items, pairs)
+            counts[run].add(len(statements))
+
+            assert len(payload["responses"]) == size
+            assert db.query(QuestionAnswer).filter(QuestionAnswer.interview_id == payload["id"]).count() == size
+
+    assert len(counts["first"]) == 1, counts
+    assert len(counts["repeat"]) == 1, counts
@@ -0,0 +1,64 @@
+"""
+Concurrent identical model calls share one upstream request, but only
+when they are pinned to the same backend order: results are cached
+under the backend that answered, so a follower must not take a reply
+from a backend it did not ask first.
+"""
+import threading
+
+import pytest
+
+from app.ai import client
+from app.ai.providers import Provider
+
+PRIMARY = Provider("primary", "http://primary.invalid/v1/chat/completions", "model-a")
+SECONDARY = Provider("secondary", "http://secondary.invalid/v1/chat/completions", "model-b")
+MESSAGES = [{"role": "user", "content": "Rate this answer."}]
+
+
+def _run_together(orders) -> int:
+    """
+    Start one coalesced call per backend order while the first is still
+    in flight; return how many upstream requests were made.
+    """
+    release = threading.Event()
+    started = threading.Semaphore(0)
+    calls = []
+
+    def upstream():
+        calls.append(1)
+        started.release()
+        release.wait(timeout=5)
+        return "{}"
+
+    def call(order):
+        client._coalesced("json", "analysis", MESSAGES, 100, 0.3, upstream, order)
+
+    threads = [threading.Thread(target=call, args=(order,)) for order in orders]
+    threads[0].start()
+    started.acquire(timeout=5)
+
+    for thread in threads[1:]:
+        thread.start()
+    # Followers join the flight or start their own before it finishes
+    for _ in orders[1:]:
+        started.acquire(timeout=0.5)
+
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    return len(calls)
+
+
+@pytest.fixture(autouse=True)
+def singleflight(monkeypatch):
+    monkeypatch.setattr(client, "LLM_SINGLEFLIGHT_ENABLED", True)
+
+
+def test_same_backend_order_is_coalesced():
+    assert _run_together([[PRIMARY, SECONDARY], [PRIMARY, SECONDARY]]) == 1
+
+
+def test_different_backend_orders_are_not_coalesced():
+    assert _run_together([[PRIMARY, SECONDARY], [SECONDARY, PRIMARY]]) == 2